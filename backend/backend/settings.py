@@ -20,6 +20,11 @@ from django.utils.translation import gettext_lazy as _
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(os.path.dirname(os.path.abspath(__file__))).parent.parent
+# Thư mục project Django (chứa manage.py, /app trong Docker). Dữ liệu sinh
+# ra lúc chạy (IDF model, cache tokenize) đặt ở đây để không phụ thuộc thư
+# mục khởi động và nằm trên volume ./backend dùng chung giữa các container
+# (BASE_DIR trong container là "/").
+PROJECT_DIR = BASE_DIR / Path(os.path.dirname(os.path.abspath(__file__))).parent.name
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -106,6 +111,29 @@ DATABASES = {
 }
 
 
+# Cache
+# 'default' giữ nguyên LocMemCache như mặc định của Django; 'tokens' lưu
+# kết quả tokenize tiếng Việt trên đĩa, dùng chung giữa các tiến trình.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'tokens': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv(
+            'TOKENIZER_CACHE_DIR',
+            str(PROJECT_DIR / 'token_cache')),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('TOKENIZER_CACHE_MAX_ENTRIES', '100000')),
+        },
+    },
+    # Dùng chung giữa web và các worker (vd. phiên bản cache tìm kiếm)
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('SHARED_CACHE_URL', 'redis://localhost:6379/1'),
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -217,6 +245,14 @@ CELERY_TASK_ROUTES = {
     'user.tasks.send_welcome_email_task': {
         'queue': 'fast_tasks_queue',
     },
+    'user.tasks.rollup_search_queries': {
+        'queue': 'fast_tasks_queue',
+    },
+    # Tokenize cả kho bài viết (có process pool riêng, không chạy được trong
+    # worker prefork của fast_tasks/default); model được summarizer đọc
+    'summarizer.summarizers.llama.tasks.refresh_idf_model': {
+        'queue': 'gpu_crawler_queue',
+    },
 }
 
 FRONTEND_RESET_PASSWORD_URL = 'http://localhost:5173/reset-password'
@@ -231,3 +267,64 @@ cloudinary.config(
 
 DEFAULT_AVATAR_URL = os.getenv('DEFAULT_AVATAR_URL', '')
 CLOUDINARY_FOLDER = os.getenv('CLOUDINARY_FOLDER', 'avatars')
+
+# Cache kết quả tìm kiếm (summarizer.utils.search_result_cache)
+SEARCH_CACHE_TTL = int(os.getenv('SEARCH_CACHE_TTL', '60'))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '500'))
+SEARCH_CACHE_MAX_IDS = int(os.getenv('SEARCH_CACHE_MAX_IDS', '500'))
+# Rollup SearchHistory (user.services.search_analytics_service): chỉ xử lý
+# các dòng cũ hơn SEARCH_ROLLUP_LAG_SECONDS giây để transaction kịp commit
+SEARCH_ROLLUP_LAG_SECONDS = int(os.getenv('SEARCH_ROLLUP_LAG_SECONDS', '300'))
+# Gợi ý tìm kiếm (summarizer.utils.suggest_index), dựng lại sau mỗi
+# SUGGEST_REBUILD_SECONDS giây
+SUGGEST_REBUILD_SECONDS = int(os.getenv('SUGGEST_REBUILD_SECONDS', '600'))
+SUGGEST_QUERY_DAYS = int(os.getenv('SUGGEST_QUERY_DAYS', '30'))
+SUGGEST_MAX_QUERIES = int(os.getenv('SUGGEST_MAX_QUERIES', '5000'))
+SUGGEST_MAX_TITLES = int(os.getenv('SUGGEST_MAX_TITLES', '20000'))
+# Cache tra cứu danh mục / nguồn tin (news.utils.lookup_cache): kiểm tra
+# phiên bản chung tối đa mỗi LOOKUP_CACHE_CHECK_SECONDS giây
+LOOKUP_CACHE_CHECK_SECONDS = int(os.getenv('LOOKUP_CACHE_CHECK_SECONDS', '5'))
+LOOKUP_CACHE_MAX_ARTICLES = int(
+    os.getenv('LOOKUP_CACHE_MAX_ARTICLES', '100000'))
+# Cache thông tin cơ bản tác giả bình luận (user.services.user_basic_service)
+USER_BASIC_CACHE_TTL = int(os.getenv('USER_BASIC_CACHE_TTL', '3600'))
+# Giá trị filter ở trang admin (user.services.admin_filter_value_service):
+# top-K giá trị mặc định, cache ADMIN_FILTER_CACHE_TTL giây
+ADMIN_FILTER_TOP_K = int(os.getenv('ADMIN_FILTER_TOP_K', '100'))
+ADMIN_FILTER_CACHE_TTL = int(os.getenv('ADMIN_FILTER_CACHE_TTL', '300'))
+
+# Summarizer inference configuration
+# SUMMARIZER_DEVICE: 'auto' (cuda nếu có, ngược lại cpu), 'cuda' hoặc 'cpu'
+SUMMARIZER_DEVICE = os.getenv('SUMMARIZER_DEVICE', 'auto')
+SUMMARIZER_CPU_OPTIMIZED = os.getenv(
+    'SUMMARIZER_CPU_OPTIMIZED', 'True') == 'True'
+SUMMARIZER_CPU_DTYPE = os.getenv('SUMMARIZER_CPU_DTYPE', 'float32')
+SUMMARIZER_CPU_QUANTIZE = os.getenv(
+    'SUMMARIZER_CPU_QUANTIZE', 'False') == 'True'
+SUMMARIZER_CPU_THREADS = int(os.getenv('SUMMARIZER_CPU_THREADS', '0'))
+SUMMARIZER_WARMUP = os.getenv('SUMMARIZER_WARMUP', 'True') == 'True'
+# Giới hạn token đầu vào của LLM; TF-IDF chọn câu vừa ngân sách này
+SUMMARIZER_MAX_INPUT_TOKENS = int(
+    os.getenv('SUMMARIZER_MAX_INPUT_TOKENS', '2048'))
+# Pipeline generate_article_summaries: số tiến trình chuẩn bị prompt
+# (0 = chuẩn bị ngay trong worker), số bài chuẩn bị trước và số thread
+# làm sạch/ghi DB, số bản tóm tắt ghi mỗi lô
+SUMMARIZER_PREPROCESS_WORKERS = int(os.getenv(
+    'SUMMARIZER_PREPROCESS_WORKERS', str(min(2, (os.cpu_count() or 1) - 1))))
+SUMMARIZER_PREFETCH = int(os.getenv('SUMMARIZER_PREFETCH', '4'))
+SUMMARIZER_POSTPROCESS_WORKERS = int(
+    os.getenv('SUMMARIZER_POSTPROCESS_WORKERS', '2'))
+SUMMARIZER_SAVE_BATCH_SIZE = int(os.getenv('SUMMARIZER_SAVE_BATCH_SIZE', '8'))
+# Cổng Prometheus cho metrics của summarizer (0 = tắt), chỉ mở trong worker
+SUMMARIZER_METRICS_PORT = int(os.getenv('SUMMARIZER_METRICS_PORT', '0'))
+# IDF model fit trên toàn bộ kho bài viết (xem build_idf_model)
+SUMMARIZER_IDF_MODEL_PATH = os.getenv(
+    'SUMMARIZER_IDF_MODEL_PATH',
+    str(PROJECT_DIR / 'tfidf_model' / 'idf.joblib'))
+# Tokenizer tiếng Việt dùng chung (news.utils.vietnamese_tokenizer)
+# Số tiến trình tokenize song song (<= 1: tokenize ngay trong tiến trình)
+TOKENIZER_WORKERS = int(os.getenv(
+    'TOKENIZER_WORKERS', str(min(4, (os.cpu_count() or 1) - 1))))
+TOKENIZER_LRU_SIZE = int(os.getenv('TOKENIZER_LRU_SIZE', '10000'))
+TOKENIZER_CACHE_TIMEOUT = int(
+    os.getenv('TOKENIZER_CACHE_TIMEOUT', str(7 * 24 * 3600)))
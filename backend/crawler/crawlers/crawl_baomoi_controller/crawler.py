@@ -2,7 +2,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from crawler.crawlers.driver import get_driver
-from news.models import NewsArticle, Category
+from news.models import NewsArticle
+from news.utils.lookup_cache import lookup_cache
 import time
 import logging
 
@@ -45,8 +46,7 @@ class BaomoiCrawler:
                         f"Lỗi khi kiểm tra URL tồn tại hàng loạt: {db_err}")
 
             try:
-                valid_category_names_in_db = set(
-                    Category.objects.values_list('name', flat=True))
+                valid_category_names_in_db = lookup_cache.category_names()
             except Exception as db_err:
                 logger.error(
                     f"Lỗi khi lấy danh sách category hợp lệ: {db_err}")
@@ -3,7 +3,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from news.utils.parse_datetime import parse_datetime_manual
 from crawler.crawlers.driver import get_driver
-from news.models import NewsArticle, Category
+from news.models import NewsArticle
+from news.utils.lookup_cache import lookup_cache
 import time
 import logging
 from selenium.common.exceptions import TimeoutException
@@ -49,8 +50,7 @@ class VNExpressCrawler:
                         f"Lỗi khi kiểm tra URL VNExpress tồn tại hàng loạt: {db_err}")
 
             try:
-                valid_category_names_in_db = set(
-                    Category.objects.values_list('name', flat=True))
+                valid_category_names_in_db = lookup_cache.category_names()
             except Exception as db_err:
                 logger.error(
                     f"Lỗi khi lấy danh sách category hợp lệ: {db_err}")
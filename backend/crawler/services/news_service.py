@@ -1,6 +1,7 @@
 import uuid
 from django.utils import timezone
-from news.models import Category, NewsArticle, NewsArticleCategory, NewsSource
+from news.models import NewsArticle, NewsArticleCategory, NewsSource
+from news.utils.lookup_cache import lookup_cache
 from django.utils.dateparse import parse_datetime
 from django.db import transaction
 import logging
@@ -14,19 +15,26 @@ def save_articles_with_categories(source_name, source_url, articles):
         return 0
 
     try:
-        source, _ = NewsSource.objects.get_or_create(
-            website=source_url,
-            defaults={"name": source_name, "last_scraped": timezone.now()}
-        )
-        source.last_scraped = timezone.now()
-        source.save(update_fields=['last_scraped'])
+        # Nguồn đã biết: chỉ cập nhật last_scraped, không cần get_or_create
+        source_id = lookup_cache.source_id_by_website(source_url)
+        updated = source_id and NewsSource.objects.filter(
+            id=source_id).update(last_scraped=timezone.now())
+        if not updated:
+            source, _ = NewsSource.objects.get_or_create(
+                website=source_url,
+                defaults={"name": source_name, "last_scraped": timezone.now()}
+            )
+            source.last_scraped = timezone.now()
+            source.save(update_fields=['last_scraped'])
+            source_id = source.id
 
         category_names = {article.get(
             "category_name") for article in articles if article.get("category_name")}
 
-        categories_in_db = Category.objects.filter(name__in=category_names)
-
-        category_map = {cat.name: cat for cat in categories_in_db}
+        # Tên -> id danh mục lấy từ lookup_cache thay vì truy vấn mỗi lô
+        category_map = {
+            name: lookup_cache.category_id(name) for name in category_names
+            if lookup_cache.category_id(name)}
 
         missing_categories = category_names - set(category_map.keys())
         if missing_categories:
@@ -48,9 +56,9 @@ def save_articles_with_categories(source_name, source_url, articles):
                 continue
 
             category_name = article.get("category_name")
-            category_obj = category_map.get(category_name)
+            category_id = category_map.get(category_name)
 
-            if not category_obj:
+            if not category_id:
                 logger.warning(
                     f"⚠️ Bỏ qua bài viết vì không tìm thấy category '{category_name}' (đã kiểm tra trước đó?): {article.get('title')}")
                 continue
@@ -65,13 +73,13 @@ def save_articles_with_categories(source_name, source_url, articles):
                 content=article["content"],
                 url=url,
                 image_url=article.get("image_url"),
-                source_id=source.id,
+                source_id=source_id,
                 published_at=published_time
             ))
 
             article_category_relations_to_create.append(NewsArticleCategory(
                 article_id=article_id,
-                category_id=category_obj.id
+                category_id=category_id
             ))
             valid_article_urls.add(url)
 
@@ -5,3 +5,7 @@ import logging
 class NewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'news'
+
+    def ready(self):
+        # Đăng ký signal làm mới cache tra cứu danh mục / nguồn tin
+        from news import signals  # noqa: F401
@@ -18,6 +18,8 @@ class Command(BaseCommand):
         'seed_vnexpress_tasks',
         'seed_baomoi_tasks',
         'seed_summary_tasks',
+        'seed_idf_tasks',
+        'seed_search_analytics_tasks',
         'seed_summary_feedbacks',
         'seed_user_preferences',
         'seed_search_histories',
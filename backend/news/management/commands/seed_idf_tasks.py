@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django_celery_beat.models import PeriodicTask, IntervalSchedule
+
+
+class Command(BaseCommand):
+    help = 'Seed periodic task for refreshing the TF-IDF corpus IDF model'
+
+    def handle(self, *args, **kwargs):
+        deleted, _ = PeriodicTask.objects.filter(
+            name__icontains='IDF model').delete()
+        self.stdout.write(self.style.WARNING(
+            f"🧹 Đã xoá {deleted} task cũ liên quan đến IDF model."))
+
+        # Tạo schedule mỗi 30 phút
+        schedule, _ = IntervalSchedule.objects.get_or_create(
+            every=30,
+            period=IntervalSchedule.MINUTES,
+        )
+
+        PeriodicTask.objects.create(
+            name='Refresh IDF model every 30 minutes',
+            interval=schedule,
+            task='summarizer.summarizers.llama.tasks.refresh_idf_model',
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            "✅ Task IDF model đã được tạo lại thành công!"))
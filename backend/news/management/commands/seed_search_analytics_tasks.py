@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django_celery_beat.models import PeriodicTask, IntervalSchedule
+
+
+class Command(BaseCommand):
+    help = 'Seed periodic task for rolling up SearchHistory into daily query stats'
+
+    def handle(self, *args, **kwargs):
+        deleted, _ = PeriodicTask.objects.filter(
+            name__icontains='search queries').delete()
+        self.stdout.write(self.style.WARNING(
+            f"🧹 Đã xoá {deleted} task cũ liên quan đến thống kê tìm kiếm."))
+
+        # Tạo schedule mỗi 15 phút
+        schedule, _ = IntervalSchedule.objects.get_or_create(
+            every=15,
+            period=IntervalSchedule.MINUTES,
+        )
+
+        PeriodicTask.objects.create(
+            name='Roll up search queries every 15 minutes',
+            interval=schedule,
+            task='user.tasks.rollup_search_queries',
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            "✅ Task thống kê tìm kiếm đã được tạo lại thành công!"))
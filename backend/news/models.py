@@ -1,5 +1,7 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class NewsSource(models.Model):
@@ -29,6 +31,13 @@ class NewsArticle(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Tìm tiêu đề theo tiền tố không phân biệt hoa thường (filter admin)
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'),
+                     name='news_article_title_trgm'),
+        ]
+
 
 class NewsArticleCategory(models.Model):
     article_id = models.UUIDField()
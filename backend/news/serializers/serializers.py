@@ -1,8 +1,10 @@
 import os
 from rest_framework import serializers
-from news.models import NewsArticle, Category, NewsArticleCategory, Comment, ArticleStats
+from news.models import NewsArticle, Category, Comment, ArticleStats
+from news.utils.lookup_cache import lookup_cache
 from summarizer.models import NewsSummary, SummaryFeedback
 from user.models import User
+from user.services.user_basic_service import get_user_basics
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 DEFAULT_AVATAR_URL = os.getenv(
@@ -30,10 +32,8 @@ class ArticleListSerializer(serializers.ModelSerializer):
             'categories']
 
     def get_categories(self, obj):
-        category_ids = NewsArticleCategory.objects.filter(
-            article_id=obj.id).values_list(
-            'category_id', flat=True)
-        categories = Category.objects.filter(id__in=category_ids)
+        categories = lookup_cache.categories_for_articles(
+            [obj.id]).get(str(obj.id), [])
         return CategorySerializer(categories, many=True).data
 
 
@@ -65,14 +65,17 @@ class CommentSerializer(serializers.ModelSerializer):
 
     def get_user(self, obj: Comment):
         if obj.user_id:
-            try:
-                user_instance = User.objects.get(id=obj.user_id)
-                return UserBasicSerializer(user_instance).data
-            except User.DoesNotExist:
+            # Danh sách bình luận truyền sẵn 'users' trong context (một truy
+            # vấn cho cả trang); các trường hợp khác đọc từ cache theo user id
+            users = self.context.get('users')
+            if users is None:
+                users = get_user_basics([obj.user_id])
+            user_basic = users.get(str(obj.user_id))
+            if user_basic:
                 return {
-                    'id': None,
-                    'username': 'Người dùng ẩn danh',
-                    'avatar': DEFAULT_AVATAR_URL
+                    'id': user_basic['id'],
+                    'username': user_basic['username'],
+                    'avatar': user_basic['avatar'] or DEFAULT_AVATAR_URL
                 }
         return {
             'id': None,
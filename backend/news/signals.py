@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from news.models import Category, NewsArticleCategory, NewsSource
+from news.utils.lookup_cache import (
+    bump_article_categories_version_on_commit,
+    bump_version_on_commit,
+)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=NewsSource)
+def invalidate_lookup_cache(sender, **kwargs):
+    bump_version_on_commit()
+
+
+@receiver(post_save, sender=NewsArticleCategory)
+@receiver(post_delete, sender=NewsArticleCategory)
+def invalidate_article_categories(sender, **kwargs):
+    # Chỉ xoá bản đồ bài viết -> danh mục, không nạp lại Category/NewsSource.
+    # Crawler ghi liên kết bằng bulk_create nên không chạy signal này.
+    bump_article_categories_version_on_commit()
@@ -1,3 +1,115 @@
+import uuid
+from datetime import timedelta
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from news.models import Comment
+from news.utils.pagination import BookmarkCursorPagination, CommentCursorPagination
+from user.models import UserSavedArticle
 
-# Create your tests here.
+
+class CursorPaginationTestMixin:
+    factory = APIRequestFactory()
+
+    def _get_page(self, pagination_class, queryset, url):
+        paginator = pagination_class()
+        request = Request(self.factory.get(url))
+        page = paginator.paginate_queryset(queryset, request)
+        return page, paginator.get_next_link(), paginator.get_previous_link()
+
+    def _walk(self, pagination_class, queryset, url):
+        # Đi theo link `next` đến trang cuối như client
+        pages = []
+        while url:
+            page, url, _ = self._get_page(pagination_class, queryset, url)
+            pages.append(page)
+        return pages
+
+    def _set_created_at(self, model, objects, times):
+        for obj, created_at in zip(objects, times):
+            model.objects.filter(pk=obj.pk).update(created_at=created_at)
+
+
+class CommentCursorPaginationTests(CursorPaginationTestMixin, TestCase):
+    def setUp(self):
+        self.article_id = uuid.uuid4()
+        comments = [Comment.objects.create(
+            user_id=uuid.uuid4(), article_id=self.article_id,
+            content=f'Bình luận {i}') for i in range(45)]
+        # Mỗi 3 bình luận chung một created_at: trang phải cắt đúng giữa các
+        # bản ghi trùng vị trí con trỏ
+        base = timezone.now()
+        self._set_created_at(Comment, comments, [
+            base - timedelta(minutes=i // 3) for i in range(len(comments))])
+        self.queryset = Comment.objects.filter(article_id=self.article_id)
+
+    def test_first_page(self):
+        page, next_link, previous_link = self._get_page(
+            CommentCursorPagination, self.queryset, '/comments/')
+        self.assertEqual(len(page), CommentCursorPagination.page_size)
+        self.assertIsNotNone(next_link)
+        self.assertIsNone(previous_link)
+
+    def test_following_next_returns_every_comment_once_newest_first(self):
+        pages = self._walk(CommentCursorPagination, self.queryset, '/comments/')
+        self.assertEqual([len(page) for page in pages], [20, 20, 5])
+
+        comments = [comment for page in pages for comment in page]
+        self.assertEqual(len({comment.id for comment in comments}), 45)
+        created = [comment.created_at for comment in comments]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_page_size_query_param_is_capped(self):
+        page, _, _ = self._get_page(
+            CommentCursorPagination, self.queryset, '/comments/?page_size=7')
+        self.assertEqual(len(page), 7)
+
+        paginator = CommentCursorPagination()
+        request = Request(self.factory.get('/comments/?page_size=1000'))
+        self.assertEqual(paginator.get_page_size(request),
+                         CommentCursorPagination.max_page_size)
+
+    def test_new_comment_does_not_shift_next_page(self):
+        first_page, next_link, _ = self._get_page(
+            CommentCursorPagination, self.queryset, '/comments/')
+        Comment.objects.create(user_id=uuid.uuid4(), article_id=self.article_id,
+                               content='Bình luận mới')
+        second_page, _, _ = self._get_page(
+            CommentCursorPagination, self.queryset, next_link)
+        first_ids = {comment.id for comment in first_page}
+        self.assertFalse(first_ids & {comment.id for comment in second_page})
+        self.assertEqual(len(second_page), 20)
+
+
+class BookmarkCursorPaginationTests(CursorPaginationTestMixin, TestCase):
+    def setUp(self):
+        self.user_id = uuid.uuid4()
+        bookmarks = [UserSavedArticle.objects.create(
+            user_id=self.user_id, article_id=uuid.uuid4()) for _ in range(25)]
+        base = timezone.now()
+        self._set_created_at(UserSavedArticle, bookmarks, [
+            base - timedelta(hours=i) for i in range(len(bookmarks))])
+        self.newest_first = [bookmark.article_id for bookmark in bookmarks]
+
+        # Bookmark của người dùng khác không được lẫn vào
+        UserSavedArticle.objects.create(
+            user_id=uuid.uuid4(), article_id=uuid.uuid4())
+        self.queryset = UserSavedArticle.objects.filter(user_id=self.user_id)
+
+    def test_following_next_returns_all_bookmarks_newest_first(self):
+        pages = self._walk(BookmarkCursorPagination, self.queryset, '/bookmarks/')
+        self.assertEqual([len(page) for page in pages], [20, 5])
+        self.assertEqual(
+            [bookmark.article_id for page in pages for bookmark in page],
+            self.newest_first)
+
+    def test_previous_link_returns_first_page(self):
+        first_page, next_link, _ = self._get_page(
+            BookmarkCursorPagination, self.queryset, '/bookmarks/')
+        _, _, previous_link = self._get_page(
+            BookmarkCursorPagination, self.queryset, next_link)
+        page, _, _ = self._get_page(
+            BookmarkCursorPagination, self.queryset, previous_link)
+        self.assertEqual([bookmark.pk for bookmark in page],
+                         [bookmark.pk for bookmark in first_page])
@@ -1,4 +1,5 @@
 from news.models import Category, NewsArticle
+from news.utils.lookup_cache import lookup_cache
 import logging
 from django.db import connection
 
@@ -23,7 +24,7 @@ def check_url_exist(url):
 
 def check_category_exist(name):
     try:
-        return Category.objects.filter(name=name).exists()
+        return lookup_cache.category_id(name) is not None
     except Exception as e:
         logger.error(f"❌ Lỗi khi kiểm tra category trong database: {e}")
         try:
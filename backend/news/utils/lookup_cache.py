@@ -0,0 +1,211 @@
+import logging
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Cache tra cứu Category / NewsSource trong bộ nhớ của từng tiến trình (hai
+# bảng rất nhỏ, gần như không đổi). Phiên bản dùng chung nằm ở cache
+# 'shared' (Redis) và được tăng khi danh mục hoặc nguồn tin bị sửa
+# (news.signals), mỗi tiến trình kiểm tra phiên bản tối đa một lần mỗi
+# LOOKUP_CACHE_CHECK_SECONDS giây. Bản đồ bài viết -> danh mục có phiên bản
+# riêng: sửa liên kết bài viết - danh mục chỉ xoá bản đồ này, không nạp lại
+# Category/NewsSource.
+
+VERSION_CACHE_ALIAS = 'shared'
+VERSION_KEY = 'news_lookup_version'
+ARTICLE_CATEGORIES_VERSION_KEY = 'news_article_categories_version'
+VERSION_KEYS = (VERSION_KEY, ARTICLE_CATEGORIES_VERSION_KEY)
+
+
+def _version_cache():
+    from django.core.cache import caches
+    return caches[VERSION_CACHE_ALIAS]
+
+
+def current_version() -> tuple | None:
+    # (phiên bản Category/NewsSource, phiên bản liên kết bài viết - danh mục)
+    try:
+        cache = _version_cache()
+        versions = cache.get_many(VERSION_KEYS)
+        for key in VERSION_KEYS:
+            if key not in versions:
+                versions[key] = cache.get_or_set(key, 1, timeout=None)
+        return tuple(versions[key] for key in VERSION_KEYS)
+    except Exception as e:
+        logger.warning(f"Không thể đọc phiên bản cache tra cứu: {e}")
+        return None
+
+
+def _bump(key: str):
+    try:
+        cache = _version_cache()
+        if not cache.add(key, 2, timeout=None):
+            cache.incr(key)
+    except Exception as e:
+        logger.warning(f"Không thể tăng phiên bản cache tra cứu: {e}")
+
+
+def bump_version():
+    _bump(VERSION_KEY)
+    lookup_cache.invalidate()
+
+
+def bump_article_categories_version():
+    _bump(ARTICLE_CATEGORIES_VERSION_KEY)
+    lookup_cache.clear_article_categories()
+
+
+def bump_version_on_commit():
+    # Tiến trình khác chỉ nạp lại sau khi thay đổi đã được commit
+    transaction.on_commit(bump_version)
+
+
+def bump_article_categories_version_on_commit():
+    transaction.on_commit(bump_article_categories_version)
+
+
+class LookupCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = None
+        self._category_ids = []
+        self._category_index = {}
+        self._category_names = {}
+        self._category_ids_by_name = {}
+        self._source_names = {}
+        self._source_ids_by_website = {}
+        # article_id -> tuple chỉ số trong _category_ids (bản đồ gọn thay
+        # cho danh sách dict/UUID cho mỗi bài)
+        self._article_categories = {}
+
+    def invalidate(self):
+        with self._lock:
+            self._checked_at = None
+
+    def clear_article_categories(self):
+        with self._lock:
+            self._article_categories = {}
+
+    def _load(self, version):
+        from news.models import Category, NewsSource
+
+        categories = list(
+            Category.objects.order_by('name').values_list('id', 'name'))
+        sources = list(NewsSource.objects.values_list('id', 'name', 'website'))
+        with self._lock:
+            self._version = version
+            self._checked_at = time.monotonic()
+            self._category_ids = [category_id for category_id, _ in categories]
+            self._category_index = {
+                category_id: index
+                for index, category_id in enumerate(self._category_ids)}
+            self._category_names = dict(categories)
+            self._category_ids_by_name = {
+                name: category_id for category_id, name in categories}
+            self._source_names = {
+                source_id: name for source_id, name, _ in sources}
+            self._source_ids_by_website = {
+                website: source_id for source_id, _, website in sources}
+            self._article_categories = {}
+
+    def _ensure_fresh(self):
+        check_seconds = getattr(settings, 'LOOKUP_CACHE_CHECK_SECONDS', 5)
+        checked_at = self._checked_at
+        if checked_at is not None and time.monotonic() - checked_at < check_seconds:
+            return
+        version = current_version()
+        # Không đọc được phiên bản (Redis lỗi) thì nạp lại theo chu kỳ kiểm tra
+        if (checked_at is None or version is None or self._version is None
+                or version[0] != self._version[0]):
+            self._load(version)
+        else:
+            with self._lock:
+                if version[1] != self._version[1]:
+                    # Chỉ liên kết bài viết - danh mục đổi: giữ Category/NewsSource
+                    self._article_categories = {}
+                self._version = version
+                self._checked_at = time.monotonic()
+
+    def category_name(self, category_id) -> str | None:
+        self._ensure_fresh()
+        return self._category_names.get(category_id)
+
+    def category_id(self, name: str):
+        self._ensure_fresh()
+        return self._category_ids_by_name.get(name)
+
+    def category_names(self) -> set[str]:
+        self._ensure_fresh()
+        return set(self._category_ids_by_name)
+
+    def source_name(self, source_id) -> str | None:
+        self._ensure_fresh()
+        return self._source_names.get(source_id)
+
+    def source_names(self) -> list[str]:
+        self._ensure_fresh()
+        return sorted(set(self._source_names.values()))
+
+    def source_ids_by_names(self, names) -> list:
+        self._ensure_fresh()
+        names = set(names)
+        return [source_id for source_id, name in self._source_names.items()
+                if name in names]
+
+    def source_id_by_website(self, website: str):
+        self._ensure_fresh()
+        return self._source_ids_by_website.get(website)
+
+    def categories_for_articles(self, article_ids) -> dict:
+        # {str(article_id): [{'id', 'name'}]}; bài chưa có trong bản đồ được
+        # nạp bằng một truy vấn IN. Bài không có danh mục không được cache.
+        from news.models import NewsArticleCategory
+
+        self._ensure_fresh()
+        article_ids = {
+            article_id if isinstance(article_id, uuid.UUID)
+            else uuid.UUID(str(article_id))
+            for article_id in article_ids}
+        with self._lock:
+            cached = {article_id: self._article_categories[article_id]
+                      for article_id in article_ids
+                      if article_id in self._article_categories}
+            category_ids = self._category_ids
+            category_index = self._category_index
+            category_names = self._category_names
+
+        missing = article_ids - set(cached)
+        if missing:
+            loaded = {}
+            links = NewsArticleCategory.objects.filter(
+                article_id__in=missing
+            ).order_by('id').values_list('article_id', 'category_id')
+            for article_id, category_id in links:
+                index = category_index.get(category_id)
+                if index is not None:
+                    loaded.setdefault(article_id, []).append(index)
+            loaded = {article_id: tuple(indexes)
+                      for article_id, indexes in loaded.items()}
+            cached.update(loaded)
+
+            max_articles = getattr(settings, 'LOOKUP_CACHE_MAX_ARTICLES', 100000)
+            with self._lock:
+                if self._category_ids is category_ids:
+                    if len(self._article_categories) + len(loaded) > max_articles:
+                        self._article_categories = {}
+                    self._article_categories.update(loaded)
+
+        return {
+            str(article_id): [
+                {'id': category_ids[index],
+                 'name': category_names[category_ids[index]]}
+                for index in indexes]
+            for article_id, indexes in cached.items()}
+
+
+lookup_cache = LookupCache()
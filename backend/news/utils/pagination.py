@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination, LimitOffsetPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination, LimitOffsetPagination
 from rest_framework.response import Response
 
 
@@ -19,3 +19,18 @@ class StandardResultsSetPagination(PageNumberPagination):
 class InfiniteScrollPagination(LimitOffsetPagination):
     default_limit = 10
     max_limit = 50
+
+
+class CommentCursorPagination(CursorPagination):
+    # Phân trang theo con trỏ created_at: không COUNT, không OFFSET
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+
+
+class BookmarkCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
@@ -1,6 +1,7 @@
 import logging
-from news.models import NewsArticle
-from summarizer.models import NewsSummary
+from news.models import ArticleStats, NewsArticle
+from news.utils.lookup_cache import lookup_cache
+from summarizer.models import NewsSummary, SummaryFeedback
 
 logger = logging.getLogger(__name__)
 
@@ -24,3 +25,69 @@ def get_articles_for_summaries(summaries):
     except Exception as e:
         logger.error(f"Lỗi khi lấy articles cho summaries trong utils: {e}")
         return {}
+
+
+def get_user_votes_for_summaries(summaries, user_id):
+    # {str(summary_id): is_upvote} của một người dùng
+    if not summaries or not user_id:
+        return {}
+    feedbacks = SummaryFeedback.objects.filter(
+        user_id=user_id,
+        summary_id__in={summary.id for summary in summaries}
+    ).values_list('summary_id', 'is_upvote')
+    return {str(summary_id): is_upvote for summary_id, is_upvote in feedbacks}
+
+
+def get_comment_counts_for_articles(article_ids):
+    # {str(article_id): comment_count}; bài chưa có ArticleStats thì không có khoá
+    if not article_ids:
+        return {}
+    stats = ArticleStats.objects.filter(
+        article_id__in=article_ids
+    ).values_list('article_id', 'comment_count')
+    return {str(article_id): count for article_id, count in stats}
+
+
+def get_categories_for_articles(article_ids):
+    # {str(article_id): [{'id', 'name'}]}, thứ tự theo id liên kết như
+    # .first() trước đây; tên danh mục lấy từ lookup_cache
+    if not article_ids:
+        return {}
+    return lookup_cache.categories_for_articles(article_ids)
+
+
+def build_summary_context(summaries, request=None, articles=None) -> dict:
+    # Context cho SummarySerializer: nạp trước bài viết, vote của người dùng,
+    # số bình luận và danh mục cho cả trang bằng vài truy vấn IN thay vì
+    # truy vấn riêng cho từng tóm tắt.
+    summaries = [summary for summary in summaries or [] if summary is not None]
+    if articles is None:
+        articles = get_articles_for_summaries(summaries)
+
+    user_id = None
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        user_id = user.id
+
+    article_ids = {summary.article_id for summary in summaries}
+    context = {
+        'articles': articles,
+        'user_votes': {},
+        'comment_counts': {},
+        'article_categories': {},
+    }
+    try:
+        context['user_votes'] = get_user_votes_for_summaries(
+            summaries, user_id)
+        context['comment_counts'] = get_comment_counts_for_articles(
+            article_ids)
+        context['article_categories'] = get_categories_for_articles(
+            article_ids)
+    except Exception as e:
+        logger.error(f"Lỗi khi nạp context cho summaries trong utils: {e}")
+        # Bỏ các khoá để serializer quay về truy vấn từng dòng
+        for key in ('user_votes', 'comment_counts', 'article_categories'):
+            context.pop(key, None)
+    if request is not None:
+        context['request'] = request
+    return context
@@ -0,0 +1,164 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Dùng chung cho summarizer, TF-IDF và các phần search/index: mỗi đoạn văn
+# bản chỉ bị underthesea tokenize một lần. Cache 2 tầng: LRU trong tiến
+# trình theo từng đoạn (câu), và cache 'tokens' của Django (mặc định lưu trên
+# đĩa) với MỘT entry cho mỗi lần gọi tokenize_many (vd. các câu của một bài
+# viết), khoá theo hash của toàn bộ lô: FileBasedCache quét cả thư mục mỗi
+# lần set nên không ghi từng câu.
+
+CACHE_ALIAS = 'tokens'
+CACHE_KEY_PREFIX = 'vi_tokens'
+# Số đoạn văn bản tối thiểu chưa có trong cache để đáng dùng process pool
+MIN_BATCH_FOR_POOL = 16
+
+_lru = OrderedDict()
+_lru_lock = threading.Lock()
+_pool = None
+_pool_lock = threading.Lock()
+# True trong các tiến trình con của một process pool khác (vd. pool chuẩn bị
+# prompt của summarizer): không tạo thêm pool lồng nhau
+_pool_disabled = False
+
+
+def _tokenize_uncached(text: str) -> list[str]:
+    from underthesea import word_tokenize
+    try:
+        return word_tokenize(text, format="text").split()
+    except Exception as e:
+        logger.error(f"Lỗi khi tokenize văn bản: {str(e)}")
+        return text.split()
+
+
+def _tokenize_chunk(texts: list[str]) -> list[list[str]]:
+    return [_tokenize_uncached(text) for text in texts]
+
+
+def content_key(text: str) -> str:
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{digest}"
+
+
+def batch_key(keys: list[str]) -> str:
+    digest = hashlib.blake2b(
+        '\n'.join(keys).encode('utf-8'), digest_size=16).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:batch:{digest}"
+
+
+def _shared_cache():
+    try:
+        from django.core.cache import caches
+        return caches[CACHE_ALIAS]
+    except Exception:
+        return None
+
+
+def _lru_get(key):
+    with _lru_lock:
+        tokens = _lru.get(key)
+        if tokens is not None:
+            _lru.move_to_end(key)
+        return tokens
+
+
+def _lru_set(key, tokens):
+    max_size = getattr(settings, 'TOKENIZER_LRU_SIZE', 10000)
+    with _lru_lock:
+        _lru[key] = tokens
+        _lru.move_to_end(key)
+        while len(_lru) > max_size:
+            _lru.popitem(last=False)
+
+
+def disable_pool():
+    # Gọi trong initializer của tiến trình con thuộc một pool khác
+    global _pool_disabled
+    _pool_disabled = True
+
+
+def _pool_workers() -> int:
+    if _pool_disabled:
+        return 0
+    return getattr(settings, 'TOKENIZER_WORKERS', 0)
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    workers = _pool_workers()
+    if workers <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def tokenize_many(texts: list[str]) -> list[list[str]]:
+    results = [None] * len(texts)
+    keys = [content_key(text) for text in texts]
+
+    missing = {}
+    for i, key in enumerate(keys):
+        tokens = _lru_get(key)
+        if tokens is not None:
+            results[i] = tokens
+        else:
+            missing.setdefault(key, []).append(i)
+    if not missing:
+        return results
+
+    shared = _shared_cache()
+    shared_key = batch_key(keys)
+    if shared is not None:
+        try:
+            cached = shared.get(shared_key)
+        except Exception as e:
+            logger.warning(f"Không thể đọc cache tokens: {e}")
+            cached = None
+        if cached is not None and len(cached) == len(texts):
+            for key, tokens in zip(keys, cached):
+                _lru_set(key, tokens)
+            return cached
+
+    pending_keys = list(missing)
+    pending_texts = [texts[missing[key][0]] for key in pending_keys]
+
+    pool = _get_pool() if len(pending_texts) >= MIN_BATCH_FOR_POOL else None
+    if pool is not None:
+        chunk_size = max(1, len(pending_texts) // (_pool_workers() * 4))
+        chunks = [pending_texts[i:i + chunk_size]
+                  for i in range(0, len(pending_texts), chunk_size)]
+        computed = [tokens
+                    for chunk in pool.map(_tokenize_chunk, chunks)
+                    for tokens in chunk]
+    else:
+        computed = _tokenize_chunk(pending_texts)
+
+    for key, tokens in zip(pending_keys, computed):
+        _lru_set(key, tokens)
+        for i in missing[key]:
+            results[i] = tokens
+
+    if shared is not None:
+        try:
+            shared.set(
+                shared_key, results,
+                getattr(settings, 'TOKENIZER_CACHE_TIMEOUT', 7 * 24 * 3600))
+        except Exception as e:
+            logger.warning(f"Không thể ghi cache tokens: {e}")
+
+    return results
+
+
+def tokenize(text: str) -> list[str]:
+    return tokenize_many([text])[0]
@@ -6,6 +6,8 @@ from summarizer.models import NewsSummary
 from news.serializers.serializers import CommentSerializer
 from django.shortcuts import get_object_or_404
 from news.permissions import IsOwnerOrAdminOrReadOnly
+from news.utils.pagination import CommentCursorPagination
+from user.services.user_basic_service import get_user_basics
 import logging
 
 from news.news.news_controller import news_controller
@@ -16,6 +18,7 @@ logger = logging.getLogger(__name__)
 class CommentListCreateView(generics.ListCreateAPIView):
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = CommentCursorPagination
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -27,6 +30,17 @@ class CommentListCreateView(generics.ListCreateAPIView):
 
         return news_controller.get_comments_interface(summary_id)
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+
+        # Nạp tác giả của cả trang một lần thay vì mỗi bình luận một truy vấn
+        context = self.get_serializer_context()
+        context['users'] = get_user_basics(
+            {comment.user_id for comment in page})
+        serializer = self.get_serializer(page, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
+
     def perform_create(self, serializer):
         summary_id = self.kwargs.get('summary_id')
         try:
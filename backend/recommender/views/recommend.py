@@ -7,6 +7,7 @@ from recommender.recommenders.recommender_controller.recommender_controller impo
 from summarizer.serializers.serializers import (
     SummarySerializer as NewsAppSummarySerializer
 )
+from news.utils.summary_utils import build_summary_context
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,13 +29,12 @@ def get_recommendations(request):
             offset=offset
         )
 
+        serializer_context = build_summary_context(
+            summaries, request=request, articles=articles_dict)
+
         serialized_summaries = []
         for summary in summaries:
             try:
-                serializer_context = {
-                    'request': request,
-                    'articles': articles_dict
-                }
                 summary_data = NewsAppSummarySerializer(
                     summary, context=serializer_context).data
                 serialized_summaries.append(summary_data)
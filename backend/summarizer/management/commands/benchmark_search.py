@@ -0,0 +1,84 @@
+import time
+import statistics
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, Case, When, Value, IntegerField
+from django.contrib.postgres.search import SearchRank
+from summarizer.models import NewsSummary
+from summarizer.services.search_service import build_search_queries, search_summaries_with_articles
+from user.models import SearchHistory
+
+
+def legacy_search(query_string):
+    # Cách sắp xếp cũ: boost bằng summary_text ILIKE '%q%' (không có index)
+    search_query, _ = build_search_queries(query_string)
+    return NewsSummary.objects.annotate(
+        exact_match_boost=Case(
+            When(summary_text__icontains=query_string, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField()
+        ),
+        rank=SearchRank(F('search_vector'), search_query)
+    ).filter(
+        search_vector=search_query
+    ).order_by(
+        '-exact_match_boost',
+        '-rank',
+        '-created_at'
+    )
+
+
+class Command(BaseCommand):
+    help = 'Đo độ trễ tìm kiếm tóm tắt (trang đầu + COUNT) cho cách boost cũ và mới'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--query',
+            action='append',
+            default=[],
+            help='Truy vấn cần đo (có thể lặp lại); mặc định lấy từ SearchHistory')
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='Số truy vấn phổ biến nhất lấy từ SearchHistory')
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=5,
+            help='Số lần chạy mỗi truy vấn')
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=10,
+            help='Kích thước trang đầu')
+
+    def handle(self, *args, **options):
+        queries = options['query'] or list(
+            SearchHistory.objects.values('query')
+            .annotate(total=Count('id'))
+            .order_by('-total')
+            .values_list('query', flat=True)[:options['top']])
+        if not queries:
+            self.stdout.write(self.style.WARNING(
+                'Không có truy vấn nào để benchmark.'))
+            return
+
+        for name, search in (('legacy', legacy_search),
+                             ('phrase', search_summaries_with_articles)):
+            timings = []
+            for query in queries:
+                for _ in range(options['iterations']):
+                    start_time = time.perf_counter()
+                    queryset = search(query)
+                    list(queryset[:options['page_size']])
+                    queryset.count()
+                    timings.append((time.perf_counter() - start_time) * 1000)
+            self._report(name, len(queries), timings)
+
+    def _report(self, name, query_count, timings):
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"[{name}] {query_count} truy vấn, {len(timings)} lần: "
+            f"p50 {statistics.median(timings):.1f}ms, p95 {p95:.1f}ms, "
+            f"max {timings[-1]:.1f}ms")
@@ -0,0 +1,109 @@
+import gc
+import time
+import logging
+import torch
+from django.core.management.base import BaseCommand
+from news.models import NewsArticle
+from summarizer.summarizers.llama.article_summary import LlamaSummarizer
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Đo throughput của summarizer: đường hiện tại so với chế độ CPU tối ưu'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=5,
+            help='Số bài viết dùng để benchmark')
+        parser.add_argument(
+            '--device',
+            choices=['auto', 'cuda', 'cpu'],
+            default='cpu',
+            help='Thiết bị chạy benchmark')
+        parser.add_argument(
+            '--dtype',
+            choices=['float32', 'bfloat16'],
+            default='float32',
+            help='Kiểu dữ liệu cho chế độ CPU tối ưu')
+        parser.add_argument(
+            '--quantize',
+            action='store_true',
+            help='Bật dynamic int8 quantization cho các lớp Linear')
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=0,
+            help='Số intra-op threads (0 = mặc định của torch)')
+        parser.add_argument(
+            '--skip-baseline',
+            action='store_true',
+            help='Không chạy đường hiện tại (float16 + device_map="auto")')
+
+    def handle(self, *args, **options):
+        articles = list(
+            NewsArticle.objects.exclude(content='')
+            .order_by('-published_at')[:options['limit']])
+        if not articles:
+            self.stdout.write(self.style.WARNING(
+                'Không có bài viết nào để benchmark.'))
+            return
+
+        runs = []
+        if not options['skip_baseline']:
+            runs.append(('baseline', {
+                'device': options['device'],
+                'cpu_optimized': False,
+                'warmup': True,
+            }))
+        runs.append(('optimized', {
+            'device': options['device'],
+            'cpu_optimized': True,
+            'cpu_dtype': options['dtype'],
+            'cpu_quantize': options['quantize'],
+            'cpu_threads': options['threads'],
+            'warmup': True,
+        }))
+
+        results = {}
+        for name, kwargs in runs:
+            self.stdout.write(self.style.NOTICE(f'Đang chạy: {name} {kwargs}'))
+            results[name] = self._run(kwargs, articles)
+            self._report(name, results[name])
+
+        if 'baseline' in results and results['baseline']['seconds'] > 0:
+            speedup = results['baseline']['seconds'] / \
+                max(results['optimized']['seconds'], 1e-9)
+            self.stdout.write(self.style.SUCCESS(
+                f'Speedup optimized/baseline: {speedup:.2f}x'))
+
+    def _run(self, kwargs, articles):
+        summarizer = LlamaSummarizer(**kwargs)
+        result = {'articles': 0, 'success': 0, 'tokens': 0, 'seconds': 0.0}
+        try:
+            for article in articles:
+                start_time = time.perf_counter()
+                summary = summarizer.summarize(article.content)
+                result['seconds'] += time.perf_counter() - start_time
+                result['articles'] += 1
+                if summary:
+                    result['success'] += 1
+                    result['tokens'] += len(
+                        summarizer.tokenizer.encode(
+                            summary, add_special_tokens=False))
+        finally:
+            del summarizer
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        return result
+
+    def _report(self, name, result):
+        seconds = max(result['seconds'], 1e-9)
+        self.stdout.write(
+            f"[{name}] {result['articles']} bài, thành công {result['success']}, "
+            f"{seconds:.2f}s, {result['articles'] * 60 / seconds:.2f} bài/phút, "
+            f"{seconds / max(result['articles'], 1):.2f}s/bài, "
+            f"{result['tokens'] / seconds:.2f} tokens/s (output)")
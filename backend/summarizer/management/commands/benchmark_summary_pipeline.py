@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from news.models import NewsArticle
+from summarizer.services.summary_pipeline_service import SummaryPipelineService
+
+
+class Command(BaseCommand):
+    help = 'Đo số bài/phút end-to-end: tóm tắt tuần tự so với pipeline CPU/GPU (không ghi DB)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=10,
+            help='Số bài viết dùng để benchmark')
+
+    def handle(self, *args, **options):
+        articles = list(
+            NewsArticle.objects.exclude(content='')
+            .order_by('-published_at')[:options['limit']])
+        if not articles:
+            self.stdout.write(self.style.WARNING(
+                'Không có bài viết nào để benchmark.'))
+            return
+
+        report = SummaryPipelineService().benchmark(articles)
+        for name, result in report.items():
+            self.stdout.write(
+                f"[{name}] {result['articles']} bài, thành công {result['success']}, "
+                f"{result['seconds']:.2f}s, {result['articles_per_minute']:.2f} bài/phút")
+
+        speedup = report['serial']['seconds'] / \
+            max(report['pipeline']['seconds'], 1e-9)
+        self.stdout.write(self.style.SUCCESS(
+            f'Speedup pipeline/serial: {speedup:.2f}x'))
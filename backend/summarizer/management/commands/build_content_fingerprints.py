@@ -0,0 +1,41 @@
+import logging
+from django.core.management.base import BaseCommand
+from news.models import NewsArticle
+from summarizer.models import ContentFingerprint
+from summarizer.services.summary_cache_service import SummaryCacheService
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Tạo content hash/SimHash cho các bài viết chưa có fingerprint (dùng cho summary cache).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Số bài viết đọc mỗi lần từ database')
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Tính lại fingerprint cho toàn bộ bài viết')
+
+    def handle(self, *args, **options):
+        cache_service = SummaryCacheService()
+
+        articles = NewsArticle.objects.only('id', 'content')
+        if not options['all']:
+            articles = articles.exclude(
+                id__in=ContentFingerprint.objects.values('article_id'))
+
+        count = 0
+        for article in tqdm(
+                articles.iterator(chunk_size=options['chunk_size']),
+                desc="Fingerprinting"):
+            if cache_service.fingerprint_article(article):
+                count += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Đã tạo fingerprint cho {count} bài viết.'))
@@ -0,0 +1,26 @@
+import time
+from django.core.management.base import BaseCommand
+from summarizer.services.idf_service import IDFModelService
+
+
+class Command(BaseCommand):
+    help = 'Fit/cập nhật IDF model trên kho NewsArticle cho bước trích câu TF-IDF'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Fit lại từ đầu thay vì chỉ thêm bài viết mới')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Số bài viết xử lý mỗi lần')
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        result = IDFModelService().refresh(
+            full=options['full'], chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Đã thêm {result['added']} bài viết; model có {result['n_docs']} bài, "
+            f"{result['n_terms']} từ ({time.time() - start_time:.2f}s)."))
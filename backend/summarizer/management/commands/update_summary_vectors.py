@@ -1,63 +1,128 @@
+import time
 import logging
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.db.models import Value
-from django.contrib.postgres.search import SearchVector
-from news.models import NewsArticle
-from summarizer.models import NewsSummary
-from tqdm import tqdm
+from datetime import datetime, time as dt_time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
 logger = logging.getLogger(__name__)
 
+# Lấy cận trên của khoảng id tiếp theo (keyset theo id). PostgreSQL không có
+# MAX(uuid) nên lấy id cuối của chunk bằng ORDER BY id DESC LIMIT 1 (cùng thứ
+# tự uuid với ORDER BY s.id bên trong)
+NEXT_RANGE_SQL = """
+WITH chunk AS (
+    SELECT s.id
+    FROM summarizer_newssummary AS s
+    {join}
+    WHERE s.id > %s {since}
+    ORDER BY s.id
+    LIMIT %s
+)
+SELECT
+    (SELECT id FROM chunk ORDER BY id DESC LIMIT 1),
+    (SELECT COUNT(*) FROM chunk)
+"""
+
+# Bình thường search_vector do trigger giữ đồng bộ (migration 0009 của
+# summarizer); lệnh này dùng để dựng lại toàn bộ hoặc sau khi đổi cấu hình FTS
+UPDATE_RANGE_SQL = """
+UPDATE summarizer_newssummary AS s
+SET search_vector = summarizer_summary_search_vector(s.summary_text, s.article_id)
+FROM news_newsarticle AS a
+WHERE a.id = s.article_id
+  AND s.id > %s AND s.id <= %s {since}
+"""
+
+SINCE_FILTER = "AND (s.updated_at >= %s OR a.updated_at >= %s)"
+
+MIN_UUID = '00000000-0000-0000-0000-000000000000'
+
 
 class Command(BaseCommand):
-    help = 'Updates the search_vector for all existing NewsSummary entries.'
+    help = 'Updates the search_vector for existing NewsSummary entries in id-ordered chunks (one transaction per chunk).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Number of summaries updated per statement/transaction')
+        parser.add_argument(
+            '--since',
+            type=str,
+            default=None,
+            help='Only summaries (or articles) updated at/after this ISO date or datetime')
+        parser.add_argument(
+            '--start-after',
+            type=str,
+            default=MIN_UUID,
+            help='Resume after this summary id (printed after each chunk)')
+
+    def _parse_since(self, value):
+        if not value:
+            return None
+        since = parse_datetime(value)
+        if since is None:
+            since_date = parse_date(value)
+            if since_date is None:
+                raise CommandError(f'Invalid --since value: {value}')
+            since = datetime.combine(since_date, dt_time.min)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.NOTICE(
-            'Starting update of search vectors for NewsSummary...'))
+        chunk_size = options['chunk_size']
+        since = self._parse_since(options['since'])
+        last_id = options['start_after']
+
+        if since:
+            next_range_sql = NEXT_RANGE_SQL.format(
+                join='JOIN news_newsarticle AS a ON a.id = s.article_id',
+                since=SINCE_FILTER)
+            update_sql = UPDATE_RANGE_SQL.format(since=SINCE_FILTER)
+            since_params = [since, since]
+        else:
+            next_range_sql = NEXT_RANGE_SQL.format(join='', since='')
+            update_sql = UPDATE_RANGE_SQL.format(since='')
+            since_params = []
 
-        summaries_to_update = NewsSummary.objects.all()
-        articles = NewsArticle.objects.in_bulk(
-            summaries_to_update.values_list(
-                'article_id', flat=True))
+        self.stdout.write(self.style.NOTICE(
+            f'Starting update of search vectors for NewsSummary (chunk size {chunk_size}'
+            f"{', since ' + since.isoformat() if since else ''})..."))
 
         updated_count = 0
-        skipped_count = 0
-
-        with transaction.atomic():
-            for summary in tqdm(summaries_to_update, desc="Updating vectors"):
-                article = articles.get(summary.article_id)
-
-                if not article:
-                    self.stdout.write(self.style.WARNING(
-                        f'Skipping summary {summary.id}: Corresponding NewsArticle {summary.article_id} not found.'))
-                    skipped_count += 1
-                    continue
-
-                try:
-                    new_vector = (
-                        SearchVector(
-                            'summary_text',
-                            weight='A',
-                            config='vietnamese') +
-                        SearchVector(
-                            Value(
-                                article.title),
-                            weight='B',
-                            config='vietnamese'))
-
-                    summary.search_vector = new_vector
-                    summary.save(update_fields=['search_vector'])
-                    updated_count += 1
-
-                except Exception as e:
-                    self.stderr.write(
-                        self.style.ERROR(f'Error updating vector for summary {summary.id}: {e}'))
-                    raise e
+        scanned_count = 0
+        start_time = time.perf_counter()
+
+        while True:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        next_range_sql, [last_id, *since_params, chunk_size])
+                    upper_id, chunk_count = cursor.fetchone()
+                    if upper_id is None:
+                        break
+
+                    cursor.execute(
+                        update_sql, [last_id, upper_id, *since_params])
+                    chunk_updated = cursor.rowcount
+
+            last_id = str(upper_id)
+            scanned_count += chunk_count
+            updated_count += chunk_updated
+            elapsed = max(time.perf_counter() - start_time, 1e-9)
+            self.stdout.write(
+                f'Updated {updated_count}/{scanned_count} summaries '
+                f'({updated_count / elapsed:.0f} rows/sec), last id {last_id}')
 
+        elapsed = max(time.perf_counter() - start_time, 1e-9)
         self.stdout.write(self.style.SUCCESS(
-            f'Successfully updated search vectors for {updated_count} summaries.'))
+            f'Successfully updated search vectors for {updated_count} summaries '
+            f'in {elapsed:.2f}s ({updated_count / elapsed:.0f} rows/sec).'))
+        skipped_count = scanned_count - updated_count
         if skipped_count > 0:
             self.stdout.write(self.style.WARNING(
                 f'Skipped {skipped_count} summaries due to missing articles.'))
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0004_alter_vietnamese_fts_config'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('article_id', models.UUIDField(unique=True)),
+                ('content_hash', models.CharField(db_index=True, max_length=64)),
+                ('simhash', models.BigIntegerField()),
+                ('simhash_band0', models.IntegerField(db_index=True)),
+                ('simhash_band1', models.IntegerField(db_index=True)),
+                ('simhash_band2', models.IntegerField(db_index=True)),
+                ('simhash_band3', models.IntegerField(db_index=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-19 10:00
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0005_contentfingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SummarizationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('article_id', models.UUIDField(unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In progress'), ('failed', 'Failed'), ('done', 'Done')], default='pending', max_length=20)),
+                ('priority', models.FloatField(default=0)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(blank=True, null=True)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', '-priority'], name='summarizer__status_a64c6c_idx'), models.Index(fields=['next_attempt_at'], name='summarizer__next_at_463066_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0006_summarizationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newssummary',
+            name='generation_metrics',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-19 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summarizer', '0007_newssummary_generation_metrics'),
+    ]
+
+    # Upsert theo article_id cần unique constraint: giữ lại bản tóm tắt
+    # mới nhất của mỗi bài viết (cùng bản mà update_or_create sẽ chọn) và
+    # feedback của nó trước khi thêm constraint.
+    operations = [
+        migrations.RunSQL(
+            sql="""
+            DELETE FROM summarizer_newssummary s
+            USING summarizer_newssummary t
+            WHERE s.article_id = t.article_id
+              AND (s.updated_at, s.id) < (t.updated_at, t.id);
+
+            DELETE FROM summarizer_summaryfeedback f
+            WHERE NOT EXISTS (
+                SELECT 1 FROM summarizer_newssummary s
+                WHERE s.id = f.summary_id
+            );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name='newssummary',
+            name='article_id',
+            field=models.UUIDField(unique=True),
+        ),
+    ]
@@ -0,0 +1,72 @@
+from django.db import migrations
+
+# search_vector = tóm tắt (trọng số A) + tiêu đề bài viết (trọng số B).
+# Tiêu đề nằm ở bảng khác nên không dùng được generated column; dùng một hàm
+# SQL chung cho trigger và cho lệnh update_summary_vectors.
+CREATE_SEARCH_VECTOR_TRIGGERS_SQL = """
+CREATE OR REPLACE FUNCTION summarizer_summary_search_vector(
+    summary_text text, article_id uuid
+) RETURNS tsvector AS $$
+    SELECT
+        setweight(to_tsvector('vietnamese', COALESCE($1, '')), 'A') ||
+        setweight(to_tsvector('vietnamese', COALESCE(
+            (SELECT title FROM news_newsarticle WHERE id = $2), '')), 'B')
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION summarizer_newssummary_search_vector_trigger()
+RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := summarizer_summary_search_vector(
+        NEW.summary_text, NEW.article_id);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS newssummary_search_vector_update ON summarizer_newssummary;
+CREATE TRIGGER newssummary_search_vector_update
+    BEFORE INSERT OR UPDATE OF summary_text, article_id
+    ON summarizer_newssummary
+    FOR EACH ROW
+    EXECUTE FUNCTION summarizer_newssummary_search_vector_trigger();
+
+CREATE OR REPLACE FUNCTION summarizer_newsarticle_title_trigger()
+RETURNS trigger AS $$
+BEGIN
+    UPDATE summarizer_newssummary
+    SET search_vector = summarizer_summary_search_vector(summary_text, article_id)
+    WHERE article_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS newsarticle_title_search_vector_update ON news_newsarticle;
+CREATE TRIGGER newsarticle_title_search_vector_update
+    AFTER UPDATE OF title
+    ON news_newsarticle
+    FOR EACH ROW
+    WHEN (OLD.title IS DISTINCT FROM NEW.title)
+    EXECUTE FUNCTION summarizer_newsarticle_title_trigger();
+"""
+
+DROP_SEARCH_VECTOR_TRIGGERS_SQL = """
+DROP TRIGGER IF EXISTS newsarticle_title_search_vector_update ON news_newsarticle;
+DROP TRIGGER IF EXISTS newssummary_search_vector_update ON summarizer_newssummary;
+DROP FUNCTION IF EXISTS summarizer_newsarticle_title_trigger();
+DROP FUNCTION IF EXISTS summarizer_newssummary_search_vector_trigger();
+DROP FUNCTION IF EXISTS summarizer_summary_search_vector(text, uuid);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+        ('summarizer', '0008_alter_newssummary_article_id'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            CREATE_SEARCH_VECTOR_TRIGGERS_SQL,
+            DROP_SEARCH_VECTOR_TRIGGERS_SQL
+        ),
+    ]
@@ -7,7 +7,7 @@ from django.contrib.postgres.indexes import GinIndex
 
 class NewsSummary(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    article_id = models.UUIDField()
+    article_id = models.UUIDField(unique=True)
     summary_text = models.TextField()
     upvotes = models.IntegerField(default=0)
     downvotes = models.IntegerField(default=0)
@@ -15,6 +15,7 @@ class NewsSummary(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    generation_metrics = models.JSONField(null=True, blank=True)
 
     class Meta:
         indexes = [
@@ -33,3 +34,46 @@ class SummaryFeedback(models.Model):
     is_upvote = models.BooleanField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+
+class ContentFingerprint(models.Model):
+    article_id = models.UUIDField(unique=True)
+    content_hash = models.CharField(max_length=64, db_index=True)
+    simhash = models.BigIntegerField()
+    simhash_band0 = models.IntegerField(db_index=True)
+    simhash_band1 = models.IntegerField(db_index=True)
+    simhash_band2 = models.IntegerField(db_index=True)
+    simhash_band3 = models.IntegerField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class SummarizationJob(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_IN_PROGRESS = 'in_progress'
+    STATUS_FAILED = 'failed'
+    STATUS_DONE = 'done'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_IN_PROGRESS, 'In progress'),
+        (STATUS_FAILED, 'Failed'),
+        (STATUS_DONE, 'Done'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    article_id = models.UUIDField(unique=True)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    priority = models.FloatField(default=0)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', '-priority']),
+            models.Index(fields=['next_attempt_at']),
+        ]
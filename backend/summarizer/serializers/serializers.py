@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from news.models import ArticleStats, NewsArticle, Category, NewsArticleCategory
+from news.models import ArticleStats, NewsArticle, Category
+from news.utils.lookup_cache import lookup_cache
 from summarizer.models import NewsSummary, SummaryFeedback
 
 
@@ -9,8 +10,17 @@ class CategoryBasicSerializer(serializers.ModelSerializer):
         fields = ('id', 'name')
 
 
+def _article_categories(context: dict, article_id) -> list[dict]:
+    # Dùng danh mục đã nạp sẵn bởi build_summary_context nếu có
+    article_categories = context.get('article_categories')
+    if article_categories is None:
+        article_categories = lookup_cache.categories_for_articles(
+            [article_id])
+    return article_categories.get(str(article_id), [])
+
+
 class ArticleForSummarySerializer(serializers.ModelSerializer):
-    categories = CategoryBasicSerializer(many=True, read_only=True)
+    categories = serializers.SerializerMethodField()
 
     class Meta:
         model = NewsArticle
@@ -24,6 +34,10 @@ class ArticleForSummarySerializer(serializers.ModelSerializer):
         )
         read_only_fields = fields
 
+    def get_categories(self, obj: NewsArticle):
+        return CategoryBasicSerializer(
+            _article_categories(self.context, obj.id), many=True).data
+
 
 class SummarySerializer(serializers.ModelSerializer):
     article = serializers.SerializerMethodField()
@@ -61,6 +75,9 @@ class SummarySerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if request and hasattr(request,
                                'user') and request.user.is_authenticated:
+            user_votes = self.context.get('user_votes')
+            if user_votes is not None:
+                return user_votes.get(str(obj.id))
             try:
                 feedback = SummaryFeedback.objects.get(
                     summary_id=obj.id, user_id=request.user.id)
@@ -70,6 +87,9 @@ class SummarySerializer(serializers.ModelSerializer):
         return None
 
     def get_comment_count(self, obj: NewsSummary):
+        comment_counts = self.context.get('comment_counts')
+        if comment_counts is not None:
+            return comment_counts.get(str(obj.article_id), 0)
         try:
             article_stats = ArticleStats.objects.get(article_id=obj.article_id)
             return article_stats.comment_count
@@ -81,13 +101,6 @@ class SummarySerializer(serializers.ModelSerializer):
         article_instance = articles_dict.get(str(obj.article_id))
 
         if article_instance:
-            try:
-                article_category_relation = NewsArticleCategory.objects.filter(
-                    article_id=article_instance.id).first()
-                if article_category_relation:
-                    category = Category.objects.get(
-                        id=article_category_relation.category_id)
-                    return category.name
-            except (NewsArticleCategory.DoesNotExist, Category.DoesNotExist):
-                return None
+            categories = _article_categories(self.context, article_instance.id)
+            return categories[0]['name'] if categories else None
         return None
@@ -0,0 +1,59 @@
+import os
+import logging
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from news.models import NewsArticle
+from summarizer.utils.idf_model import CorpusIDFModel
+from news.utils.vietnamese_tokenizer import tokenize_many
+
+logger = logging.getLogger(__name__)
+
+
+class IDFModelService:
+    def __init__(self, model_path: str | None = None):
+        self.model_path = model_path or settings.SUMMARIZER_IDF_MODEL_PATH
+
+    def _load_or_create(self, full: bool) -> CorpusIDFModel:
+        if not full and os.path.exists(self.model_path):
+            return CorpusIDFModel.load(self.model_path, mmap=False)
+        return CorpusIDFModel()
+
+    def _add_batch(self, model: CorpusIDFModel, texts: list[str]) -> int:
+        return model.add_documents(
+            [token.lower() for token in tokens]
+            for tokens in tokenize_many(texts))
+
+    def refresh(self, full: bool = False, chunk_size: int = 500) -> dict:
+        # Cập nhật IDF model với các bài viết mới (created_at sau lần cập
+        # nhật trước). full=True fit lại từ đầu trên toàn bộ kho.
+        model = self._load_or_create(full)
+
+        articles = NewsArticle.objects.only(
+            'id', 'content', 'created_at').order_by('created_at')
+        if model.last_created_at:
+            articles = articles.filter(
+                created_at__gt=parse_datetime(model.last_created_at))
+
+        added = 0
+        batch = []
+        last_created_at = None
+        for article in articles.iterator(chunk_size=chunk_size):
+            batch.append(article.content)
+            last_created_at = article.created_at
+            if len(batch) >= chunk_size:
+                added += self._add_batch(model, batch)
+                batch = []
+        added += self._add_batch(model, batch)
+
+        if added:
+            model.last_created_at = last_created_at.isoformat()
+            model.save(self.model_path)
+            logger.info(
+                f"IDFModelService: Đã thêm {added} bài viết vào IDF model ({model.n_docs} bài, {len(model.terms)} từ).")
+        else:
+            logger.info("IDFModelService: Không có bài viết mới cho IDF model.")
+
+        return {
+            'added': added,
+            'n_docs': model.n_docs,
+            'n_terms': len(model.terms)}
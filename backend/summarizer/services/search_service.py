@@ -1,39 +1,150 @@
 import logging
-from django.db.models import Q, F, Case, When, Value, IntegerField
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Case, When, Value, IntegerField, Exists, OuterRef
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from news.models import NewsArticle, NewsArticleCategory
 from summarizer.models import NewsSummary
 
 logger = logging.getLogger(__name__)
 
+# Cấu hình FTS 'vietnamese' đã map word/hword qua unaccent_dict (migration
+# 0004) nên cả truy vấn lẫn search_vector đều bỏ dấu: "ha noi" khớp "Hà Nội".
+SEARCH_CONFIG = 'vietnamese'
 
-def search_summaries_with_articles(query_string):
+# Đếm facet theo danh mục, nguồn và ngày đăng trong một câu lệnh.
+# GROUPING(...) = 0 cho biết hàng thuộc grouping set nào.
+FACETS_SQL = """
+WITH matches AS ({matches_sql}),
+matched_articles AS (
+    SELECT a.id, a.source_id,
+           (a.published_at AT TIME ZONE %s)::date AS day
+    FROM news_newsarticle AS a
+    WHERE a.id IN (SELECT article_id FROM matches)
+)
+SELECT
+    GROUPING(c.id) AS by_category,
+    GROUPING(src.id) AS by_source,
+    c.id, c.name,
+    src.id, src.name,
+    ma.day,
+    COUNT(DISTINCT ma.id)
+FROM matched_articles AS ma
+LEFT JOIN news_newssource AS src ON src.id = ma.source_id
+LEFT JOIN news_newsarticlecategory AS ac ON ac.article_id = ma.id
+LEFT JOIN news_category AS c ON c.id = ac.category_id
+GROUP BY GROUPING SETS (
+    (c.id, c.name),
+    (src.id, src.name),
+    (ma.day)
+)
+"""
+
+
+def build_search_queries(query_string):
+    search_query = SearchQuery(
+        query_string,
+        config=SEARCH_CONFIG,
+        search_type='websearch')
+    # phraseto_tsquery: các từ của truy vấn đứng liền nhau theo đúng thứ tự
+    phrase_query = SearchQuery(
+        query_string,
+        config=SEARCH_CONFIG,
+        search_type='phrase')
+    return search_query, phrase_query
+
+
+def apply_search_filters(queryset, filters):
+    # filters: category_id, source_id, date_from, date_to (ngày đăng bài)
+    if not filters:
+        return queryset
+
+    if filters.get('category_id'):
+        queryset = queryset.filter(Exists(
+            NewsArticleCategory.objects.filter(
+                article_id=OuterRef('article_id'),
+                category_id=filters['category_id'])))
+
+    article_filters = {}
+    if filters.get('source_id'):
+        article_filters['source_id'] = filters['source_id']
+    if filters.get('date_from'):
+        article_filters['published_at__date__gte'] = filters['date_from']
+    if filters.get('date_to'):
+        article_filters['published_at__date__lte'] = filters['date_to']
+    if article_filters:
+        queryset = queryset.filter(Exists(
+            NewsArticle.objects.filter(
+                id=OuterRef('article_id'), **article_filters)))
+
+    return queryset
+
+
+def search_summaries_with_articles(query_string, filters=None):
     try:
-        search_query = SearchQuery(
-            query_string,
-            config='vietnamese',
-            search_type='websearch')
-        vector = SearchVector('summary_text', config='vietnamese')
+        search_query, phrase_query = build_search_queries(query_string)
 
+        # Boost khớp nguyên cụm tính trên search_vector (đã có sẵn trong
+        # hàng, không cần ILIKE '%q%' trên summary_text)
         summary_queryset = NewsSummary.objects.annotate(
             exact_match_boost=Case(
-                When(summary_text__icontains=query_string, then=Value(1)),
+                When(search_vector=phrase_query, then=Value(1)),
                 default=Value(0),
                 output_field=IntegerField()
             ),
             rank=SearchRank(F('search_vector'), search_query)
         ).filter(
             search_vector=search_query
+        )
+        summary_queryset = apply_search_filters(summary_queryset, filters)
+
+        return summary_queryset.defer(
+            'search_vector',
+            'generation_metrics'
         ).order_by(
             '-exact_match_boost',
             '-rank',
             '-created_at'
         )
 
-        return summary_queryset
-
     except Exception as e:
         logger.error(
             f"Error during summary search service for query '{query_string}': {e}",
             exc_info=True)
         # Có thể raise lỗi cụ thể hơn hoặc trả về None tùy cách xử lý ở view
         return None
+
+
+def search_facets(query_string, filters=None):
+    # Facet cho toàn bộ tập kết quả (sau khi lọc): số bài theo danh mục,
+    # nguồn và ngày đăng
+    search_query, _ = build_search_queries(query_string)
+    matches = apply_search_filters(
+        NewsSummary.objects.filter(search_vector=search_query), filters
+    ).order_by()
+    matches_sql, matches_params = matches.values('article_id').query.sql_with_params()
+
+    facets = {'categories': [], 'sources': [], 'days': []}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            FACETS_SQL.format(matches_sql=matches_sql),
+            [*matches_params, settings.TIME_ZONE])
+        rows = cursor.fetchall()
+
+    for (by_category, by_source, category_id, category_name,
+         source_id, source_name, day, count) in rows:
+        if not by_category:
+            if category_id:
+                facets['categories'].append(
+                    {'id': str(category_id), 'name': category_name, 'count': count})
+        elif not by_source:
+            if source_id:
+                facets['sources'].append(
+                    {'id': str(source_id), 'name': source_name, 'count': count})
+        elif day:
+            facets['days'].append({'date': day.isoformat(), 'count': count})
+
+    facets['categories'].sort(key=lambda item: -item['count'])
+    facets['sources'].sort(key=lambda item: -item['count'])
+    facets['days'].sort(key=lambda item: item['date'], reverse=True)
+    return facets
@@ -0,0 +1,122 @@
+import logging
+from django.db.models import Q
+from news.models import NewsArticle
+from summarizer.models import ContentFingerprint, NewsSummary
+from summarizer.services.feedback_service import MIN_TOTAL_VOTES_FOR_RATIO_CHECK, DOWNVOTE_RATIO_THRESHOLD
+from summarizer.utils.content_fingerprint import (
+    SIMHASH_MAX_DISTANCE,
+    content_hash,
+    from_signed64,
+    is_fingerprintable,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+    to_signed64,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCacheService:
+    def fingerprint_article(
+            self, article: NewsArticle) -> ContentFingerprint | None:
+        if not is_fingerprintable(article.content):
+            # Xoá fingerprint cũ (nếu nội dung đã bị sửa thành quá ngắn)
+            ContentFingerprint.objects.filter(article_id=article.id).delete()
+            return None
+        fingerprint = simhash(article.content)
+        bands = simhash_bands(fingerprint)
+        record, _ = ContentFingerprint.objects.update_or_create(
+            article_id=article.id,
+            defaults={
+                'content_hash': content_hash(article.content),
+                'simhash': to_signed64(fingerprint),
+                'simhash_band0': bands[0],
+                'simhash_band1': bands[1],
+                'simhash_band2': bands[2],
+                'simhash_band3': bands[3],
+            }
+        )
+        return record
+
+    def _is_reusable(self, summary: NewsSummary) -> bool:
+        # Không tái sử dụng bản tóm tắt đang bị downvote vượt ngưỡng
+        total_votes = summary.upvotes + summary.downvotes
+        if total_votes < MIN_TOTAL_VOTES_FOR_RATIO_CHECK:
+            return True
+        return summary.downvotes / total_votes < DOWNVOTE_RATIO_THRESHOLD
+
+    def _first_reusable_summary(
+            self, article_ids,
+            exclude_text: str | None = None) -> NewsSummary | None:
+        # Giữ thứ tự ưu tiên của article_ids (gần nhất trước). exclude_text
+        # là bản tóm tắt hiện tại của bài viết: bản sao của nó ở bài khác có
+        # thể chưa có vote nhưng vẫn là nội dung đã bị từ chối.
+        summaries = {}
+        for summary in NewsSummary.objects.filter(
+                article_id__in=article_ids).order_by('created_at'):
+            summaries[summary.article_id] = summary
+        for article_id in article_ids:
+            summary = summaries.get(article_id)
+            if (summary and self._is_reusable(summary)
+                    and summary.summary_text != exclude_text):
+                return summary
+        return None
+
+    def find_cached_summary(
+            self, article: NewsArticle,
+            fingerprint: ContentFingerprint | None = None) -> NewsSummary | None:
+        # Tìm bản tóm tắt của một bài viết KHÁC có nội dung trùng hoặc gần
+        # trùng. Bản tóm tắt của chính bài viết không được tính (nó có thể
+        # đang được tóm tắt lại do bị downvote).
+        try:
+            if fingerprint is None:
+                fingerprint = self.fingerprint_article(article)
+            if fingerprint is None:
+                return None
+
+            current_text = NewsSummary.objects.filter(
+                article_id=article.id).values_list(
+                'summary_text', flat=True).first()
+            others = ContentFingerprint.objects.exclude(article_id=article.id)
+
+            exact_ids = list(others.filter(
+                content_hash=fingerprint.content_hash).values_list(
+                'article_id', flat=True))
+            if exact_ids:
+                summary = self._first_reusable_summary(
+                    exact_ids, exclude_text=current_text)
+                if summary:
+                    logger.info(
+                        f"SummaryCache: Bài viết {article.id} trùng nội dung với {summary.article_id}.")
+                    return summary
+
+            candidates = others.filter(
+                Q(simhash_band0=fingerprint.simhash_band0) |
+                Q(simhash_band1=fingerprint.simhash_band1) |
+                Q(simhash_band2=fingerprint.simhash_band2) |
+                Q(simhash_band3=fingerprint.simhash_band3)
+            ).values_list('article_id', 'simhash')
+
+            target = from_signed64(fingerprint.simhash)
+            near_ids = [
+                (hamming_distance(target, from_signed64(other)), article_id)
+                for article_id, other in candidates
+            ]
+            near_ids = [
+                article_id for distance, article_id in sorted(near_ids)
+                if distance <= SIMHASH_MAX_DISTANCE]
+            if not near_ids:
+                return None
+
+            summary = self._first_reusable_summary(
+                near_ids, exclude_text=current_text)
+            if summary:
+                logger.info(
+                    f"SummaryCache: Bài viết {article.id} gần trùng với {summary.article_id}.")
+            return summary
+
+        except Exception as e:
+            logger.exception(
+                f"SummaryCache: Lỗi khi tìm bản tóm tắt đã có cho bài viết {article.id}: {e}")
+            return None
@@ -0,0 +1,156 @@
+import math
+import logging
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+from news.models import NewsArticle, ArticleStats
+from summarizer.models import NewsSummary, SummarizationJob
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_MINUTES = 10
+# Job in_progress quá thời gian này coi như worker đã chết và được nhận lại
+STALE_LOCK_MINUTES = 30
+ENQUEUE_BATCH_SIZE = 200
+
+# Priority được tính theo đơn vị "giờ": bài mới hơn có điểm cao hơn, độ phổ
+# biến và yêu cầu tóm tắt lại (do feedback) cộng thêm số giờ tương ứng.
+POPULARITY_WEIGHT_HOURS = 6
+REDO_BOOST_HOURS = 48
+
+
+class SummaryJobService:
+    def _compute_priority(self, published_at, stats: ArticleStats | None,
+                          redo: bool = False) -> float:
+        reference = published_at or timezone.now()
+        priority = reference.timestamp() / 3600
+        if stats:
+            popularity = stats.view_count + 2 * stats.comment_count + \
+                3 * stats.save_count
+            priority += POPULARITY_WEIGHT_HOURS * math.log1p(popularity)
+        if redo:
+            priority += REDO_BOOST_HOURS
+        return priority
+
+    def enqueue_new_articles(self, limit: int = ENQUEUE_BATCH_SIZE) -> int:
+        # Tạo job pending cho các bài viết chưa có summary và chưa có job
+        try:
+            articles = list(NewsArticle.objects.filter(
+                ~Exists(NewsSummary.objects.filter(article_id=OuterRef('id'))),
+                ~Exists(SummarizationJob.objects.filter(
+                    article_id=OuterRef('id'))),
+            ).order_by('-published_at').values('id', 'published_at')[:limit])
+
+            if not articles:
+                return 0
+
+            stats = ArticleStats.objects.in_bulk(
+                [article['id'] for article in articles])
+            jobs = [
+                SummarizationJob(
+                    article_id=article['id'],
+                    priority=self._compute_priority(
+                        article['published_at'], stats.get(article['id'])),
+                )
+                for article in articles
+            ]
+            SummarizationJob.objects.bulk_create(jobs, ignore_conflicts=True)
+            logger.info(f"JobService: Đã tạo {len(jobs)} job tóm tắt mới.")
+            return len(jobs)
+
+        except Exception as e:
+            logger.exception(f"JobService: Lỗi khi tạo job tóm tắt: {e}")
+            return 0
+
+    def _claimable(self):
+        now = timezone.now()
+        return SummarizationJob.objects.filter(
+            Q(status__in=[SummarizationJob.STATUS_PENDING,
+                          SummarizationJob.STATUS_FAILED]) |
+            Q(status=SummarizationJob.STATUS_IN_PROGRESS,
+              locked_at__lt=now - timedelta(minutes=STALE_LOCK_MINUTES)),
+            attempts__lt=MAX_ATTEMPTS,
+        ).filter(
+            Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now)
+        )
+
+    def claim_jobs(self, limit: int = 10) -> list[SummarizationJob]:
+        # SELECT ... FOR UPDATE SKIP LOCKED: nhiều worker có thể chạy song
+        # song mà không nhận trùng job. attempts tăng ngay khi nhận để cả
+        # những bài làm worker bị crash cũng bị giới hạn số lần thử.
+        with transaction.atomic():
+            jobs = list(
+                self._claimable()
+                .select_for_update(skip_locked=True)
+                .order_by('-priority')[:limit])
+            if not jobs:
+                return []
+
+            now = timezone.now()
+            SummarizationJob.objects.filter(
+                id__in=[job.id for job in jobs]).update(
+                status=SummarizationJob.STATUS_IN_PROGRESS,
+                attempts=F('attempts') + 1,
+                locked_at=now,
+                updated_at=now)
+            for job in jobs:
+                job.status = SummarizationJob.STATUS_IN_PROGRESS
+                job.attempts += 1
+                job.locked_at = now
+        logger.info(f"JobService: Đã nhận {len(jobs)} job tóm tắt.")
+        return jobs
+
+    def claim_article(self, article: NewsArticle,
+                      redo: bool = False) -> SummarizationJob | None:
+        # Nhận job của một bài viết cụ thể (tạo mới nếu chưa có). Trả về None
+        # nếu một worker khác đang xử lý bài viết này.
+        stats = ArticleStats.objects.filter(article_id=article.id).first()
+        priority = self._compute_priority(
+            article.published_at, stats, redo=redo)
+        with transaction.atomic():
+            SummarizationJob.objects.get_or_create(
+                article_id=article.id, defaults={'priority': priority})
+            job = (
+                SummarizationJob.objects
+                .select_for_update(skip_locked=True)
+                .filter(article_id=article.id)
+                .exclude(status=SummarizationJob.STATUS_IN_PROGRESS,
+                         locked_at__gte=timezone.now() - timedelta(
+                             minutes=STALE_LOCK_MINUTES))
+                .first())
+            if not job:
+                return None
+
+            if redo:
+                job.priority = priority
+                job.attempts = 0
+            job.status = SummarizationJob.STATUS_IN_PROGRESS
+            job.attempts += 1
+            job.locked_at = timezone.now()
+            job.next_attempt_at = None
+            job.save(update_fields=[
+                'status', 'priority', 'attempts', 'locked_at',
+                'next_attempt_at', 'updated_at'])
+        return job
+
+    def mark_done(self, job: SummarizationJob):
+        job.status = SummarizationJob.STATUS_DONE
+        job.locked_at = None
+        job.last_error = ''
+        job.save(update_fields=[
+            'status', 'locked_at', 'last_error', 'updated_at'])
+
+    def mark_failed(self, job: SummarizationJob, error: str = ''):
+        job.status = SummarizationJob.STATUS_FAILED
+        job.locked_at = None
+        job.last_error = error[:1000]
+        job.next_attempt_at = timezone.now() + timedelta(
+            minutes=BACKOFF_BASE_MINUTES * 2 ** (job.attempts - 1))
+        job.save(update_fields=[
+            'status', 'locked_at', 'last_error', 'next_attempt_at',
+            'updated_at'])
+        if job.attempts >= MAX_ATTEMPTS:
+            logger.warning(
+                f"JobService: Bài viết {job.article_id} thất bại {job.attempts} lần, ngừng thử lại.")
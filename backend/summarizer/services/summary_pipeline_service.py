@@ -0,0 +1,268 @@
+import logging
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+from django.conf import settings
+from django.db import connection
+from news.models import NewsArticle
+from summarizer.services.summary_service import SummaryService
+from summarizer.summarizers.llama.prompt_builder import init_prompt_worker, build_prompt_ids
+from summarizer.utils.generation_metrics import new_metrics
+
+logger = logging.getLogger(__name__)
+
+_prepare_pool = None
+_prepare_pool_lock = threading.Lock()
+
+
+def _get_prepare_pool(summarizer) -> ProcessPoolExecutor | None:
+    # Process pool sống cùng worker: mỗi tiến trình con tải tokenizer và
+    # underthesea một lần rồi dùng lại cho các lần chạy sau
+    global _prepare_pool
+    workers = getattr(settings, 'SUMMARIZER_PREPROCESS_WORKERS', 0)
+    if workers <= 0:
+        return None
+    with _prepare_pool_lock:
+        if _prepare_pool is None:
+            _prepare_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_prompt_worker,
+                initargs=(
+                    summarizer.base_model_name,
+                    summarizer.max_input_length,
+                    summarizer.hf_token))
+        return _prepare_pool
+
+
+class SummaryPipelineService:
+    # Pipeline 3 tầng cho một lô bài viết:
+    #   1. process pool trích câu TF-IDF + tokenize prompt cho các bài kế tiếp
+    #   2. tiến trình chính chỉ chạy generate trên GPU
+    #   3. thread pool làm sạch tóm tắt (regex, langdetect) và ghi DB
+    # nhờ đó GPU không phải chờ các bước CPU giữa hai bài.
+
+    def __init__(self, summary_service: Optional[SummaryService] = None):
+        self.summary_service = summary_service or SummaryService()
+        self.prefetch = max(
+            getattr(settings, 'SUMMARIZER_PREFETCH', 4), 1)
+        self.postprocess_workers = max(
+            getattr(settings, 'SUMMARIZER_POSTPROCESS_WORKERS', 2), 1)
+        self.save_batch_size = max(
+            getattr(settings, 'SUMMARIZER_SAVE_BATCH_SIZE', 8), 1)
+
+    def _prepare(self, pool, summarizer, content: str):
+        if pool is not None:
+            return pool.submit(build_prompt_ids, content)
+        # Không có process pool: chuẩn bị ngay trong tiến trình chính
+        future = _ImmediateFuture()
+        try:
+            if content and content.strip():
+                future.value = summarizer.prompt_builder.build_input_ids(
+                    content)
+        except Exception as e:
+            future.error = e
+        return future
+
+    def _finish(self, summarizer, writer: '_SummaryWriter',
+                article: NewsArticle, generated_text: Optional[str],
+                metrics: dict):
+        summary_text = None
+        try:
+            if generated_text is not None:
+                summary_text = summarizer.postprocess(generated_text, metrics)
+            if writer.persist:
+                summary_text = self.summary_service.validate_generated_summary(
+                    article, summary_text, metrics)
+        except Exception as e:
+            logger.exception(
+                f"Pipeline: Lỗi khi hoàn tất bài viết ID {article.id}: {e}")
+            summary_text = None
+        writer.add(article, summary_text, metrics)
+
+    def run(self, articles: list[NewsArticle],
+            on_result: Optional[Callable] = None,
+            persist: bool = True) -> dict:
+        # Trả về {article.id: NewsSummary | None}. on_result(article, summary)
+        # được gọi trong thread pool ngay khi lô chứa bài đó được ghi (vd. để
+        # cập nhật job). persist=False chỉ sinh và làm sạch, không dùng
+        # cache/ghi DB (dùng cho benchmark), khi đó giá trị là chuỗi tóm tắt.
+        writer = _SummaryWriter(
+            self.summary_service, self.save_batch_size, on_result, persist)
+
+        pending_articles = []
+        for article in articles:
+            cached = (self.summary_service.find_reusable_summary(article)
+                      if persist else None)
+            if cached:
+                writer.add(
+                    article, cached.summary_text,
+                    {'reused_from_summary_id': str(cached.id)})
+            else:
+                pending_articles.append(article)
+
+        post_pool = ThreadPoolExecutor(
+            max_workers=self.postprocess_workers,
+            thread_name_prefix='summary-post')
+        try:
+            if pending_articles:
+                self._generate_all(pending_articles, writer, post_pool)
+            # Ghi phần còn lại trong thread pool để dùng chung kết nối DB của
+            # các thread đó
+            post_pool.submit(writer.flush).result()
+        finally:
+            post_pool.shutdown(wait=True)
+
+        return writer.results
+
+    def _generate_all(self, articles: list[NewsArticle],
+                      writer: '_SummaryWriter', post_pool: ThreadPoolExecutor):
+        summarizer = self.summary_service._get_summarizer()
+        pool = _get_prepare_pool(summarizer)
+
+        article_iter = iter(articles)
+        prepared = deque()
+
+        def _submit_next():
+            article = next(article_iter, None)
+            if article is not None:
+                prepared.append(
+                    (article, self._prepare(pool, summarizer, article.content)))
+
+        for _ in range(self.prefetch):
+            _submit_next()
+
+        finish_futures = []
+        while prepared:
+            article, future = prepared.popleft()
+            _submit_next()
+
+            metrics = new_metrics()
+            generated_text = None
+            try:
+                input_ids = future.result()
+            except Exception as e:
+                logger.exception(
+                    f"Pipeline: Lỗi khi chuẩn bị prompt cho bài viết ID {article.id}: {e}")
+                input_ids = None
+                metrics['rejection_reason'] = 'error'
+
+            if input_ids:
+                logger.info(
+                    f"Pipeline: Đang tóm tắt bài viết ID {article.id} ({len(input_ids)} token)")
+                generated_text = summarizer.generate_from_input_ids(
+                    input_ids, metrics)
+                self.summary_service._cleanup_memory()
+            elif not metrics['rejection_reason']:
+                metrics['rejection_reason'] = 'empty_input'
+
+            finish_futures.append(post_pool.submit(
+                self._finish, summarizer, writer, article, generated_text,
+                metrics))
+
+        wait(finish_futures)
+
+    def benchmark(self, articles: list[NewsArticle]) -> dict:
+        # Đo end-to-end (không ghi DB) cho đường tuần tự cũ và pipeline
+        summarizer = self.summary_service._get_summarizer()
+        report = {}
+
+        start_time = time.perf_counter()
+        serial_success = sum(
+            1 for article in articles
+            if summarizer.summarize(article.content, new_metrics()))
+        report['serial'] = self._throughput(
+            len(articles), serial_success, time.perf_counter() - start_time)
+
+        # Khởi động process pool trước để không tính thời gian spawn
+        pool = _get_prepare_pool(summarizer)
+        if pool is not None:
+            pool.submit(build_prompt_ids, '').result()
+
+        start_time = time.perf_counter()
+        results = self.run(articles, persist=False)
+        report['pipeline'] = self._throughput(
+            len(articles), sum(1 for value in results.values() if value),
+            time.perf_counter() - start_time)
+        return report
+
+    @staticmethod
+    def _throughput(count: int, success: int, seconds: float) -> dict:
+        seconds = max(seconds, 1e-9)
+        return {
+            'articles': count,
+            'success': success,
+            'seconds': round(seconds, 2),
+            'articles_per_minute': round(count * 60 / seconds, 2),
+        }
+
+
+class _ImmediateFuture:
+    value = None
+    error = None
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class _SummaryWriter:
+    # Gom kết quả từ các thread hậu xử lý và ghi theo lô bằng
+    # SummaryService.save_summaries_bulk, rồi gọi on_result cho từng bài.
+
+    def __init__(self, summary_service: SummaryService, batch_size: int,
+                 on_result: Optional[Callable], persist: bool):
+        self.summary_service = summary_service
+        self.batch_size = batch_size
+        self.on_result = on_result
+        self.persist = persist
+        self.results = {}
+        self._buffer = []
+        self._failed = []
+        self._lock = threading.Lock()
+
+    def add(self, article: NewsArticle, summary_text: Optional[str],
+            metrics: Optional[dict]):
+        if not self.persist:
+            self._notify([(article, summary_text)])
+            return
+        with self._lock:
+            if summary_text:
+                self._buffer.append((article, summary_text, metrics))
+            else:
+                self._failed.append(article)
+            if len(self._buffer) < self.batch_size:
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            failed, self._failed = self._failed, []
+        outcomes = [(article, None) for article in failed]
+        try:
+            if batch:
+                saved = self.summary_service.save_summaries_bulk(batch)
+                outcomes.extend(
+                    (article, saved.get(article.id))
+                    for article, _, _ in batch)
+        finally:
+            if self.persist:
+                # Mỗi thread có kết nối DB riêng, đóng lại để không rò kết nối
+                connection.close()
+        self._notify(outcomes)
+
+    def _notify(self, outcomes: list[tuple]):
+        for article, result in outcomes:
+            self.results[article.id] = result
+            if not self.on_result:
+                continue
+            try:
+                self.on_result(article, result)
+            except Exception as e:
+                logger.exception(
+                    f"Pipeline: Lỗi trong on_result cho bài viết ID {article.id}: {e}")
@@ -1,14 +1,14 @@
 import logging
 from news.models import NewsArticle
 from summarizer.models import NewsSummary, SummaryFeedback
-from django.db.models import Exists, OuterRef
-from django.contrib.postgres.search import SearchVector
 from summarizer.summarizers.llama.article_summary import LlamaSummarizer
+from summarizer.services.summary_cache_service import SummaryCacheService
+from summarizer.utils.generation_metrics import new_metrics, record_generation, record_cache_hit
 import gc
 import torch
+from summarizer.utils.search_result_cache import bump_version as bump_search_cache_version
 from news.utils.validators import is_mostly_uppercase, contains_numbered_list
 from django.db import transaction
-from django.contrib.postgres.search import SearchVector, Value
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +17,7 @@ class SummaryService:
     _summarizer_instance = None
 
     def __init__(self):
-        pass
+        self.cache_service = SummaryCacheService()
 
     def _get_summarizer(self):
         if self._summarizer_instance is None:
@@ -36,100 +36,146 @@ class SummaryService:
             torch.cuda.empty_cache()
         gc.collect()
 
-    def process_and_save_summary(
+    def find_reusable_summary(
             self, article: NewsArticle) -> NewsSummary | None:
-        try:
+        cached_summary = self.cache_service.find_cached_summary(article)
+        if cached_summary:
             logger.info(
-                f"Service: Processing article ID {article.id} for summary.")
-            summarizer = self._get_summarizer()
+                f"Service: Reusing summary {cached_summary.id} for article ID {article.id}, skipping LLM.")
+            record_cache_hit()
+        return cached_summary
 
-            self._cleanup_memory()
-            summary_text = summarizer.summarize(article.content)
-            self._cleanup_memory()
+    def reuse_cached_summary(
+            self, article: NewsArticle) -> NewsSummary | None:
+        cached_summary = self.find_reusable_summary(article)
+        if not cached_summary:
+            return None
+        return self._save_summary(
+            article, cached_summary.summary_text,
+            {'reused_from_summary_id': str(cached_summary.id)})
+
+    def validate_generated_summary(
+            self, article: NewsArticle, summary_text: str | None,
+            metrics: dict) -> str | None:
+        if summary_text and is_mostly_uppercase(summary_text):
+            logger.warning(
+                f"Service: Summary for article ID {article.id} discarded (mostly uppercase).")
+            metrics['rejection_reason'] = 'uppercase'
+            summary_text = None
+        elif summary_text and contains_numbered_list(summary_text):
+            logger.warning(
+                f"Service: Summary for article ID {article.id} discarded (contains numbered list).")
+            metrics['rejection_reason'] = 'numbered_list'
+            summary_text = None
+
+        record_generation(metrics)
+        logger.info(
+            f"Service: Generation metrics for article ID {article.id}: {metrics}")
+
+        if not summary_text:
+            logger.warning(
+                f"Service: Summarizer returned empty for article ID {article.id}.")
+            return None
+
+        return summary_text
 
-            if not summary_text:
-                logger.warning(
-                    f"Service: Summarizer returned empty for article ID {article.id}.")
-                return None
+    def save_generated_summary(
+            self, article: NewsArticle, summary_text: str | None,
+            metrics: dict) -> NewsSummary | None:
+        summary_text = self.validate_generated_summary(
+            article, summary_text, metrics)
+        if not summary_text:
+            return None
+        return self._save_summary(article, summary_text, metrics)
 
-            if is_mostly_uppercase(summary_text):
-                logger.warning(
-                    f"Service: Summary for article ID {article.id} discarded (mostly uppercase).")
-                return None
-            if contains_numbered_list(summary_text):
-                logger.warning(
-                    f"Service: Summary for article ID {article.id} discarded (contains numbered list).")
-                return None
+    def process_and_save_summary(
+            self, article: NewsArticle,
+            redo: bool = False) -> NewsSummary | None:
+        try:
+            logger.info(
+                f"Service: Processing article ID {article.id} for summary.")
 
-            summary = None
-            created = False
-            log_action = "FAILED"
+            # redo (tóm tắt lại do bị downvote): luôn sinh mới, không lấy
+            # bản tóm tắt của bài trùng nội dung
+            if not redo:
+                cached_summary = self.reuse_cached_summary(article)
+                if cached_summary:
+                    return cached_summary
 
-            with transaction.atomic():
-                existing_summary = NewsSummary.objects.filter(
-                    article_id=article.id).first()
-                if existing_summary:
-                    deleted_feedback_count, _ = SummaryFeedback.objects.filter(
-                        summary_id=existing_summary.id).delete()
-                    if deleted_feedback_count > 0:
-                        logger.info(
-                            f"Service: Deleted {deleted_feedback_count} old feedback entries for previous summary of article {article.id}.")
-
-                summary, created = NewsSummary.objects.update_or_create(
-                    article_id=article.id,
-                    defaults={
-                        'summary_text': summary_text,
-                        'upvotes': 0,
-                        'downvotes': 0,
-                    }
-                )
-                logger.info(
-                    f"Service: Summary for article ID {article.id} {'created' if created else 'updated'}.")
-
-                if summary:
-                    summary.search_vector = (
-                        SearchVector(
-                            'summary_text',
-                            weight='A',
-                            config='vietnamese') +
-                        SearchVector(
-                            Value(
-                                article.title),
-                            weight='B',
-                            config='vietnamese'))
-                    summary.save(update_fields=['search_vector'])
-                    logger.info(
-                        f"Service: Updated search vector for summary ID {summary.id}.")
-                else:
-                    logger.error(
-                        f"Service: Failed to get summary object for article {article.id} after update_or_create.")
+            summarizer = self._get_summarizer()
 
-            if summary:
-                log_action = "CREATED" if created else "UPDATED (votes reset, old feedback deleted)"
-                logger.info(
-                    f"Service: Successfully {log_action} summary for article ID {article.id}")
+            metrics = new_metrics()
+            self._cleanup_memory()
+            summary_text = summarizer.summarize(article.content, metrics)
+            self._cleanup_memory()
 
-            return summary
+            return self.save_generated_summary(article, summary_text, metrics)
 
         except Exception as e:
             logger.exception(
                 f"Service: Error processing article ID {article.id}: {e}")
             return None
 
-    def get_articles_without_summary(self, limit: int = 10):
+    def _save_summary(
+            self, article: NewsArticle, summary_text: str,
+            generation_metrics: dict | None = None) -> NewsSummary | None:
+        return self.save_summaries_bulk(
+            [(article, summary_text, generation_metrics)]).get(article.id)
+
+    def save_summaries_bulk(self, results: list[tuple]) -> dict:
+        # results: [(article, summary_text, generation_metrics), ...]
+        # Ghi cả lô trong 2 câu lệnh: xoá feedback cũ và upsert NewsSummary
+        # theo article_id (giữ nguyên id, reset votes). search_vector do
+        # trigger trong DB tính (migration 0009). Trả về {article_id: NewsSummary}
+        # đọc lại từ DB (xem bên dưới).
+        by_article = {}
+        for article, summary_text, generation_metrics in results:
+            by_article[article.id] = (summary_text, generation_metrics)
+        if not by_article:
+            return {}
+
+        article_ids = list(by_article)
         try:
-            articles = NewsArticle.objects.filter(
-                ~Exists(
-                    NewsSummary.objects.filter(
-                        article_id=OuterRef('id')
-                    )
+            with transaction.atomic():
+                deleted_feedback_count, _ = SummaryFeedback.objects.filter(
+                    summary_id__in=NewsSummary.objects.filter(
+                        article_id__in=article_ids).values('id')
+                ).delete()
+                if deleted_feedback_count > 0:
+                    logger.info(
+                        f"Service: Deleted {deleted_feedback_count} old feedback entries for {len(article_ids)} articles.")
+
+                NewsSummary.objects.bulk_create(
+                    [
+                        NewsSummary(
+                            article_id=article_id,
+                            summary_text=summary_text,
+                            upvotes=0,
+                            downvotes=0,
+                            generation_metrics=generation_metrics,
+                        )
+                        for article_id, (summary_text, generation_metrics)
+                        in by_article.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=['article_id'],
+                    update_fields=[
+                        'summary_text', 'upvotes', 'downvotes',
+                        'generation_metrics', 'updated_at'],
                 )
-            ).order_by('-published_at')[:limit]
+                # Với dòng đã tồn tại, object bulk_create trả về mang id và
+                # created_at sinh trong Python chứ không phải giá trị đã lưu
+                # (UUID pk không nằm trong RETURNING), nên đọc lại các dòng
+                summaries = list(NewsSummary.objects.filter(
+                    article_id__in=article_ids).defer('search_vector'))
+                # Kết quả tìm kiếm đã cache không còn đúng
+                transaction.on_commit(bump_search_cache_version)
 
             logger.info(
-                f"Service: Tìm thấy {articles.count()} bài viết cần tóm tắt (limit {limit})")
-            return articles
+                f"Service: Successfully saved {len(summaries)} summaries (votes reset, old feedback deleted).")
+            return {summary.article_id: summary for summary in summaries}
 
         except Exception as e:
-            logger.exception(f"Lỗi khi lấy danh sách bài viết: {str(e)}")
-            return []
+            logger.exception(
+                f"Service: Error saving summaries for articles {article_ids}: {e}")
+            return {}
@@ -1,14 +1,20 @@
 from summarizer.utils.tfidf_processor import TFIDFProcessor
+from summarizer.summarizers.llama.prompt_builder import PromptBuilder, SUMMARY_PROMPT
+from summarizer.summarizers.llama.stopping_criteria import SummaryStoppingCriteria, UNWANTED_MARKERS
 from langdetect import detect, LangDetectException
 import re
 from huggingface_hub import login
 from peft import PeftModel
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, StoppingCriteriaList, TextIteratorStreamer
 import logging
 import os
 import json
-from typing import Optional
+import time
+from threading import Thread
+from typing import Callable, Optional
 import torch
+import psutil
+from django.conf import settings
 import multiprocessing
 multiprocessing.set_start_method('spawn', force=True)
 
@@ -26,13 +32,19 @@ console_handler.setFormatter(formatter)
 # Thêm handler vào logger
 logger.addHandler(console_handler)
 
-SUMMARY_PROMPT = (
-    "### Đây là dạng tóm tắt văn bản tin tức với độ dài tóm tắt đầu ra khoảng 150 từ:  ### Lệnh:\nBạn là một trợ lý tóm tắt văn bản. Hãy cung cấp bản tóm tắt ngắn gọn và chính xác trong 150 chữ cho bài viết sau. Bài viết:  {content}\n\n### Tóm tắt:\n"
-)
+CPU_DTYPES = {
+    'float32': torch.float32,
+    'bfloat16': torch.bfloat16,
+}
 
 
 class LlamaSummarizer:
-    def __init__(self):
+    def __init__(self, device: Optional[str] = None,
+                 cpu_optimized: Optional[bool] = None,
+                 cpu_dtype: Optional[str] = None,
+                 cpu_quantize: Optional[bool] = None,
+                 cpu_threads: Optional[int] = None,
+                 warmup: Optional[bool] = None):
         self.hf_token = os.getenv('HF_TOKEN')
         if not self.hf_token:
             raise ValueError(
@@ -50,12 +62,111 @@ class LlamaSummarizer:
             raise ValueError(
                 f"Không tìm thấy thư mục model tại {self.model_path}")
 
-        self.max_input_length = 2048
+        self.max_input_length = getattr(
+            settings, 'SUMMARIZER_MAX_INPUT_TOKENS', 2048)
         self.max_summary_length = 256
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = self._resolve_device(
+            device or getattr(settings, 'SUMMARIZER_DEVICE', 'auto'))
+
+        # Các tuỳ chọn chỉ áp dụng khi chạy trên CPU
+        self.cpu_optimized = self._setting(
+            cpu_optimized, 'SUMMARIZER_CPU_OPTIMIZED', True)
+        self.cpu_dtype = self._setting(
+            cpu_dtype, 'SUMMARIZER_CPU_DTYPE', 'float32')
+        self.cpu_quantize = self._setting(
+            cpu_quantize, 'SUMMARIZER_CPU_QUANTIZE', False)
+        self.cpu_threads = self._setting(
+            cpu_threads, 'SUMMARIZER_CPU_THREADS', 0)
+        warmup = self._setting(warmup, 'SUMMARIZER_WARMUP', True)
 
         self._load_model()
         self.tfidf_processor = TFIDFProcessor()
+        self.prompt_builder = PromptBuilder(
+            self.tokenizer, self.max_input_length, self.tfidf_processor)
+
+        if warmup:
+            self._warmup()
+
+    @staticmethod
+    def _setting(value, name, default):
+        if value is not None:
+            return value
+        return getattr(settings, name, default)
+
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        if device == "cuda" and not torch.cuda.is_available():
+            logger.warning(
+                "SUMMARIZER_DEVICE=cuda nhưng không có GPU, chuyển sang cpu.")
+            return "cpu"
+        if device in ("cuda", "cpu"):
+            return device
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    @property
+    def use_cpu_mode(self) -> bool:
+        return self.device == "cpu" and self.cpu_optimized
+
+    def _model_load_kwargs(self) -> dict:
+        if self.device == "cuda":
+            return {
+                'torch_dtype': torch.float16,
+                'device_map': {"": 0},
+            }
+        if not self.use_cpu_mode:
+            # Đường cũ: float16 + device_map="auto" (chậm trên hầu hết CPU)
+            return {
+                'torch_dtype': torch.float16,
+                'device_map': "auto",
+            }
+
+        dtype_name = self.cpu_dtype
+        if dtype_name not in CPU_DTYPES:
+            logger.warning(
+                f"SUMMARIZER_CPU_DTYPE '{dtype_name}' không hợp lệ, dùng float32.")
+            dtype_name = 'float32'
+        if self.cpu_quantize and dtype_name != 'float32':
+            # quantize_dynamic chỉ hỗ trợ trọng số float32
+            logger.warning(
+                "Dynamic int8 quantization yêu cầu float32, bỏ qua "
+                f"SUMMARIZER_CPU_DTYPE={dtype_name}.")
+            dtype_name = 'float32'
+        self.cpu_dtype = dtype_name
+        return {'torch_dtype': CPU_DTYPES[dtype_name]}
+
+    def _configure_cpu_threads(self):
+        if self.cpu_threads and self.cpu_threads > 0:
+            torch.set_num_threads(self.cpu_threads)
+        logger.info(
+            f"CPU inference: {torch.get_num_threads()} intra-op threads, "
+            f"dtype={self.cpu_dtype}, int8={self.cpu_quantize}")
+
+    def _optimize_for_cpu(self):
+        # Gộp LoRA adapter vào trọng số gốc để bỏ chi phí adapter mỗi bước
+        self.model = self.model.merge_and_unload()
+        if self.cpu_quantize:
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model.eval()
+
+    def _warmup(self):
+        try:
+            start_time = time.perf_counter()
+            inputs = self.tokenizer(
+                SUMMARY_PROMPT.format(content="Khởi động mô hình."),
+                return_tensors="pt").to(self.device)
+            with torch.no_grad():
+                self.model.generate(
+                    input_ids=inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    max_new_tokens=4,
+                    do_sample=False,
+                    pad_token_id=self.tokenizer.eos_token_id,
+                )
+            logger.info(
+                f"Warmup hoàn tất trong {time.perf_counter() - start_time:.2f}s")
+        except Exception as e:
+            logger.warning(f"Warmup thất bại: {str(e)}")
 
     def _load_model(self):
         try:
@@ -71,6 +182,7 @@ class LlamaSummarizer:
                 if not base_model_name:
                     raise ValueError(
                         "adapter_config.json không chứa base_model_name_or_path")
+            self.base_model_name = base_model_name
 
             self.tokenizer = AutoTokenizer.from_pretrained(
                 base_model_name,
@@ -82,13 +194,16 @@ class LlamaSummarizer:
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
 
+            load_kwargs = self._model_load_kwargs()
+            if self.use_cpu_mode:
+                self._configure_cpu_threads()
+
             base_model = AutoModelForCausalLM.from_pretrained(
                 base_model_name,
                 token=self.hf_token,
                 trust_remote_code=True,
-                torch_dtype=torch.float16,
-                device_map={"": 0} if torch.cuda.is_available() else "auto",
-                low_cpu_mem_usage=True
+                low_cpu_mem_usage=True,
+                **load_kwargs
             )
 
             self.model = PeftModel.from_pretrained(
@@ -100,6 +215,9 @@ class LlamaSummarizer:
 
             self.model.resize_token_embeddings(len(self.tokenizer))
 
+            if self.use_cpu_mode:
+                self._optimize_for_cpu()
+
         except Exception as e:
             logger.exception(f"Lỗi khi tải mô hình: {str(e)}")
             raise
@@ -112,13 +230,7 @@ class LlamaSummarizer:
         summary = re.sub(r'[?].*$', '', summary, flags=re.MULTILINE)
 
         # Loại bỏ các marker không mong muốn
-        unwanted_markers = [
-            "### Lời giải:", "### Đáp án:", "### Giải thích:",
-            "Câu hỏi:", "Trả lời:", "Vấn đề:", "Giải pháp:",
-            "Kết luận:", "Tóm lại:", "Tóm tắt:", "Bài viết:",
-            "### Lời giải thích", "### ", "### Lời khuyên:", "### Tham khảo:"
-        ]
-        for marker in unwanted_markers:
+        for marker in UNWANTED_MARKERS:
             if marker in summary:
                 summary = summary.split(marker)[0].strip()
         summary = re.sub(r'\b\d{3,}\b', '', summary)
@@ -138,32 +250,166 @@ class LlamaSummarizer:
 
         return summary
 
-    def summarize(self, content: str) -> Optional[str]:
+    def _inputs_from_ids(self, input_ids: list[int]) -> dict:
+        input_tensor = torch.tensor([input_ids], dtype=torch.long)
+        return {
+            'input_ids': input_tensor.to(self.device),
+            'attention_mask': torch.ones_like(input_tensor).to(self.device),
+        }
+
+    def _prepare_inputs(self, content: str) -> dict:
+        return self._inputs_from_ids(
+            self.prompt_builder.build_input_ids(content))
+
+    def _stopping_criteria(self, prompt_length: int) -> StoppingCriteriaList:
+        return StoppingCriteriaList([
+            SummaryStoppingCriteria(self.tokenizer, prompt_length)
+        ])
+
+    def _log_request(self, content: str):
+        content_preview = content[:100] + \
+            "..." if len(content) > 100 else content
+        logger.info(f"Đang tóm tắt bài viết: {content_preview}")
+        logger.debug(f"Sử dụng device: {self.device}")
+        if self.device == "cuda":
+            logger.debug(
+                f"GPU memory đang sử dụng: {torch.cuda.memory_allocated(0)/1024**2:.2f}MB")
+
+    @staticmethod
+    def _reject(metrics: Optional[dict], reason: str) -> None:
+        if metrics is not None:
+            metrics['rejection_reason'] = reason
+        return None
+
+    def _reset_peak_memory(self):
+        if self.device == "cuda":
+            torch.cuda.reset_peak_memory_stats(0)
+
+    def _peak_memory_bytes(self) -> int:
+        if self.device == "cuda":
+            return torch.cuda.max_memory_allocated(0)
+        return psutil.Process().memory_info().rss
+
+    def _count_tokens(self, token_ids) -> int:
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            return int(token_ids.shape[-1])
+        return int(token_ids.ne(pad_token_id).sum())
+
+    def _record_generation(self, metrics: Optional[dict], input_ids,
+                           output_ids, elapsed: float):
+        if metrics is None:
+            return
+        output_tokens = self._count_tokens(output_ids)
+        metrics.update({
+            'input_tokens': self._count_tokens(input_ids),
+            'output_tokens': output_tokens,
+            'generate_seconds': round(elapsed, 4),
+            'tokens_per_second': round(output_tokens / elapsed, 2) if elapsed > 0 else None,
+            'peak_memory_bytes': self._peak_memory_bytes(),
+            'device': self.device,
+        })
+
+    def _extract_summary(self, generated_text: str,
+                         metrics: Optional[dict] = None) -> Optional[str]:
+        summary_marker = "Tóm tắt:"
+        summary_start = generated_text.find(summary_marker)
+
+        summary = ""
+        if summary_start != -1:
+            summary = generated_text[summary_start +
+                                     len(summary_marker):].strip()
+        else:
+            logger.warning(
+                f"Không tìm thấy marker '{summary_marker}' trong văn bản sinh ra. Lấy toàn bộ generated_text.")
+            summary = generated_text
+            prompt_end_marker = "### Tóm tắt:"
+            prompt_end_pos = summary.find(prompt_end_marker)
+            if prompt_end_pos != -1:
+                summary = summary[prompt_end_pos +
+                                  len(prompt_end_marker):].strip()
+
+        return self._finalize_summary(summary, metrics)
+
+    def _finalize_summary(self, summary: str,
+                          metrics: Optional[dict] = None) -> Optional[str]:
+        prompt_markers_to_remove = [
+            "### Đây là dạng tóm tắt văn bản tin tức",
+            "### Lệnh:",
+            "Bạn là một trợ lý tóm tắt văn bản",
+            "Hãy cung cấp bản tóm tắt ngắn gọn",
+            "Bài viết:",
+        ]
+
+        summary = summary.strip()
+        for marker in prompt_markers_to_remove:
+            if summary.startswith(marker):
+                summary = summary[len(marker):].strip()
+
+        cleaned_summary = self._clean_summary(summary)
+
+        if cleaned_summary is None:
+            logger.warning("Summary bị loại do chứa dấu * không hợp lệ.")
+            return self._reject(metrics, 'asterisk')
+
+        if not cleaned_summary:
+            logger.warning("Summary bị rỗng sau khi làm sạch.")
+            return self._reject(metrics, 'markers')
+
+        word_count = len(cleaned_summary.split())
+        if word_count < 10:
+            logger.warning(
+                f"Summary quá ngắn ({word_count} < 10 từ) sau khi làm sạch.")
+            return self._reject(metrics, 'too_short')
+
+        if cleaned_summary and not cleaned_summary[0].isalnum():
+            logger.warning(
+                "Summary bắt đầu bằng ký tự không phải chữ/số sau khi làm sạch.")
+            return self._reject(metrics, 'non_alnum_start')
+
+        try:
+            language = detect(cleaned_summary)
+            if language == 'en':
+                logger.warning("Summary được phát hiện là tiếng Anh.")
+                return self._reject(metrics, 'english')
+        except LangDetectException:
+            logger.warning("Không thể xác định ngôn ngữ của tóm tắt")
+            return self._reject(metrics, 'language_unknown')
+
+        logger.info(
+            f"Tóm tắt thành công ({word_count} từ): {cleaned_summary[:100]}...")
+
+        return cleaned_summary
+
+    def summarize(self, content: str,
+                  metrics: Optional[dict] = None) -> Optional[str]:
+        # metrics (nếu truyền vào, xem generation_metrics.new_metrics) được
+        # điền số token, thời gian generate, bộ nhớ đỉnh và lý do loại bỏ.
         try:
             if not content or len(content.strip()) == 0:
-                return None
+                return self._reject(metrics, 'empty_input')
 
-            content_preview = content[:100] + \
-                "..." if len(content) > 100 else content
-            logger.info(f"Đang tóm tắt bài viết: {content_preview}")
-            logger.debug(f"Sử dụng device: {self.device}")
-            if self.device == "cuda":
-                logger.debug(
-                    f"GPU memory đang sử dụng: {torch.cuda.memory_allocated(0)/1024**2:.2f}MB")
+            self._log_request(content)
+            input_ids = self.prompt_builder.build_input_ids(content)
+        except Exception as e:
+            logger.exception(f"Lỗi khi tóm tắt nội dung: {str(e)}")
+            return self._reject(metrics, 'error')
 
-            processed_content = self.tfidf_processor.get_important_sentences(
-                content)
-            prompt = SUMMARY_PROMPT.format(content=processed_content)
+        generated_text = self.generate_from_input_ids(input_ids, metrics)
+        if generated_text is None:
+            return None
+        return self.postprocess(generated_text, metrics)
 
-            inputs = self.tokenizer(
-                prompt,
-                return_tensors="pt",
-                padding="max_length",
-                truncation=True,
-                max_length=self.max_input_length,
-                add_special_tokens=True
-            ).to(self.device)
+    def generate_from_input_ids(self, input_ids: list[int],
+                                metrics: Optional[dict] = None) -> Optional[str]:
+        # Phần chạy trên GPU: nhận input ids đã chuẩn bị sẵn (xem
+        # PromptBuilder), trả về văn bản sinh ra chưa làm sạch.
+        try:
+            inputs = self._inputs_from_ids(input_ids)
+            prompt_length = inputs["input_ids"].shape[1]
 
+            self._reset_peak_memory()
+            start_time = time.perf_counter()
             with torch.no_grad():
                 outputs = self.model.generate(
                     input_ids=inputs["input_ids"],
@@ -179,71 +425,91 @@ class LlamaSummarizer:
                     early_stopping=True,
                     no_repeat_ngram_size=3,
                     length_penalty=1.0,
+                    stopping_criteria=self._stopping_criteria(prompt_length),
                 )
 
-            generated_text = self.tokenizer.decode(
+            elapsed = time.perf_counter() - start_time
+
+            self._record_generation(
+                metrics, inputs["input_ids"][0], outputs[0, prompt_length:],
+                elapsed)
+            logger.debug(
+                f"Số token sinh ra: {outputs.shape[1] - prompt_length}/{self.max_summary_length}")
+
+            return self.tokenizer.decode(
                 outputs[0], skip_special_tokens=True)
 
-            summary_marker = "Tóm tắt:"
-            summary_start = generated_text.find(summary_marker)
-
-            summary = ""
-            if summary_start != -1:
-                summary = generated_text[summary_start +
-                                         len(summary_marker):].strip()
-            else:
-                logger.warning(
-                    f"Không tìm thấy marker '{summary_marker}' trong văn bản sinh ra. Lấy toàn bộ generated_text.")
-                summary = generated_text
-                prompt_end_marker = "### Tóm tắt:"
-                prompt_end_pos = summary.find(prompt_end_marker)
-                if prompt_end_pos != -1:
-                    summary = summary[prompt_end_pos +
-                                      len(prompt_end_marker):].strip()
-
-            prompt_markers_to_remove = [
-                "### Đây là dạng tóm tắt văn bản tin tức",
-                "### Lệnh:",
-                "Bạn là một trợ lý tóm tắt văn bản",
-                "Hãy cung cấp bản tóm tắt ngắn gọn",
-                "Bài viết:",
-            ]
-
-            for marker in prompt_markers_to_remove:
-                if summary.startswith(marker):
-                    summary = summary[len(marker):].strip()
-
-            cleaned_summary = self._clean_summary(summary)
-
-            if not cleaned_summary:
-                logger.warning("Summary bị rỗng sau khi làm sạch.")
-                return None
-
-            word_count = len(cleaned_summary.split())
-            if word_count < 10:
-                logger.warning(
-                    f"Summary quá ngắn ({word_count} < 10 từ) sau khi làm sạch.")
-                return None
-
-            if cleaned_summary and not cleaned_summary[0].isalnum():
-                logger.warning(
-                    "Summary bắt đầu bằng ký tự không phải chữ/số sau khi làm sạch.")
-                return None
-
-            try:
-                language = detect(cleaned_summary)
-                if language == 'en':
-                    logger.warning("Summary được phát hiện là tiếng Anh.")
-                    return None
-            except LangDetectException:
-                logger.warning("Không thể xác định ngôn ngữ của tóm tắt")
-                return None
+        except Exception as e:
+            logger.exception(f"Lỗi khi tóm tắt nội dung: {str(e)}")
+            return self._reject(metrics, 'error')
 
-            logger.info(
-                f"Tóm tắt thành công ({word_count} từ): {cleaned_summary[:100]}...")
+    def postprocess(self, generated_text: str,
+                    metrics: Optional[dict] = None) -> Optional[str]:
+        # Phần CPU sau generate (regex, langdetect), an toàn khi gọi từ
+        # thread khác trong lúc GPU sinh bài tiếp theo.
+        try:
+            return self._extract_summary(generated_text, metrics)
+        except Exception as e:
+            logger.exception(f"Lỗi khi làm sạch tóm tắt: {str(e)}")
+            return self._reject(metrics, 'error')
+
+    def summarize_stream(self, content: str,
+                         on_text: Optional[Callable[[str], None]] = None,
+                         metrics: Optional[dict] = None) -> Optional[str]:
+        # Streaming không hỗ trợ beam search nên dùng sampling với một beam.
+        # on_text nhận từng đoạn văn bản vừa sinh; giá trị trả về là bản tóm
+        # tắt cuối cùng đã được làm sạch như summarize().
+        try:
+            if not content or len(content.strip()) == 0:
+                return self._reject(metrics, 'empty_input')
+
+            self._log_request(content)
+            inputs = self._prepare_inputs(content)
+            prompt_length = inputs["input_ids"].shape[1]
+
+            streamer = TextIteratorStreamer(
+                self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+            generate_kwargs = dict(
+                input_ids=inputs["input_ids"],
+                attention_mask=inputs["attention_mask"],
+                max_new_tokens=self.max_summary_length,
+                min_new_tokens=50,
+                temperature=0.7,
+                top_p=0.9,
+                do_sample=True,
+                pad_token_id=self.tokenizer.eos_token_id,
+                repetition_penalty=1.2,
+                no_repeat_ngram_size=3,
+                stopping_criteria=self._stopping_criteria(prompt_length),
+                streamer=streamer,
+            )
+
+            def _generate():
+                with torch.no_grad():
+                    self.model.generate(**generate_kwargs)
 
-            return cleaned_summary
+            self._reset_peak_memory()
+            start_time = time.perf_counter()
+            thread = Thread(target=_generate, daemon=True)
+            thread.start()
+
+            chunks = []
+            for text in streamer:
+                chunks.append(text)
+                if on_text:
+                    on_text(text)
+            thread.join()
+            elapsed = time.perf_counter() - start_time
+
+            generated_text = ''.join(chunks)
+            self._record_generation(
+                metrics, inputs["input_ids"][0],
+                self.tokenizer(generated_text, add_special_tokens=False,
+                               return_tensors="pt")["input_ids"][0],
+                elapsed)
+
+            return self._finalize_summary(generated_text, metrics)
 
         except Exception as e:
-            logger.exception(f"Lỗi khi tóm tắt nội dung: {str(e)}")
-            return None
+            logger.exception(f"Lỗi khi tóm tắt nội dung (stream): {str(e)}")
+            return self._reject(metrics, 'error')
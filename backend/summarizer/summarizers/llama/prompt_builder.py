@@ -0,0 +1,93 @@
+import os
+import logging
+from typing import Optional
+from summarizer.utils.tfidf_processor import TFIDFProcessor
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = (
+    "### Đây là dạng tóm tắt văn bản tin tức với độ dài tóm tắt đầu ra khoảng 150 từ:  ### Lệnh:\nBạn là một trợ lý tóm tắt văn bản. Hãy cung cấp bản tóm tắt ngắn gọn và chính xác trong 150 chữ cho bài viết sau. Bài viết:  {content}\n\n### Tóm tắt:\n"
+)
+
+# Dự phòng cho chênh lệch token khi ghép các câu đã chọn vào prompt
+PROMPT_TOKEN_MARGIN = 16
+
+
+class PromptBuilder:
+    # Phần CPU của việc tóm tắt: trích câu TF-IDF theo ngân sách token và
+    # tokenize prompt. Không cần model nên chạy được trong process pool.
+
+    def __init__(self, tokenizer, max_input_length: int,
+                 tfidf_processor: Optional[TFIDFProcessor] = None):
+        self.tokenizer = tokenizer
+        self.max_input_length = max_input_length
+        self.tfidf_processor = tfidf_processor or TFIDFProcessor()
+        self.content_token_budget = self._content_token_budget()
+
+    def _content_token_budget(self) -> int:
+        # Ngân sách token cho phần bài viết = giới hạn đầu vào trừ phần khung
+        # prompt (kể cả BOS) và một khoảng dự phòng cho việc ghép câu
+        prompt_tokens = len(self.tokenizer(
+            SUMMARY_PROMPT.format(content=''),
+            add_special_tokens=True)['input_ids'])
+        return max(
+            self.max_input_length - prompt_tokens - PROMPT_TOKEN_MARGIN, 0)
+
+    def _count_sentence_tokens(self, sentences: list[str]) -> list[int]:
+        # +1 cho khoảng trắng nối giữa các câu
+        encoded = self.tokenizer(sentences, add_special_tokens=False)
+        return [len(ids) + 1 for ids in encoded['input_ids']]
+
+    def build_prompt(self, content: str) -> str:
+        processed_content = self.tfidf_processor.get_important_sentences(
+            content,
+            token_budget=self.content_token_budget,
+            count_tokens=self._count_sentence_tokens)
+        return SUMMARY_PROMPT.format(content=processed_content)
+
+    def build_input_ids(self, content: str) -> list[int]:
+        # Không pad tới max_length: bài ngắn cho prompt ngắn. truncation chỉ
+        # là lưới an toàn, bình thường prompt đã nằm trong ngân sách.
+        input_ids = self.tokenizer(
+            self.build_prompt(content),
+            truncation=True,
+            max_length=self.max_input_length,
+            add_special_tokens=True
+        )['input_ids']
+        if len(input_ids) >= self.max_input_length:
+            logger.warning(
+                f"Prompt chạm giới hạn {self.max_input_length} token, phần cuối có thể bị cắt")
+        return input_ids
+
+
+# Các hàm dưới đây chạy trong tiến trình con của process pool (spawn), mỗi
+# tiến trình giữ một PromptBuilder riêng.
+_worker_builder = None
+
+
+def init_prompt_worker(tokenizer_name: str, max_input_length: int,
+                       hf_token: Optional[str] = None):
+    global _worker_builder
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+    from transformers import AutoTokenizer
+    from news.utils.vietnamese_tokenizer import disable_pool
+
+    # Đã chạy trong process pool: tokenize ngay trong tiến trình này thay vì
+    # tạo thêm pool lồng nhau
+    disable_pool()
+
+    tokenizer = AutoTokenizer.from_pretrained(
+        tokenizer_name,
+        padding_side="left",
+        trust_remote_code=True,
+        token=hf_token
+    )
+    _worker_builder = PromptBuilder(tokenizer, max_input_length)
+
+
+def build_prompt_ids(content: str) -> Optional[list[int]]:
+    if not content or not content.strip():
+        return None
+    return _worker_builder.build_input_ids(content)
@@ -0,0 +1,43 @@
+import torch
+from transformers import StoppingCriteria
+
+# Các marker cho thấy mô hình đã sinh xong phần tóm tắt và chuyển sang nội
+# dung không mong muốn (lời giải, câu hỏi, ...). _clean_summary cắt tại các
+# marker này nên mọi token sinh sau đó đều bị bỏ đi.
+UNWANTED_MARKERS = [
+    "### Lời giải:", "### Đáp án:", "### Giải thích:",
+    "Câu hỏi:", "Trả lời:", "Vấn đề:", "Giải pháp:",
+    "Kết luận:", "Tóm lại:", "Tóm tắt:", "Bài viết:",
+    "### Lời giải thích", "### ", "### Lời khuyên:", "### Tham khảo:"
+]
+
+SUMMARY_TARGET_WORDS = 150
+
+
+class SummaryStoppingCriteria(StoppingCriteria):
+    # Dừng khi gặp marker không mong muốn hoặc đã đủ số từ mục tiêu.
+    # Chỉ giải mã phần token sinh mới (sau prompt) của từng sequence nên
+    # hoạt động được với beam search (mỗi beam được đánh giá riêng).
+
+    def __init__(self, tokenizer, prompt_length: int,
+                 markers: list[str] | None = None,
+                 max_words: int = SUMMARY_TARGET_WORDS):
+        self.tokenizer = tokenizer
+        self.prompt_length = prompt_length
+        self.markers = markers if markers is not None else UNWANTED_MARKERS
+        self.max_words = max_words
+
+    def _should_stop(self, text: str) -> bool:
+        if any(marker in text for marker in self.markers):
+            return True
+        return len(text.split()) >= self.max_words
+
+    def __call__(self, input_ids: torch.LongTensor,
+                 scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        generated = input_ids[:, self.prompt_length:]
+        texts = self.tokenizer.batch_decode(
+            generated, skip_special_tokens=True)
+        return torch.tensor(
+            [self._should_stop(text) for text in texts],
+            dtype=torch.bool,
+            device=input_ids.device)
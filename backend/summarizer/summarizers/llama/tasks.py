@@ -1,10 +1,17 @@
 from summarizer.services.article_service import ArticleService
 from summarizer.services.summary_service import SummaryService
+from summarizer.services.summary_job_service import SummaryJobService, MAX_ATTEMPTS
+from summarizer.services.summary_pipeline_service import SummaryPipelineService
+from summarizer.services.idf_service import IDFModelService
+from news.models import NewsArticle
+from summarizer.utils.generation_metrics import start_metrics_server
 from celery import shared_task
+from celery.signals import worker_ready
 import gc
 import torch
 import logging
 import django
+from django.utils import timezone
 django.setup()
 
 
@@ -12,6 +19,13 @@ logger = logging.getLogger(__name__)
 
 summary_service = SummaryService()
 article_service = ArticleService()
+job_service = SummaryJobService()
+pipeline_service = SummaryPipelineService(summary_service)
+
+
+@worker_ready.connect
+def _start_summarizer_metrics(**kwargs):
+    start_metrics_server()
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -21,35 +35,46 @@ def generate_article_summaries(self, limit=10):
     success_count = 0
 
     try:
-        articles_to_process = summary_service.get_articles_without_summary(
-            limit=limit)
+        job_service.enqueue_new_articles()
+        jobs = job_service.claim_jobs(limit=limit)
 
-        if not articles_to_process:
+        if not jobs:
             return {'processed': 0, 'success': 0}
 
-        total_articles = len(articles_to_process)
+        articles = NewsArticle.objects.in_bulk(
+            [job.article_id for job in jobs])
+        total_articles = len(jobs)
 
-        for i, article in enumerate(articles_to_process):
-            logger.info(
-                f"Task: Đang yêu cầu xử lý bài viết {i+1}/{total_articles} (ID: {article.id})")
-            try:
-                result_summary = summary_service.process_and_save_summary(
-                    article)
-                processed_count += 1
-                if result_summary:
-                    success_count += 1
-                    logger.info(
-                        f"Task: Đã xử lý thành công bài viết ID: {article.id}")
-                else:
-                    logger.warning(
-                        f"Task: Service không thể xử lý/lưu summary cho bài viết ID: {article.id}")
-
-            except Exception as exc_inner:
-                logger.error(
-                    f"Task: Lỗi nghiêm trọng khi xử lý bài viết ID {article.id}: {exc_inner}",
-                    exc_info=True)
+        jobs_by_article = {}
+        for job in jobs:
+            if job.article_id in articles:
+                jobs_by_article[job.article_id] = job
+            else:
+                job_service.mark_failed(job, 'Article not found')
                 processed_count += 1
 
+        def _on_result(article, result_summary):
+            # Chạy trong thread pool của pipeline, song song với generate
+            job = jobs_by_article[article.id]
+            if result_summary:
+                job_service.mark_done(job)
+                logger.info(
+                    f"Task: Đã xử lý thành công bài viết ID: {article.id}")
+            else:
+                job_service.mark_failed(
+                    job, 'Service could not process/save summary')
+                logger.warning(
+                    f"Task: Service không thể xử lý/lưu summary cho bài viết ID: {article.id}")
+
+        logger.info(
+            f"Task: Đang xử lý {len(jobs_by_article)}/{total_articles} bài viết qua pipeline")
+        results = pipeline_service.run(
+            [articles[article_id] for article_id in jobs_by_article],
+            on_result=_on_result)
+
+        processed_count += len(results)
+        success_count = sum(1 for summary in results.values() if summary)
+
         logger.info(
             f"Task finished: Đã xử lý {processed_count}/{total_articles} yêu cầu, thành công {success_count}.")
         return {'processed': processed_count, 'success': success_count}
@@ -67,9 +92,11 @@ def generate_article_summaries(self, limit=10):
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=30)
-def summarize_single_article_task(self, article_id_str: str):
+def summarize_single_article_task(
+        self, article_id_str: str, redo: bool = False):
     logger.info(f"Single Task started: Tóm tắt bài viết ID {article_id_str}")
 
+    job = None
     try:
         article = article_service.get_article_by_id(article_id_str)
 
@@ -78,17 +105,36 @@ def summarize_single_article_task(self, article_id_str: str):
                 'status': 'error',
                 'message': 'Article not found by service'}
 
-        result_summary = summary_service.process_and_save_summary(article)
+        # Chỉ lần giao đầu tiên của yêu cầu redo mới reset attempts; các lần
+        # retry của Celery phải chịu giới hạn số lần thử và backoff
+        job = job_service.claim_article(
+            article, redo=redo and self.request.retries == 0)
+        if not job:
+            logger.info(
+                f"Single Task: Bài viết {article_id_str} đang được worker khác xử lý.")
+            return {
+                'status': 'skipped',
+                'message': 'Article is already being summarized'}
+
+        result_summary = summary_service.process_and_save_summary(
+            article, redo=redo)
 
         if result_summary:
+            job_service.mark_done(job)
             logger.info(
                 f"Single Task: Đã xử lý thành công bài viết ID: {article_id_str}")
             return {'status': 'success', 'summary_id': str(result_summary.id)}
         else:
-            try:
-                self.retry(countdown=15)
-            except Exception as retry_exc:
-                logger.error(f"Single Task retry failed: {retry_exc}")
+            job_service.mark_failed(
+                job, 'Failed to process or save summary via service')
+            if job.attempts < MAX_ATTEMPTS:
+                # Retry theo backoff mũ mà mark_failed đã đặt cho job
+                countdown = max(
+                    (job.next_attempt_at - timezone.now()).total_seconds(), 15)
+                try:
+                    self.retry(countdown=countdown)
+                except Exception as retry_exc:
+                    logger.error(f"Single Task retry failed: {retry_exc}")
             return {
                 'status': 'error',
                 'message': 'Failed to process or save summary via service'}
@@ -97,8 +143,20 @@ def summarize_single_article_task(self, article_id_str: str):
         logger.error(
             f"Single Task failed unexpectedly for article {article_id_str}: {exc}",
             exc_info=True)
+        if job:
+            job_service.mark_failed(job, str(exc))
         try:
             self.retry(exc=exc)
         except Exception as retry_exc:
             logger.error(f"Single Task retry failed: {retry_exc}")
         return {'status': 'error', 'message': f'Unexpected error: {exc}'}
+
+
+@shared_task
+def refresh_idf_model(full=False):
+    logger.info("Task started: Cập nhật IDF model cho TF-IDF.")
+    try:
+        return IDFModelService().refresh(full=full)
+    except Exception as exc:
+        logger.error(f"Task refresh_idf_model failed: {exc}", exc_info=True)
+        return {'error': str(exc)}
@@ -4,11 +4,22 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def search_summaries_interface(query_string: str):
+def search_summaries_interface(query_string: str, filters: dict | None = None):
     try:
-        return search_service.search_summaries_with_articles(query_string)
+        return search_service.search_summaries_with_articles(
+            query_string, filters)
     except Exception as e:
         logger.error(
             f"SearchController: Error calling search_summaries_with_articles for query '{query_string}': {e}",
             exc_info=True)
         raise
+
+
+def search_facets_interface(query_string: str, filters: dict | None = None):
+    try:
+        return search_service.search_facets(query_string, filters)
+    except Exception as e:
+        logger.error(
+            f"SearchController: Error calling search_facets for query '{query_string}': {e}",
+            exc_info=True)
+        raise
@@ -0,0 +1,123 @@
+import random
+from django.test import SimpleTestCase
+from summarizer.utils.content_fingerprint import (
+    MIN_FINGERPRINT_WORDS,
+    SIMHASH_BITS,
+    SIMHASH_MAX_DISTANCE,
+    content_hash,
+    from_signed64,
+    hamming_distance,
+    is_fingerprintable,
+    normalize_content,
+    simhash,
+    simhash_bands,
+    to_signed64,
+)
+
+ARTICLE = (
+    "Giá vàng miếng trong nước sáng nay tiếp tục tăng mạnh theo đà đi lên "
+    "của giá vàng thế giới. Tại Hà Nội, các doanh nghiệp kinh doanh vàng "
+    "niêm yết giá mua vào và bán ra cao hơn phiên trước khoảng nửa triệu "
+    "đồng mỗi lượng. Theo các chuyên gia, nhu cầu trú ẩn an toàn tăng lên "
+    "khi thị trường chứng khoán biến động và đồng đô la suy yếu. Ngân hàng "
+    "nhà nước cho biết sẽ tiếp tục theo dõi sát diễn biến thị trường và có "
+    "biện pháp bình ổn khi cần thiết. Người dân được khuyến cáo cân nhắc kỹ "
+    "trước khi mua vàng vào thời điểm giá đang ở mức cao, tránh chạy theo "
+    "tâm lý đám đông và chỉ giao dịch tại các cửa hàng được cấp phép."
+)
+
+OTHER_ARTICLE = (
+    "Đội tuyển bóng đá quốc gia đã có buổi tập đầu tiên trên sân vận động "
+    "Mỹ Đình để chuẩn bị cho trận đấu vòng loại sắp tới. Huấn luyện viên "
+    "trưởng cho biết toàn đội đang có tinh thần tốt, các cầu thủ trẻ được "
+    "kỳ vọng sẽ tạo ra sự khác biệt. Ban tổ chức dự kiến mở bán vé trực "
+    "tuyến từ cuối tuần này và khuyến cáo người hâm mộ không mua vé chợ đen."
+)
+
+
+class NormalizeContentTests(SimpleTestCase):
+    def test_ignores_case_punctuation_and_whitespace(self):
+        self.assertEqual(
+            normalize_content("  Giá VÀNG,  tăng!\n\nMạnh... "),
+            "giá vàng tăng mạnh")
+
+    def test_empty(self):
+        self.assertEqual(normalize_content(''), '')
+        self.assertEqual(normalize_content(None), '')
+
+    def test_content_hash_equal_after_normalization(self):
+        self.assertEqual(content_hash(ARTICLE),
+                         content_hash(ARTICLE.upper().replace(',', ' ,')))
+        self.assertNotEqual(content_hash(ARTICLE), content_hash(OTHER_ARTICLE))
+
+
+class FingerprintableTests(SimpleTestCase):
+    def test_threshold(self):
+        words = ['từ'] * MIN_FINGERPRINT_WORDS
+        self.assertTrue(is_fingerprintable(' '.join(words)))
+        self.assertFalse(is_fingerprintable(' '.join(words[1:])))
+
+    def test_punctuation_is_not_counted(self):
+        text = ' '.join(['từ'] * (MIN_FINGERPRINT_WORDS - 1) + ['...', '!'])
+        self.assertFalse(is_fingerprintable(text))
+
+    def test_empty(self):
+        self.assertFalse(is_fingerprintable(''))
+
+
+class SimhashTests(SimpleTestCase):
+    def test_deterministic(self):
+        self.assertEqual(simhash(ARTICLE), simhash(ARTICLE))
+        self.assertEqual(simhash(''), 0)
+
+    def test_fits_in_64_bits(self):
+        self.assertLess(simhash(ARTICLE), 1 << SIMHASH_BITS)
+        self.assertGreaterEqual(simhash(ARTICLE), 0)
+
+    def test_formatting_changes_keep_fingerprint(self):
+        self.assertEqual(
+            simhash(ARTICLE),
+            simhash(ARTICLE.upper().replace('. ', ' .\n\n')))
+
+    def test_small_edit_is_closer_than_other_article(self):
+        edited = ARTICLE.replace('nửa triệu', 'một triệu')
+        self.assertLess(
+            hamming_distance(simhash(ARTICLE), simhash(edited)),
+            hamming_distance(simhash(ARTICLE), simhash(OTHER_ARTICLE)))
+
+    def test_different_articles_are_far_apart(self):
+        self.assertGreater(
+            hamming_distance(simhash(ARTICLE), simhash(OTHER_ARTICLE)),
+            SIMHASH_MAX_DISTANCE)
+
+
+class SimhashBandTests(SimpleTestCase):
+    def test_bands_rebuild_fingerprint(self):
+        fingerprint = simhash(ARTICLE)
+        bands = simhash_bands(fingerprint)
+        rebuilt = 0
+        for i, band in enumerate(bands):
+            rebuilt |= band << (i * (SIMHASH_BITS // len(bands)))
+        self.assertEqual(rebuilt, fingerprint)
+
+    def test_close_fingerprints_share_a_band(self):
+        # Lệch <= SIMHASH_MAX_DISTANCE bit thì luôn trùng ít nhất một band,
+        # nên tìm ứng viên theo band không bỏ sót bản gần trùng
+        rng = random.Random(0)
+        for _ in range(1000):
+            fingerprint = rng.getrandbits(SIMHASH_BITS)
+            flipped = fingerprint
+            for bit in rng.sample(range(SIMHASH_BITS), SIMHASH_MAX_DISTANCE):
+                flipped ^= 1 << bit
+            self.assertEqual(
+                hamming_distance(fingerprint, flipped), SIMHASH_MAX_DISTANCE)
+            self.assertTrue(any(
+                a == b for a, b in zip(simhash_bands(fingerprint),
+                                       simhash_bands(flipped))))
+
+    def test_signed64_round_trip(self):
+        for value in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+            signed = to_signed64(value)
+            self.assertGreaterEqual(signed, -(1 << 63))
+            self.assertLess(signed, 1 << 63)
+            self.assertEqual(from_signed64(signed), value)
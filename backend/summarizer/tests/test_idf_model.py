@@ -0,0 +1,81 @@
+import os
+import tempfile
+import numpy as np
+from django.test import SimpleTestCase
+from sklearn.feature_extraction.text import TfidfVectorizer
+from summarizer.utils.idf_model import CorpusIDFModel
+
+DOCUMENTS = [
+    ['giá', 'vàng', 'tăng', 'vàng'],
+    ['giá', 'xăng', 'giảm'],
+    ['thời_tiết', 'hà_nội', 'mưa'],
+    ['giá', 'vàng', 'giảm'],
+]
+
+
+class CorpusIDFModelTests(SimpleTestCase):
+    def test_idf_matches_sklearn_smooth_idf(self):
+        model = CorpusIDFModel()
+        model.add_documents(DOCUMENTS)
+
+        vectorizer = TfidfVectorizer(analyzer=lambda tokens: tokens)
+        vectorizer.fit(DOCUMENTS)
+        for term, index in vectorizer.vocabulary_.items():
+            self.assertAlmostEqual(
+                model.idf[model.vocabulary[term]], vectorizer.idf_[index])
+
+    def test_document_frequency_counts_each_document_once(self):
+        model = CorpusIDFModel()
+        self.assertEqual(model.add_documents(DOCUMENTS), len(DOCUMENTS))
+        self.assertEqual(model.n_docs, 4)
+        self.assertEqual(model.df[model.vocabulary['vàng']], 2)
+        self.assertEqual(model.df[model.vocabulary['giá']], 3)
+
+    def test_incremental_update_equals_full_fit(self):
+        full = CorpusIDFModel()
+        full.add_documents(DOCUMENTS)
+
+        incremental = CorpusIDFModel()
+        incremental.add_documents(DOCUMENTS[:2])
+        idf_before = incremental.idf.copy()
+        incremental.add_documents(DOCUMENTS[2:])
+
+        self.assertEqual(incremental.n_docs, full.n_docs)
+        for term in full.terms:
+            self.assertAlmostEqual(
+                incremental.idf_for([term])[0], full.idf_for([term])[0])
+        # idf được tính lại sau khi thêm bài
+        self.assertNotEqual(len(idf_before), len(incremental.idf))
+
+    def test_add_no_documents(self):
+        model = CorpusIDFModel()
+        self.assertEqual(model.add_documents([]), 0)
+        self.assertEqual(model.n_docs, 0)
+
+    def test_unknown_terms_get_highest_idf(self):
+        model = CorpusIDFModel()
+        model.add_documents(DOCUMENTS)
+        idf = model.idf_for(['giá', 'không_có'])
+        self.assertEqual(idf[1], model.unknown_idf)
+        self.assertGreater(idf[1], idf[0])
+        self.assertGreaterEqual(model.unknown_idf, model.idf.max())
+
+    def test_save_and_load(self):
+        model = CorpusIDFModel(last_created_at='2026-01-01T00:00:00+00:00')
+        model.add_documents(DOCUMENTS)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'idf', 'model.joblib')
+            model.save(path)
+            self.assertEqual(os.listdir(os.path.dirname(path)), ['model.joblib'])
+
+            loaded = CorpusIDFModel.load(path)
+            self.assertEqual(loaded.terms, model.terms)
+            self.assertEqual(loaded.n_docs, model.n_docs)
+            self.assertEqual(loaded.last_created_at, model.last_created_at)
+            np.testing.assert_allclose(loaded.idf, model.idf)
+
+            # df được memory-map chỉ đọc nhưng vẫn cập nhật được
+            loaded.add_documents([['giá', 'bạc']])
+            self.assertEqual(loaded.n_docs, model.n_docs + 1)
+            self.assertEqual(loaded.df[loaded.vocabulary['giá']], 4)
+            self.assertEqual(loaded.df[loaded.vocabulary['bạc']], 1)
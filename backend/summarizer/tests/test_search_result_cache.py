@@ -0,0 +1,143 @@
+from unittest.mock import patch
+from django.test import SimpleTestCase
+from summarizer.utils.search_result_cache import (
+    SearchResultCache,
+    cache_key,
+    normalize_query,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakeSearchQuerySet:
+    def __init__(self, ids):
+        self.ids = ids
+        self.count_calls = 0
+
+    def values_list(self, *fields, flat=False):
+        return self.ids
+
+    def count(self):
+        self.count_calls += 1
+        return len(self.ids)
+
+
+class CacheKeyTests(SimpleTestCase):
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query('  Giá   VÀNG\n'), 'giá vàng')
+
+    def test_filters_are_ordered_and_empty_ones_skipped(self):
+        self.assertEqual(
+            cache_key('Vàng', {'source': 'vnexpress', 'category': 'kinh-te',
+                               'date': None}),
+            'vàng|category=kinh-te|source=vnexpress')
+        self.assertEqual(cache_key('vàng', {}), 'vàng')
+
+
+class SearchResultCacheEvictionTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch(
+            'summarizer.utils.search_result_cache.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = SearchResultCache(max_entries=2, ttl=60, max_ids=10)
+
+    def _set(self, key, version=1):
+        self.cache._set(key, version, [key], 1, None)
+
+    def test_get_returns_cached_entry(self):
+        self._set('vàng')
+        self.assertEqual(self.cache._get('vàng', 1), (['vàng'], 1, None))
+
+    def test_version_change_drops_entry(self):
+        self._set('vàng')
+        self.assertIsNone(self.cache._get('vàng', 2))
+        self.assertNotIn('vàng', self.cache._entries)
+
+    def test_entry_expires_after_ttl(self):
+        self._set('vàng')
+        self.clock.now += 59
+        self.assertIsNotNone(self.cache._get('vàng', 1))
+        self.clock.now += 1
+        self.assertIsNone(self.cache._get('vàng', 1))
+
+    def test_evicts_least_frequently_used(self):
+        self._set('vàng')
+        self._set('xăng')
+        self.cache._get('vàng', 1)
+        self.cache._get('vàng', 1)
+        self.cache._get('xăng', 1)
+        self._set('bạc')
+        self.assertEqual(set(self.cache._entries), {'vàng', 'bạc'})
+
+    def test_ties_evict_the_entry_expiring_first(self):
+        self._set('vàng')
+        self.clock.now += 1
+        self._set('xăng')
+        self._set('bạc')
+        self.assertEqual(set(self.cache._entries), {'xăng', 'bạc'})
+
+    def test_expired_entries_are_evicted_before_popular_ones(self):
+        self._set('vàng')
+        for _ in range(5):
+            self.cache._get('vàng', 1)
+        self.clock.now += 30
+        self._set('xăng')
+        self.clock.now += 31
+        # 'vàng' hết hạn dù được dùng nhiều nhất
+        self._set('bạc')
+        self.assertEqual(set(self.cache._entries), {'xăng', 'bạc'})
+
+    def test_overwriting_existing_key_does_not_evict(self):
+        self._set('vàng')
+        self._set('xăng')
+        self._set('vàng')
+        self.assertEqual(set(self.cache._entries), {'vàng', 'xăng'})
+
+
+@patch('summarizer.utils.search_result_cache.current_version', return_value=1)
+class SearchResultCacheGetResultsTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = SearchResultCache(max_entries=10, ttl=60, max_ids=3)
+
+    def test_second_lookup_is_served_from_cache(self, _version):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return FakeSearchQuerySet([1, 2])
+
+        first = self.cache.get_results('Vàng', factory)
+        second = self.cache.get_results(' vàng ', factory)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second.ids, [1, 2])
+        self.assertEqual(first.count(), 2)
+
+    def test_counts_only_when_ids_are_truncated(self, _version):
+        queryset = FakeSearchQuerySet([1, 2, 3, 4, 5])
+        results = self.cache.get_results('vàng', lambda: queryset)
+        self.assertEqual(results.ids, [1, 2, 3])
+        self.assertEqual(results.count(), 5)
+        self.assertEqual(queryset.count_calls, 1)
+
+    def test_filters_are_part_of_the_key(self, _version):
+        self.cache.get_results(
+            'vàng', lambda: FakeSearchQuerySet([1]), filters={'source': 'a'})
+        results = self.cache.get_results(
+            'vàng', lambda: FakeSearchQuerySet([2]), filters={'source': 'b'})
+        self.assertEqual(results.ids, [2])
+
+    def test_no_queryset_returns_none(self, _version):
+        self.assertIsNone(self.cache.get_results('vàng', lambda: None))
+
+    def test_not_cached_without_shared_version(self, version):
+        version.return_value = None
+        self.cache.get_results('vàng', lambda: FakeSearchQuerySet([1]))
+        self.assertEqual(self.cache._entries, {})
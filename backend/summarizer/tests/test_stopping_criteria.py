@@ -0,0 +1,55 @@
+import torch
+from django.test import SimpleTestCase
+from summarizer.summarizers.llama.stopping_criteria import SummaryStoppingCriteria
+
+
+class WordTokenizer:
+    # Tokenizer giả: mỗi token id là một từ
+    def __init__(self, words):
+        self.words = words
+
+    def batch_decode(self, sequences, skip_special_tokens=True):
+        return [' '.join(self.words[int(token_id)] for token_id in sequence)
+                for sequence in sequences]
+
+
+class SummaryStoppingCriteriaTests(SimpleTestCase):
+    def setUp(self):
+        self.tokenizer = WordTokenizer(
+            ['<prompt>', 'Câu', 'hỏi:', 'giá', 'vàng', 'tăng', 'Tóm', 'tắt:'])
+
+    def _stop(self, rows, prompt_length, **kwargs):
+        criteria = SummaryStoppingCriteria(
+            self.tokenizer, prompt_length=prompt_length, **kwargs)
+        return criteria(torch.tensor(rows), scores=None)
+
+    def test_continues_while_summary_is_short(self):
+        result = self._stop([[0, 0, 3, 4, 5]], prompt_length=2)
+        self.assertEqual(result.tolist(), [False])
+
+    def test_stops_at_marker_in_generated_text(self):
+        result = self._stop([[0, 0, 3, 4, 1, 2]], prompt_length=2)
+        self.assertEqual(result.tolist(), [True])
+
+    def test_ignores_marker_inside_prompt(self):
+        # "Tóm tắt:" nằm trong prompt, không phải phần sinh ra
+        result = self._stop([[6, 7, 3, 4]], prompt_length=2)
+        self.assertEqual(result.tolist(), [False])
+
+    def test_stops_at_max_words(self):
+        rows = [[0, 3, 4, 5, 3], [0, 3, 4, 5, 0]]
+        result = self._stop(rows, prompt_length=1, max_words=4)
+        self.assertEqual(result.tolist(), [True, True])
+        result = self._stop(rows, prompt_length=1, max_words=5)
+        self.assertEqual(result.tolist(), [False, False])
+
+    def test_evaluates_each_beam_separately(self):
+        rows = [[0, 3, 4, 5], [0, 3, 1, 2], [0, 6, 7, 3]]
+        result = self._stop(rows, prompt_length=1)
+        self.assertEqual(result.tolist(), [False, True, True])
+        self.assertEqual(result.dtype, torch.bool)
+        self.assertEqual(result.shape, (3,))
+
+    def test_custom_markers(self):
+        result = self._stop([[0, 3, 4]], prompt_length=1, markers=['vàng'])
+        self.assertEqual(result.tolist(), [True])
@@ -0,0 +1,91 @@
+import heapq
+from django.test import SimpleTestCase
+from summarizer.utils.suggest_index import (
+    PRECOMPUTED_PREFIX_LENGTH,
+    TYPE_CATEGORY,
+    TYPE_QUERY,
+    TYPE_TITLE,
+    SuggestIndex,
+    normalize_suggest_key,
+)
+
+
+def _entry(text, item_type, weight):
+    return (normalize_suggest_key(text), text, item_type, weight)
+
+
+ENTRIES = [
+    _entry('Hà Nội', TYPE_CATEGORY, 50),
+    _entry('hà nội mưa lớn', TYPE_QUERY, 120),
+    _entry('hà nội', TYPE_QUERY, 50),
+    _entry('Hà Nội ngập sau mưa lớn', TYPE_TITLE, 1),
+    _entry('Hải Phòng', TYPE_CATEGORY, 50),
+    _entry('giá vàng', TYPE_QUERY, 300),
+    _entry('giá vàng hôm nay', TYPE_QUERY, 80),
+    _entry('Giá vàng tăng mạnh', TYPE_TITLE, 1),
+    _entry('Đà Nẵng', TYPE_CATEGORY, 50),
+] + [
+    # Nhiều tiêu đề cùng tiền tố "ha" để vượt giới hạn top-K tính sẵn
+    _entry(f'Hà Giang tin số {i}', TYPE_TITLE, i % 7) for i in range(40)
+]
+
+
+def _brute_force(entries, prefix, limit):
+    key = normalize_suggest_key(prefix)
+    matches = [entry[1:] for entry in sorted(entries, key=lambda e: e[0])
+               if entry[0].startswith(key)]
+    return [{'text': text, 'type': item_type}
+            for text, item_type, _ in heapq.nlargest(
+                limit, matches, key=SuggestIndex._score)]
+
+
+class NormalizeSuggestKeyTests(SimpleTestCase):
+    def test_strips_accents_case_and_spaces(self):
+        self.assertEqual(normalize_suggest_key('  Hà   Nội '), 'ha noi')
+        self.assertEqual(normalize_suggest_key('Đà Nẵng'), 'da nang')
+
+
+class SuggestIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SuggestIndex(ENTRIES)
+
+    def test_short_prefix_uses_precomputed_top(self):
+        self.assertIn('ha', self.index.top_by_prefix)
+        self.assertLessEqual(len(self.index.top_by_prefix['ha']), 20)
+        self.assertNotIn('ha n', self.index.top_by_prefix)
+
+    def test_short_prefix_matches_brute_force(self):
+        for prefix in ('h', 'Hà', 'gi', 'đ', 'ha ', 'x'):
+            self.assertLessEqual(
+                len(normalize_suggest_key(prefix)), PRECOMPUTED_PREFIX_LENGTH)
+            self.assertEqual(self.index.suggest(prefix),
+                             _brute_force(ENTRIES, prefix, 10), prefix)
+
+    def test_long_prefix_matches_brute_force(self):
+        for prefix in ('ha noi', 'Hà Nội m', 'gia vang', 'ha giang tin so 1',
+                       'hai phong', 'khong co'):
+            self.assertGreater(
+                len(normalize_suggest_key(prefix)), PRECOMPUTED_PREFIX_LENGTH)
+            self.assertEqual(self.index.suggest(prefix, limit=5),
+                             _brute_force(ENTRIES, prefix, 5), prefix)
+
+    def test_ranking(self):
+        # Trọng số trước, cùng trọng số thì truy vấn > danh mục > tiêu đề
+        self.assertEqual(self.index.suggest('ha noi'), [
+            {'text': 'hà nội mưa lớn', 'type': TYPE_QUERY},
+            {'text': 'hà nội', 'type': TYPE_QUERY},
+            {'text': 'Hà Nội', 'type': TYPE_CATEGORY},
+            {'text': 'Hà Nội ngập sau mưa lớn', 'type': TYPE_TITLE},
+        ])
+
+    def test_accent_insensitive(self):
+        self.assertEqual(self.index.suggest('da nang'),
+                         [{'text': 'Đà Nẵng', 'type': TYPE_CATEGORY}])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.suggest('ha giang', limit=3)), 3)
+
+    def test_empty_prefix_and_empty_index(self):
+        self.assertEqual(self.index.suggest('   '), [])
+        self.assertEqual(SuggestIndex().suggest('ha noi'), [])
+        self.assertEqual(len(SuggestIndex()), 0)
@@ -0,0 +1,58 @@
+import uuid
+from types import SimpleNamespace
+from django.test import TestCase
+from summarizer.models import NewsSummary, SummaryFeedback
+# summary_service và summarizers.llama.tasks import vòng lẫn nhau: nạp
+# package llama (-> tasks) trước giống như khi worker khởi động
+from summarizer.summarizers import llama  # noqa: F401
+from summarizer.services.summary_service import SummaryService
+
+
+class SaveSummariesBulkTests(TestCase):
+    def setUp(self):
+        self.service = SummaryService()
+
+    def test_upsert_returns_stored_row(self):
+        article = SimpleNamespace(id=uuid.uuid4())
+        existing = NewsSummary.objects.create(
+            article_id=article.id, summary_text='Tóm tắt cũ',
+            upvotes=3, downvotes=1)
+        SummaryFeedback.objects.create(
+            user_id=uuid.uuid4(), summary_id=existing.id, is_upvote=True)
+
+        saved = self.service.save_summaries_bulk(
+            [(article, 'Tóm tắt mới', {'tokens': 10})])
+
+        summary = saved[article.id]
+        stored = NewsSummary.objects.get(article_id=article.id)
+        self.assertEqual(summary.id, existing.id)
+        self.assertEqual(summary.id, stored.id)
+        self.assertEqual(summary.created_at, stored.created_at)
+        self.assertEqual(stored.summary_text, 'Tóm tắt mới')
+        self.assertEqual((stored.upvotes, stored.downvotes), (0, 0))
+        self.assertFalse(
+            SummaryFeedback.objects.filter(summary_id=existing.id).exists())
+
+    def test_mixed_new_and_existing_articles(self):
+        existing_article = SimpleNamespace(id=uuid.uuid4())
+        new_article = SimpleNamespace(id=uuid.uuid4())
+        existing = NewsSummary.objects.create(
+            article_id=existing_article.id, summary_text='Tóm tắt cũ')
+
+        saved = self.service.save_summaries_bulk([
+            (existing_article, 'Tóm tắt mới', None),
+            (new_article, 'Tóm tắt khác', None),
+        ])
+
+        self.assertEqual(set(saved), {existing_article.id, new_article.id})
+        self.assertEqual(saved[existing_article.id].id, existing.id)
+        self.assertEqual(
+            saved[new_article.id].id,
+            NewsSummary.objects.get(article_id=new_article.id).id)
+
+    def test_save_summary_returns_stored_id(self):
+        article = SimpleNamespace(id=uuid.uuid4())
+        existing = NewsSummary.objects.create(
+            article_id=article.id, summary_text='Tóm tắt cũ')
+        summary = self.service._save_summary(article, 'Tóm tắt mới')
+        self.assertEqual(summary.id, existing.id)
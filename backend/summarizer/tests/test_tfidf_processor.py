@@ -0,0 +1,113 @@
+from unittest.mock import patch
+import numpy as np
+from django.test import SimpleTestCase
+from summarizer.utils.tfidf_processor import TFIDFProcessor
+
+TEXT = (
+    "Giá vàng hôm nay tăng mạnh trên thị trường thế giới. "
+    "Nhà đầu tư đổ xô mua vàng khi giá vàng liên tục lập đỉnh. "
+    "Ngân hàng nhà nước theo dõi sát diễn biến thị trường vàng. "
+    "Thời tiết hôm nay ở Hà Nội có mưa rào. "
+    "Các chuyên gia dự báo giá vàng còn biến động trong tuần tới."
+)
+
+
+def _split_tokenize(text):
+    return text.split()
+
+
+def _split_tokenize_many(texts):
+    return [text.split() for text in texts]
+
+
+def _loop_scores(processor, sentences, tfidf_matrix):
+    # Cách tính điểm cũ (duyệt từng token), dùng làm chuẩn để so sánh
+    feature_names = processor.vectorizer.get_feature_names_out()
+    scores = []
+    for sentence in sentences:
+        score = 0
+        for token in processor._vietnamese_tokenize(sentence):
+            if token in feature_names:
+                token_idx = np.where(feature_names == token)[0]
+                if len(token_idx) > 0:
+                    score += tfidf_matrix[0, token_idx[0]]
+        scores.append(score)
+    return scores
+
+
+@patch('summarizer.utils.tfidf_processor.tokenize_many', _split_tokenize_many)
+@patch('summarizer.utils.tfidf_processor.tokenize', _split_tokenize)
+class SparseScoreTests(SimpleTestCase):
+    def _scores(self, text, max_features=700):
+        processor = TFIDFProcessor()
+        processor.vectorizer.max_features = max_features
+        sentences = [s.strip() + '.' for s in text.split('.') if s.strip()]
+        tfidf_matrix = processor.vectorizer.fit_transform([text])
+        return (processor._score_sentences(sentences, tfidf_matrix),
+                _loop_scores(processor, sentences, tfidf_matrix))
+
+    def test_matches_loop_scores(self):
+        sparse, loop = self._scores(TEXT.lower())
+        np.testing.assert_array_equal(sparse, loop)
+
+    def test_matches_loop_scores_with_tokens_outside_vocabulary(self):
+        # max_features nhỏ: phần lớn token không có trong vocabulary
+        sparse, loop = self._scores(TEXT.lower(), max_features=5)
+        np.testing.assert_array_equal(sparse, loop)
+
+    def test_repeated_token_counts_every_occurrence(self):
+        sparse, loop = self._scores("vàng vàng vàng. bạc. vàng bạc.")
+        np.testing.assert_array_equal(sparse, loop)
+        self.assertGreater(sparse[0], sparse[2])
+
+    def test_sentence_without_known_tokens_scores_zero(self):
+        processor = TFIDFProcessor()
+        tfidf_matrix = processor.vectorizer.fit_transform(["vàng tăng giá"])
+        scores = processor._score_sentences(
+            ["vàng tăng", "không liên quan"], tfidf_matrix)
+        self.assertGreater(scores[0], 0)
+        self.assertEqual(scores[1], 0)
+
+
+class SelectByBudgetTests(SimpleTestCase):
+    def setUp(self):
+        self.processor = TFIDFProcessor()
+        self.sentences = ['a ' * 5, 'b ' * 8, 'c ' * 2, 'd ' * 4]
+
+    @staticmethod
+    def _count_tokens(sentences):
+        return [len(sentence.split()) for sentence in sentences]
+
+    def test_greedy_skips_sentences_over_budget(self):
+        # Thứ tự điểm: 1 (8), 0 (5), 3 (4), 2 (2); ngân sách 11
+        selected = self.processor._select_by_budget(
+            [1, 0, 3, 2], self.sentences, 11, self._count_tokens)
+        self.assertEqual(selected, [1, 2])
+
+    def test_fills_budget_with_lower_ranked_sentences(self):
+        selected = self.processor._select_by_budget(
+            [0, 1, 3, 2], self.sentences, 11, self._count_tokens)
+        self.assertEqual(selected, [0, 3, 2])
+
+    def test_keeps_best_sentence_when_nothing_fits(self):
+        selected = self.processor._select_by_budget(
+            [1, 0, 3, 2], self.sentences, 1, self._count_tokens)
+        self.assertEqual(selected, [1])
+
+    def test_empty_order(self):
+        self.assertEqual(self.processor._select_by_budget(
+            [], [], 10, self._count_tokens), [])
+
+    def test_selected_sentences_keep_original_order(self):
+        sentences = ['Một hai ba.', 'Bốn năm.', 'Sáu bảy tám chín.']
+        with patch('summarizer.utils.tfidf_processor.split_sentences',
+                   return_value=sentences), \
+                patch.object(TFIDFProcessor, '_get_idf_model',
+                             return_value=None), \
+                patch.object(self.processor, 'vectorizer'), \
+                patch.object(TFIDFProcessor, '_score_sentences',
+                             return_value=np.array([1.0, 3.0, 2.0])):
+            result = self.processor.get_important_sentences(
+                'ignored', token_budget=6, count_tokens=self._count_tokens)
+        # Điểm cao nhất là câu 1 rồi câu 2, nhưng kết quả theo thứ tự gốc
+        self.assertEqual(result, 'Bốn năm. Sáu bảy tám chín.')
@@ -2,6 +2,7 @@ from django.urls import path
 from summarizer.views.summary import get_summaries, trigger_bulk_summarization, trigger_single_summarization
 from summarizer.views.summary_detail import ArticleSummaryView, SummaryDetailView
 from .views.search import ArticleSummarySearchView
+from .views.suggest import SearchSuggestView
 from .views.feedback import record_summary_feedback
 
 app_name = 'summarizer'
@@ -23,6 +24,10 @@ urlpatterns = [
         'summaries/search/',
         ArticleSummarySearchView.as_view(),
         name='summary-search'),
+    path(
+        'summaries/search/suggest/',
+        SearchSuggestView.as_view(),
+        name='summary-search-suggest'),
     path(
         'summaries/feedback/',
         record_summary_feedback,
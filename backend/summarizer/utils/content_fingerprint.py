@@ -0,0 +1,84 @@
+import hashlib
+import re
+import unicodedata
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+SIMHASH_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+# Với 4 band 16 bit, hai simhash lệch nhau <= 3 bit chắc chắn trùng ít nhất
+# một band, nên tìm ứng viên bằng so khớp band là đủ.
+SIMHASH_MAX_DISTANCE = 3
+SHINGLE_SIZE = 3
+# Nội dung quá ngắn (hoặc rỗng) cho simhash gần như giống nhau (rỗng -> 0),
+# nên không lấy fingerprint để tránh các bài ngắn "trùng" nhau
+MIN_FINGERPRINT_WORDS = 30
+
+_NON_WORD_RE = re.compile(r'[^\w\s]', flags=re.UNICODE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_content(text: str) -> str:
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFC', text).lower()
+    text = _NON_WORD_RE.sub(' ', text)
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def is_fingerprintable(text: str) -> bool:
+    return len(normalize_content(text).split()) >= MIN_FINGERPRINT_WORDS
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(
+        normalize_content(text).encode('utf-8')).hexdigest()
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _shingles(words: list[str]):
+    if len(words) < SHINGLE_SIZE:
+        yield ' '.join(words)
+        return
+    for i in range(len(words) - SHINGLE_SIZE + 1):
+        yield ' '.join(words[i:i + SHINGLE_SIZE])
+
+
+def simhash(text: str) -> int:
+    words = normalize_content(text).split()
+    if not words:
+        return 0
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in _shingles(words):
+        h = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return ((a ^ b) & ((1 << SIMHASH_BITS) - 1)).bit_count()
+
+
+def simhash_bands(fingerprint: int) -> list[int]:
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+    return [(fingerprint >> (i * SIMHASH_BAND_BITS)) & mask
+            for i in range(SIMHASH_BANDS)]
+
+
+def to_signed64(value: int) -> int:
+    # BigIntegerField của Postgres là số có dấu 64 bit
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def from_signed64(value: int) -> int:
+    return value + (1 << SIMHASH_BITS) if value < 0 else value
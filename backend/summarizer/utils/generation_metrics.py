@@ -0,0 +1,92 @@
+import logging
+from prometheus_client import Counter, Histogram, start_http_server
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+GENERATIONS = Counter(
+    'summarizer_generations_total',
+    'Số lần gọi generate, theo kết quả',
+    ['outcome'])
+REJECTIONS = Counter(
+    'summarizer_rejections_total',
+    'Số bản tóm tắt bị loại, theo lý do',
+    ['reason'])
+CACHE_HITS = Counter(
+    'summarizer_cache_hits_total',
+    'Số bài viết dùng lại bản tóm tắt đã có, không gọi LLM')
+INPUT_TOKENS = Histogram(
+    'summarizer_input_tokens',
+    'Số token đầu vào sau khi nén TF-IDF',
+    buckets=(128, 256, 512, 768, 1024, 1536, 2048, 4096))
+OUTPUT_TOKENS = Histogram(
+    'summarizer_output_tokens',
+    'Số token sinh ra mỗi lần gọi generate',
+    buckets=(16, 32, 64, 96, 128, 192, 256, 512))
+GENERATE_SECONDS = Histogram(
+    'summarizer_generate_seconds',
+    'Thời gian chạy generate (giây)',
+    buckets=(0.5, 1, 2, 4, 8, 15, 30, 60, 120, 300))
+TOKENS_PER_SECOND = Histogram(
+    'summarizer_tokens_per_second',
+    'Tốc độ sinh token',
+    buckets=(1, 2, 5, 10, 20, 40, 80, 160))
+PEAK_MEMORY_BYTES = Histogram(
+    'summarizer_peak_memory_bytes',
+    'Bộ nhớ đỉnh trong lúc generate (GPU) hoặc RSS của tiến trình (CPU)',
+    buckets=tuple(2 ** i * 1024 ** 3 for i in range(-2, 6)))
+
+_server_started = False
+
+
+def new_metrics() -> dict:
+    return {
+        'input_tokens': None,
+        'output_tokens': None,
+        'generate_seconds': None,
+        'tokens_per_second': None,
+        'peak_memory_bytes': None,
+        'device': None,
+        'rejection_reason': None,
+    }
+
+
+def record_generation(metrics: dict):
+    try:
+        if metrics.get('generate_seconds') is not None:
+            GENERATE_SECONDS.observe(metrics['generate_seconds'])
+        if metrics.get('input_tokens') is not None:
+            INPUT_TOKENS.observe(metrics['input_tokens'])
+        if metrics.get('output_tokens') is not None:
+            OUTPUT_TOKENS.observe(metrics['output_tokens'])
+        if metrics.get('tokens_per_second') is not None:
+            TOKENS_PER_SECOND.observe(metrics['tokens_per_second'])
+        if metrics.get('peak_memory_bytes') is not None:
+            PEAK_MEMORY_BYTES.observe(metrics['peak_memory_bytes'])
+
+        reason = metrics.get('rejection_reason')
+        if reason:
+            GENERATIONS.labels(outcome='rejected').inc()
+            REJECTIONS.labels(reason=reason).inc()
+        else:
+            GENERATIONS.labels(outcome='accepted').inc()
+    except Exception as e:
+        logger.warning(f"Không thể ghi metrics cho summarizer: {e}")
+
+
+def record_cache_hit():
+    CACHE_HITS.inc()
+
+
+def start_metrics_server():
+    # Chỉ gọi trong worker GPU; web process không chạy generate
+    global _server_started
+    port = getattr(settings, 'SUMMARIZER_METRICS_PORT', 0)
+    if _server_started or not port:
+        return
+    try:
+        start_http_server(port)
+        _server_started = True
+        logger.info(f"Summarizer metrics được phục vụ tại cổng {port}")
+    except OSError as e:
+        logger.warning(f"Không thể mở cổng metrics {port}: {e}")
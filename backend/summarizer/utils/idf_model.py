@@ -0,0 +1,102 @@
+import os
+import logging
+import tempfile
+from collections import Counter
+import joblib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class CorpusIDFModel:
+    # IDF tính trên toàn bộ kho NewsArticle, cập nhật tăng dần theo bài mới.
+    # df/idf là mảng numpy để có thể memory-map khi load từ joblib.
+
+    def __init__(self, terms=None, df=None, n_docs: int = 0,
+                 last_created_at: str | None = None, idf=None):
+        self.terms = list(terms or [])
+        self.vocabulary = {term: i for i, term in enumerate(self.terms)}
+        self.df = df if df is not None else np.zeros(0, dtype=np.int64)
+        self.n_docs = n_docs
+        self.last_created_at = last_created_at
+        self._idf = idf
+
+    @property
+    def idf(self) -> np.ndarray:
+        # Cùng công thức smooth_idf của sklearn: log((1 + n) / (1 + df)) + 1
+        if self._idf is None:
+            self._idf = np.log((1 + self.n_docs) / (1 + self.df)) + 1
+        return self._idf
+
+    @property
+    def unknown_idf(self) -> float:
+        return float(np.log(1 + self.n_docs) + 1)
+
+    def idf_for(self, terms) -> np.ndarray:
+        idx = np.fromiter(
+            (self.vocabulary.get(term, -1) for term in terms),
+            dtype=np.int64, count=len(terms))
+        known = idx >= 0
+        result = np.full(len(terms), self.unknown_idf)
+        if known.any():
+            result[known] = self.idf[idx[known]]
+        return result
+
+    def add_documents(self, token_lists) -> int:
+        doc_freq = Counter()
+        added = 0
+        for tokens in token_lists:
+            doc_freq.update(set(tokens))
+            added += 1
+        if not added:
+            return 0
+
+        new_terms = [term for term in doc_freq if term not in self.vocabulary]
+        for term in new_terms:
+            self.vocabulary[term] = len(self.terms)
+            self.terms.append(term)
+
+        # df có thể là mảng memory-map chỉ đọc nên luôn tạo bản sao mới
+        df = np.zeros(len(self.terms), dtype=np.int64)
+        df[:len(self.df)] = self.df
+        idx = np.fromiter(
+            (self.vocabulary[term] for term in doc_freq),
+            dtype=np.int64, count=len(doc_freq))
+        df[idx] += np.fromiter(
+            doc_freq.values(), dtype=np.int64, count=len(doc_freq))
+
+        self.df = df
+        self.n_docs += added
+        self._idf = None
+        return added
+
+    def save(self, path: str):
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        # Ghi ra file tạm rồi os.replace để tiến trình đang đọc không thấy
+        # file dở dang
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            joblib.dump({
+                'terms': self.terms,
+                'df': np.asarray(self.df, dtype=np.int64),
+                'idf': np.asarray(self.idf, dtype=np.float64),
+                'n_docs': self.n_docs,
+                'last_created_at': self.last_created_at,
+            }, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'CorpusIDFModel':
+        data = joblib.load(path, mmap_mode='r' if mmap else None)
+        return cls(
+            terms=data['terms'],
+            df=data['df'],
+            n_docs=data['n_docs'],
+            last_created_at=data.get('last_created_at'),
+            idf=data.get('idf'),
+        )
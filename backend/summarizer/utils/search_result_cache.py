@@ -0,0 +1,168 @@
+import logging
+import re
+import threading
+import time
+import unicodedata
+from django.conf import settings
+from summarizer.models import NewsSummary
+
+logger = logging.getLogger(__name__)
+
+# Cache kết quả tìm kiếm trong từng tiến trình web: truy vấn đã chuẩn hoá ->
+# danh sách id đã sắp xếp + tổng số kết quả. Phiên bản dùng chung (cache
+# 'shared', Redis) được tăng mỗi khi có tóm tắt mới để mọi tiến trình bỏ
+# các entry cũ.
+
+VERSION_CACHE_ALIAS = 'shared'
+VERSION_KEY = 'search_results_version'
+
+
+def normalize_query(query: str) -> str:
+    query = unicodedata.normalize('NFC', query)
+    return re.sub(r'\s+', ' ', query).strip().lower()
+
+
+def cache_key(query: str, filters: dict | None = None) -> str:
+    key = normalize_query(query)
+    if filters:
+        key += '|' + '|'.join(
+            f"{name}={filters[name]}" for name in sorted(filters)
+            if filters[name])
+    return key
+
+
+def _version_cache():
+    from django.core.cache import caches
+    return caches[VERSION_CACHE_ALIAS]
+
+
+def current_version() -> int | None:
+    try:
+        return _version_cache().get_or_set(VERSION_KEY, 1, timeout=None)
+    except Exception as e:
+        logger.warning(f"Không thể đọc phiên bản cache tìm kiếm: {e}")
+        return None
+
+
+def bump_version():
+    try:
+        cache = _version_cache()
+        if not cache.add(VERSION_KEY, 2, timeout=None):
+            cache.incr(VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Không thể tăng phiên bản cache tìm kiếm: {e}")
+
+
+class CachedSearchResults:
+    # Dùng được với Paginator: count() trả tổng số kết quả, slice trong phạm
+    # vi id đã cache thì hydrate bằng một truy vấn id__in, ngoài phạm vi thì
+    # chạy lại queryset tìm kiếm.
+
+    def __init__(self, ids: list, total: int, queryset_factory,
+                 facets: dict | None = None):
+        self.ids = ids
+        self.total = total
+        self.queryset_factory = queryset_factory
+        self.facets = facets
+
+    def count(self) -> int:
+        return self.total
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start, stop, _ = index.indices(self.total)
+        if stop <= len(self.ids):
+            page_ids = self.ids[start:stop]
+            summaries = NewsSummary.objects.defer(
+                'search_vector', 'generation_metrics').in_bulk(page_ids)
+            return [summaries[summary_id]
+                    for summary_id in page_ids if summary_id in summaries]
+        return list(self.queryset_factory()[start:stop])
+
+
+class SearchResultCache:
+    # TTL ngắn + loại bỏ kiểu LFU: khi đầy, bỏ các entry hết hạn rồi tới
+    # entry ít được dùng nhất (truy vấn thịnh hành ở lại trong cache).
+
+    def __init__(self, max_entries: int | None = None,
+                 ttl: int | None = None, max_ids: int | None = None):
+        self.max_entries = max_entries or getattr(
+            settings, 'SEARCH_CACHE_MAX_ENTRIES', 500)
+        self.ttl = ttl or getattr(settings, 'SEARCH_CACHE_TTL', 60)
+        self.max_ids = max_ids or getattr(settings, 'SEARCH_CACHE_MAX_IDS', 500)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, version: int):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry['version'] != version or entry['expires_at'] <= now:
+                del self._entries[key]
+                return None
+            entry['hits'] += 1
+            return entry['ids'], entry['total'], entry['facets']
+
+    def _evict(self, now: float):
+        expired = [key for key, entry in self._entries.items()
+                   if entry['expires_at'] <= now]
+        for key in expired:
+            del self._entries[key]
+        while len(self._entries) >= self.max_entries:
+            least_used = min(
+                self._entries,
+                key=lambda key: (self._entries[key]['hits'],
+                                 self._entries[key]['expires_at']))
+            del self._entries[least_used]
+
+    def _set(self, key: str, version: int, ids: list, total: int,
+             facets: dict | None):
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                self._evict(now)
+            self._entries[key] = {
+                'ids': ids,
+                'total': total,
+                'facets': facets,
+                'version': version,
+                'expires_at': now + self.ttl,
+                'hits': 0,
+            }
+
+    def get_results(self, query: str, queryset_factory,
+                    filters: dict | None = None, facets_factory=None):
+        # queryset_factory() trả về queryset tìm kiếm đã sắp xếp (hoặc None);
+        # facets_factory() (nếu có) trả về facet, được cache cùng danh sách id
+        version = current_version()
+        key = cache_key(query, filters)
+
+        cached = self._get(key, version) if version is not None else None
+        if cached is None:
+            queryset = queryset_factory()
+            if queryset is None:
+                return None
+            ids = list(queryset.values_list('id', flat=True)[:self.max_ids])
+            total = len(ids) if len(ids) < self.max_ids else queryset.count()
+            facets = facets_factory() if facets_factory else None
+            if version is not None:
+                self._set(key, version, ids, total, facets)
+        else:
+            ids, total, facets = cached
+            if facets is None and facets_factory:
+                facets = facets_factory()
+
+        return CachedSearchResults(ids, total, queryset_factory, facets)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+search_result_cache = SearchResultCache()
@@ -0,0 +1,173 @@
+import bisect
+import heapq
+import logging
+import re
+import threading
+import time
+import unicodedata
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.db.models import Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Chỉ mục gợi ý tìm kiếm trong bộ nhớ của từng tiến trình web: mảng khoá đã
+# sắp xếp (tiền tố tìm bằng bisect), không truy vấn DB cho mỗi lần gõ phím.
+# Được dựng lại nền sau SUGGEST_REBUILD_SECONDS.
+
+TYPE_QUERY = 'query'
+TYPE_CATEGORY = 'category'
+TYPE_TITLE = 'title'
+
+# Ưu tiên khi trùng điểm: truy vấn phổ biến > danh mục > tiêu đề
+TYPE_PRIORITY = {TYPE_QUERY: 3, TYPE_CATEGORY: 2, TYPE_TITLE: 1}
+CATEGORY_WEIGHT = 50
+# Tiền tố ngắn có rất nhiều kết quả nên top-K được tính sẵn khi dựng
+PRECOMPUTED_PREFIX_LENGTH = 3
+
+
+def normalize_suggest_key(text: str) -> str:
+    # Bỏ dấu + chữ thường để "ha noi" khớp "Hà Nội"
+    text = text.replace('đ', 'd').replace('Đ', 'D')
+    text = unicodedata.normalize('NFD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+class SuggestIndex:
+    def __init__(self, entries=None):
+        # entries: [(key, text, type, weight)]
+        entries = sorted(entries or [], key=lambda entry: entry[0])
+        self.keys = [entry[0] for entry in entries]
+        self.items = [entry[1:] for entry in entries]
+        self.top_by_prefix = {}
+        self._precompute_short_prefixes()
+
+    @staticmethod
+    def _score(item):
+        text, item_type, weight = item
+        return (weight, TYPE_PRIORITY[item_type], -len(text))
+
+    def _precompute_short_prefixes(self, limit: int = 20):
+        buckets = {}
+        for key, item in zip(self.keys, self.items):
+            for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1):
+                if len(key) >= length:
+                    buckets.setdefault(key[:length], []).append(item)
+        self.top_by_prefix = {
+            prefix: heapq.nlargest(limit, items, key=self._score)
+            for prefix, items in buckets.items()}
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[dict]:
+        key = normalize_suggest_key(prefix)
+        if not key:
+            return []
+        if len(key) <= PRECOMPUTED_PREFIX_LENGTH:
+            matches = self.top_by_prefix.get(key, [])
+        else:
+            start = bisect.bisect_left(self.keys, key)
+            end = bisect.bisect_left(self.keys, key + '\uffff', lo=start)
+            matches = self.items[start:end]
+        return [
+            {'text': text, 'type': item_type}
+            for text, item_type, _ in heapq.nlargest(
+                limit, matches, key=self._score)]
+
+    def __len__(self):
+        return len(self.keys)
+
+
+def build_suggest_entries() -> list[tuple]:
+    from news.models import Category, NewsArticle
+    from user.models import SearchQueryDailyStat
+
+    entries = {}
+
+    def _add(text, item_type, weight):
+        if not text or not text.strip():
+            return
+        text = re.sub(r'\s+', ' ', text).strip()
+        key = normalize_suggest_key(text)
+        current = entries.get((key, item_type))
+        if current is None or current[3] < weight:
+            entries[(key, item_type)] = (key, text, item_type, weight)
+
+    # Truy vấn phổ biến lấy từ bảng thống kê theo ngày (rollup_search_queries)
+    # thay vì group by trên toàn bộ SearchHistory; chỉ gợi ý truy vấn có kết quả
+    since = timezone.localdate() - timedelta(
+        days=getattr(settings, 'SUGGEST_QUERY_DAYS', 30))
+    popular_queries = (
+        SearchQueryDailyStat.objects.filter(day__gte=since, has_results=True)
+        .values('query')
+        .annotate(total=Sum('search_count'))
+        .order_by('-total')[:getattr(settings, 'SUGGEST_MAX_QUERIES', 5000)])
+    for row in popular_queries:
+        _add(row['query'], TYPE_QUERY, row['total'])
+
+    for name in Category.objects.values_list('name', flat=True):
+        _add(name, TYPE_CATEGORY, CATEGORY_WEIGHT)
+
+    titles = (
+        NewsArticle.objects.order_by('-published_at')
+        .values_list('title', flat=True)[
+            :getattr(settings, 'SUGGEST_MAX_TITLES', 20000)])
+    for title in titles:
+        _add(title, TYPE_TITLE, 1)
+
+    return list(entries.values())
+
+
+class SuggestIndexHolder:
+    # Giữ chỉ mục hiện tại; khi quá hạn thì dựng lại trong thread nền và
+    # tiếp tục trả lời bằng chỉ mục cũ.
+
+    def __init__(self):
+        self._index = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+        self._rebuilding = False
+
+    def _rebuild(self, close_connection: bool = False):
+        try:
+            start_time = time.perf_counter()
+            index = SuggestIndex(build_suggest_entries())
+            with self._lock:
+                self._index = index
+                self._built_at = time.monotonic()
+            logger.info(
+                f"SuggestIndex: Đã dựng {len(index)} mục trong {time.perf_counter() - start_time:.2f}s")
+        except Exception as e:
+            logger.error(f"SuggestIndex: Lỗi khi dựng chỉ mục: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._rebuilding = False
+            if close_connection:
+                # Thread nền có kết nối DB riêng
+                connection.close()
+
+    def get_index(self) -> SuggestIndex:
+        max_age = getattr(settings, 'SUGGEST_REBUILD_SECONDS', 600)
+        with self._lock:
+            index = self._index
+            stale = (index is None
+                     or time.monotonic() - self._built_at > max_age)
+            start_rebuild = stale and not self._rebuilding
+            if start_rebuild:
+                self._rebuilding = True
+
+        if start_rebuild:
+            if index is None:
+                # Lần đầu: dựng đồng bộ
+                self._rebuild()
+                with self._lock:
+                    index = self._index
+            else:
+                threading.Thread(
+                    target=self._rebuild, kwargs={'close_connection': True},
+                    daemon=True).start()
+        return index or SuggestIndex()
+
+
+suggest_index_holder = SuggestIndexHolder()
@@ -1,63 +1,170 @@
+import os
+import re
 import logging
+from collections import Counter
 from sklearn.feature_extraction.text import TfidfVectorizer
-from underthesea import word_tokenize
+from underthesea import sent_tokenize
 import numpy as np
+from scipy.sparse import csr_matrix
+from django.conf import settings
+from summarizer.utils.idf_model import CorpusIDFModel
+from news.utils.vietnamese_tokenizer import tokenize, tokenize_many
 
 logger = logging.getLogger(__name__)
 
 
+def vietnamese_tokenize(text):
+    return tokenize(text)
+
+
+def split_sentences(text: str) -> list[str]:
+    # Tách đoạn theo dòng trống rồi tách câu bằng underthesea, tránh cắt
+    # nhầm ở số thập phân (3.5%) hay viết tắt (TP.HCM) như khi split('.')
+    sentences = []
+    for paragraph in re.split(r'\n+', text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        try:
+            parts = sent_tokenize(paragraph)
+        except Exception as e:
+            logger.error(f"Lỗi khi tách câu: {str(e)}")
+            parts = [part + '.' for part in paragraph.split('.')]
+        sentences.extend(part.strip() for part in parts if part.strip(' .'))
+    return sentences
+
+
 class TFIDFProcessor:
-    def __init__(self):
+    def __init__(self, idf_model_path: str | None = None):
         self.vectorizer = TfidfVectorizer(
             tokenizer=self._vietnamese_tokenize,
             max_features=700,
             token_pattern=None,
             ngram_range=(1, 2)
         )
+        self.idf_model_path = idf_model_path or getattr(
+            settings, 'SUMMARIZER_IDF_MODEL_PATH', None)
+        self._idf_model = None
+        self._idf_model_mtime = None
 
     def _vietnamese_tokenize(self, text):
+        return vietnamese_tokenize(text)
+
+    def _get_idf_model(self) -> CorpusIDFModel | None:
+        # Load lại khi file model được refresh (so sánh mtime)
+        if not self.idf_model_path:
+            return None
         try:
-            return word_tokenize(text, format="text").split()
-        except Exception as e:
-            logger.error(f"Lỗi khi tokenize văn bản: {str(e)}")
-            return text.split()
+            mtime = os.path.getmtime(self.idf_model_path)
+        except OSError:
+            return None
+        if self._idf_model is None or mtime != self._idf_model_mtime:
+            try:
+                self._idf_model = CorpusIDFModel.load(self.idf_model_path)
+                self._idf_model_mtime = mtime
+                logger.info(
+                    f"Đã load IDF model ({len(self._idf_model.terms)} từ, {self._idf_model.n_docs} bài viết).")
+            except Exception as e:
+                logger.error(f"Không thể load IDF model: {str(e)}")
+                return self._idf_model
+        return self._idf_model
 
-    def get_important_sentences(self, text, num_sentences=10):
+    def _score_sentences(self, sentences, tfidf_matrix):
+        vocabulary = self.vectorizer.vocabulary_
+        indices, indptr = [], [0]
+        for sentence_tokens in tokenize_many(sentences):
+            for token in sentence_tokens:
+                token_idx = vocabulary.get(token)
+                if token_idx is not None:
+                    indices.append(token_idx)
+            indptr.append(len(indices))
+
+        # Ma trận thưa câu x từ, mỗi lần xuất hiện của token là một phần tử
+        # (không gộp trùng) theo đúng thứ tự trong câu, để phép nhân cộng
+        # điểm theo cùng thứ tự như cách tính cũ và cho kết quả giống hệt.
+        sentence_term = csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(len(sentences), len(vocabulary)))
+        weights = tfidf_matrix.toarray().ravel()
+        return sentence_term @ weights
+
+    def _score_sentences_with_corpus_idf(self, sentences, idf_model):
+        # Chỉ transform: mỗi câu được tokenize một lần, TF của văn bản được
+        # cộng từ các câu, IDF lấy từ model đã fit trên toàn bộ kho bài viết.
+        token_lists = [
+            [token.lower() for token in sentence_tokens]
+            for sentence_tokens in tokenize_many(sentences)]
+        term_counts = Counter(
+            token for tokens in token_lists for token in tokens)
+        local_vocabulary = {term: i for i, term in enumerate(term_counts)}
+
+        terms = list(term_counts)
+        weights = np.fromiter(
+            (term_counts[term] for term in terms),
+            dtype=np.float64, count=len(terms)) * idf_model.idf_for(terms)
+
+        indices = [local_vocabulary[token]
+                   for tokens in token_lists for token in tokens]
+        indptr = np.cumsum([0] + [len(tokens) for tokens in token_lists])
+        sentence_term = csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape=(len(sentences), len(terms)))
+        return sentence_term @ weights
+
+    def _select_by_budget(self, order, sentences, token_budget,
+                          count_tokens):
+        # Greedy: lấy lần lượt các câu điểm cao nhất còn vừa ngân sách token
+        lengths = count_tokens(sentences)
+        selected = []
+        used_tokens = 0
+        for i in order:
+            if used_tokens + lengths[i] <= token_budget:
+                selected.append(i)
+                used_tokens += lengths[i]
+        if not selected and order:
+            # Câu quan trọng nhất cũng vượt ngân sách: để tokenizer cắt bớt
+            selected = [order[0]]
+        return selected
+
+    def get_important_sentences(self, text, num_sentences=10,
+                                token_budget: int | None = None,
+                                count_tokens=None):
+        # Nếu có token_budget và count_tokens (hàm nhận list câu, trả về số
+        # token của từng câu theo tokenizer của LLM) thì chọn câu theo ngân
+        # sách token thay vì cố định num_sentences câu.
         try:
-            # Tách câu
-            sentences = text.split('.')
-            sentences = [s.strip() for s in sentences if s.strip()]
+            sentences = split_sentences(text)
 
             if not sentences:
                 return text
 
-            # Tính TF-IDF cho toàn bộ văn bản
-            tfidf_matrix = self.vectorizer.fit_transform([text])
-            feature_names = self.vectorizer.get_feature_names_out()
-
-            # Tính điểm cho từng câu
-            sentence_scores = []
-            for sentence in sentences:
-                sentence_tokens = self._vietnamese_tokenize(sentence)
-                score = 0
-                for token in sentence_tokens:
-                    if token in feature_names:
-                        token_idx = np.where(feature_names == token)[0]
-                        if len(token_idx) > 0:
-                            score += tfidf_matrix[0, token_idx[0]]
-                sentence_scores.append((sentence, score))
+            idf_model = self._get_idf_model()
+            if idf_model is not None:
+                scores = self._score_sentences_with_corpus_idf(
+                    sentences, idf_model)
+            else:
+                # Chưa có IDF model: fit TF-IDF trên chính văn bản
+                tfidf_matrix = self.vectorizer.fit_transform([text])
+
+                # Tính điểm cho từng câu: ma trận thưa câu x từ nhân với
+                # vector trọng số TF-IDF của văn bản
+                scores = self._score_sentences(sentences, tfidf_matrix)
 
             # Sắp xếp câu theo điểm số
-            sentence_scores.sort(key=lambda x: x[1], reverse=True)
+            order = sorted(
+                range(len(sentences)), key=lambda i: scores[i], reverse=True)
 
-            # Lấy top N câu quan trọng nhất
-            important_sentences = [s[0]
-                                   for s in sentence_scores[:num_sentences]]
+            if token_budget and count_tokens:
+                selected = self._select_by_budget(
+                    order, sentences, token_budget, count_tokens)
+            else:
+                # Lấy top N câu quan trọng nhất
+                selected = order[:num_sentences]
 
             # Sắp xếp lại các câu theo thứ tự xuất hiện trong văn bản gốc
-            important_sentences.sort(key=lambda x: text.find(x))
+            selected.sort()
 
-            return '. '.join(important_sentences) + '.'
+            return ' '.join(sentences[i] for i in selected)
 
         except Exception as e:
             logger.error(f"Lỗi khi xử lý TF-IDF: {str(e)}")
@@ -68,7 +68,7 @@ def record_summary_feedback(request):
         if trigger_resummarize:
             try:
                 summarize_single_article_task.delay(
-                    article_id_str=str(summary_obj.article_id))
+                    article_id_str=str(summary_obj.article_id), redo=True)
             except Exception as task_error:
                 logger.error(
                     f"View: Lỗi khi trigger summarize_single_article_task cho article {summary_obj.article_id}: {task_error}")
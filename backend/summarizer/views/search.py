@@ -1,13 +1,16 @@
 # backend/summarizer/views/search.py
 import logging
+import uuid
+from django.utils.dateparse import parse_date
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from news.models import NewsArticle
 from summarizer.serializers.serializers import SummarySerializer
 from news.utils.pagination import StandardResultsSetPagination
+from news.utils.summary_utils import build_summary_context
 from summarizer.summarizers.search_controller import search_controller
+from summarizer.utils.search_result_cache import search_result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,25 @@ class ArticleSummarySearchView(APIView):
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
 
+    def _parse_filters(self, request):
+        # ?category=<uuid>&source=<uuid>&date_from=YYYY-MM-DD&date_to=YYYY-MM-DD
+        filters = {}
+        for param, name in (('category', 'category_id'), ('source', 'source_id')):
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    filters[name] = uuid.UUID(value)
+                except ValueError:
+                    raise ValueError(f"Invalid '{param}' parameter.")
+        for param in ('date_from', 'date_to'):
+            value = request.query_params.get(param)
+            if value:
+                parsed = parse_date(value)
+                if parsed is None:
+                    raise ValueError(f"Invalid '{param}' parameter, expected YYYY-MM-DD.")
+                filters[param] = parsed
+        return filters
+
     def get(self, request, *args, **kwargs):
         query_param = request.query_params.get('q', None)
 
@@ -28,27 +50,37 @@ class ArticleSummarySearchView(APIView):
         query = query_param.strip()
 
         try:
-            summary_queryset = search_controller.search_summaries_interface(
-                query)
+            filters = self._parse_filters(request)
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            # Trang trong phạm vi id đã cache chỉ tốn một truy vấn id__in;
+            # facet được tính một lần và cache cùng danh sách id
+            summary_queryset = search_result_cache.get_results(
+                query,
+                lambda: search_controller.search_summaries_interface(
+                    query, filters),
+                filters=filters,
+                facets_factory=lambda: search_controller.search_facets_interface(
+                    query, filters))
 
             paginator = self.pagination_class()
             paginated_summaries = paginator.paginate_queryset(
                 summary_queryset, request, view=self)
 
-            articles_dict = {}
-            if paginated_summaries:
-                article_ids = {
-                    summary.article_id for summary in paginated_summaries}
-                articles_queryset = NewsArticle.objects.filter(
-                    id__in=article_ids)
-                articles_dict = {
-                    str(article.id): article for article in articles_queryset}
-
-            serializer_context = {'articles': articles_dict}
+            serializer_context = build_summary_context(
+                paginated_summaries, request=request)
             serializer = SummarySerializer(
                 paginated_summaries, many=True, context=serializer_context)
 
-            return paginator.get_paginated_response(serializer.data)
+            response = paginator.get_paginated_response(serializer.data)
+            response.data['facets'] = getattr(
+                summary_queryset, 'facets', None)
+            return response
 
         except Exception as e:
             logger.error(
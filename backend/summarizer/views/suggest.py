@@ -0,0 +1,27 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from summarizer.utils.suggest_index import suggest_index_holder
+
+logger = logging.getLogger(__name__)
+
+MAX_SUGGESTIONS = 20
+
+
+class SearchSuggestView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '')
+        try:
+            limit = min(int(request.query_params.get('limit', 10)),
+                        MAX_SUGGESTIONS)
+        except ValueError:
+            limit = 10
+
+        if not query.strip() or limit <= 0:
+            return Response({'query': query, 'suggestions': []})
+
+        suggestions = suggest_index_holder.get_index().suggest(query, limit)
+        return Response({'query': query, 'suggestions': suggestions})
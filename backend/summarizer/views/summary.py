@@ -8,7 +8,7 @@ from summarizer.serializers.serializers import SummarySerializer
 from summarizer.services.article_service import ArticleService
 from summarizer.summarizers.llama.tasks import generate_article_summaries, summarize_single_article_task
 import logging
-from news.utils.summary_utils import get_articles_for_summaries
+from news.utils.summary_utils import build_summary_context
 
 logger = logging.getLogger(__name__)
 
@@ -44,13 +44,9 @@ def get_summaries(request):
         paginator = StandardResultsSetPagination()
         paginated_summaries = paginator.paginate_queryset(queryset, request)
 
-        articles_dict = get_articles_for_summaries(paginated_summaries)
-
-        # Truyền thêm request vào context
-        serializer_context = {
-            'articles': articles_dict,
-            'request': request
-        }
+        # Nạp trước bài viết, vote, số bình luận, danh mục cho cả trang
+        serializer_context = build_summary_context(
+            paginated_summaries, request=request)
         serializer = SummarySerializer(
             paginated_summaries,
             many=True,
@@ -1,5 +1,6 @@
 from rest_framework import generics, permissions
 from news.models import NewsArticle
+from news.utils.summary_utils import build_summary_context
 from summarizer.models import NewsSummary
 from summarizer.serializers.serializers import SummarySerializer
 from summarizer.summarizers.summay_detail_controller import summary_detail_controller
@@ -19,6 +20,7 @@ class SummaryDetailView(generics.RetrieveAPIView):
         try:
             summary = summary_detail_controller.get_summary_detail_interface(
                 summary_id)
+            self.summary = summary
             return summary
         except Exception as e:
             logger.error(
@@ -28,22 +30,19 @@ class SummaryDetailView(generics.RetrieveAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        try:
-            summary = self.get_object()
-            if summary and summary.article_id:
-                try:
-                    article = NewsArticle.objects.get(id=summary.article_id)
-                    context['articles'] = {str(summary.article_id): article}
-                except NewsArticle.DoesNotExist:
-                    logger.warning(
-                        f"SummaryDetailView: Article {summary.article_id} not found for summary {summary.id}")
-                    context['articles'] = {}
-            else:
-                context['articles'] = {}
-        except Exception:
-            context['articles'] = {}
-            pass
-        context['request'] = self.request
+        # Dùng lại tóm tắt đã lấy trong get_object thay vì truy vấn lại
+        summary = getattr(self, 'summary', None)
+        articles = {}
+        if summary and summary.article_id:
+            try:
+                article = NewsArticle.objects.get(id=summary.article_id)
+                articles = {str(summary.article_id): article}
+            except NewsArticle.DoesNotExist:
+                logger.warning(
+                    f"SummaryDetailView: Article {summary.article_id} not found for summary {summary.id}")
+        context.update(build_summary_context(
+            [summary] if summary else [], request=self.request,
+            articles=articles))
         return context
 
 
@@ -58,6 +57,7 @@ class ArticleSummaryView(generics.RetrieveAPIView):
         try:
             summary, article = summary_detail_controller.get_article_summary_interface(
                 article_id)
+            self.summary = summary
             self.article = article
             return summary
         except Exception as e:
@@ -68,10 +68,10 @@ class ArticleSummaryView(generics.RetrieveAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
+        summary = getattr(self, 'summary', None)
         article = getattr(self, 'article', None)
-        if article:
-            context['articles'] = {str(article.id): article}
-        else:
-            context['articles'] = {}
-        context['request'] = self.request
+        articles = {str(article.id): article} if article else {}
+        context.update(build_summary_context(
+            [summary] if summary else [], request=self.request,
+            articles=articles))
         return context
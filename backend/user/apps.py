@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user'
+
+    def ready(self):
+        # Đăng ký signal xoá cache thông tin cơ bản của người dùng
+        from user import signals  # noqa: F401
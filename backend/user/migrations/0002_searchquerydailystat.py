@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-19 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchQueryDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('query', models.CharField(max_length=255)),
+                ('search_count', models.IntegerField(default=0)),
+                ('unique_users', models.IntegerField(default=0)),
+                ('has_results', models.BooleanField(default=True)),
+                ('last_event_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['day', '-search_count'], name='user_search_day_f27350_idx'), models.Index(fields=['last_event_at'], name='user_search_last_ev_590e70_idx')],
+                'unique_together': {('day', 'query')},
+            },
+        ),
+    ]
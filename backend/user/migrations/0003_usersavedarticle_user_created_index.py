@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0002_searchquerydailystat'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersavedarticle',
+            index=models.Index(fields=['user_id', '-created_at'], name='user_usersa_user_id_2d2370_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import BaseUserManager, AbstractBaseUser, PermissionsMixin
 
 
@@ -44,6 +46,16 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'username'
     REQUIRED_FIELDS = ['email']
 
+    class Meta:
+        indexes = [
+            # Tìm username/email theo tiền tố không phân biệt hoa thường
+            # (filter admin)
+            GinIndex(OpClass(Upper('username'), name='gin_trgm_ops'),
+                     name='user_username_trgm'),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'),
+                     name='user_email_trgm'),
+        ]
+
     def __str__(self):
         return self.username
 
@@ -56,6 +68,10 @@ class UserSavedArticle(models.Model):
 
     class Meta:
         unique_together = ('user_id', 'article_id')
+        indexes = [
+            # Phân trang bookmark theo con trỏ created_at của từng người dùng
+            models.Index(fields=['user_id', '-created_at']),
+        ]
 
 
 class UserPreference(models.Model):
@@ -72,3 +88,29 @@ class SearchHistory(models.Model):
     searched_at = models.DateTimeField(auto_now_add=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+
+class SearchQueryDailyStat(models.Model):
+    # Tổng hợp SearchHistory theo ngày (xem SearchAnalyticsService)
+    day = models.DateField()
+    query = models.CharField(max_length=255)
+    search_count = models.IntegerField(default=0)
+    unique_users = models.IntegerField(default=0)
+    has_results = models.BooleanField(default=True)
+    last_event_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('day', 'query')
+        indexes = [
+            models.Index(fields=['day', '-search_count']),
+            models.Index(fields=['last_event_at']),
+        ]
+
+
+class SearchRollupState(models.Model):
+    # Mốc thời gian (updated_at của SearchHistory) đã được rollup tới
+    name = models.CharField(max_length=100, unique=True)
+    watermark = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
@@ -1,9 +1,18 @@
 from rest_framework import serializers
-from news.models import NewsArticle, NewsSource, Comment
+from news.models import NewsArticle, Comment
+from news.utils.lookup_cache import lookup_cache
 from summarizer.models import NewsSummary
 from user.models import User
 
 
+def _article_title(obj):
+    # Annotate sẵn bằng Subquery trong danh sách admin, còn lại thì truy vấn
+    if hasattr(obj, 'article_title'):
+        return obj.article_title
+    return NewsArticle.objects.filter(id=obj.article_id).values_list(
+        'title', flat=True).first()
+
+
 class AdminUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -39,13 +48,12 @@ class AdminArticleSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'updated_at')
 
     def get_source_name(self, obj):
-        try:
-            source = NewsSource.objects.get(id=obj.source_id)
-            return source.name
-        except NewsSource.DoesNotExist:
-            return None
+        return lookup_cache.source_name(obj.source_id)
 
     def get_has_summary(self, obj):
+        # Danh sách admin annotate sẵn has_summary (AdminService.get_all_articles)
+        if hasattr(obj, 'has_summary'):
+            return obj.has_summary
         try:
             return NewsSummary.objects.filter(article_id=obj.id).exists()
         except Exception:
@@ -70,11 +78,7 @@ class AdminSummarySerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'updated_at')
 
     def get_article_title(self, obj):
-        try:
-            article = NewsArticle.objects.get(id=obj.article_id)
-            return article.title
-        except NewsArticle.DoesNotExist:
-            return None
+        return _article_title(obj)
 
 
 class AdminCommentSerializer(serializers.ModelSerializer):
@@ -95,18 +99,14 @@ class AdminCommentSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'updated_at')
 
     def get_username(self, obj):
-        try:
-            user = User.objects.get(id=obj.user_id)
-            return user.username
-        except User.DoesNotExist:
-            return None
+        # Annotate sẵn bằng Subquery trong AdminService.get_all_comments
+        if hasattr(obj, 'username'):
+            return obj.username
+        return User.objects.filter(id=obj.user_id).values_list(
+            'username', flat=True).first()
 
     def get_article_title(self, obj):
-        try:
-            article = NewsArticle.objects.get(id=obj.article_id)
-            return article.title
-        except NewsArticle.DoesNotExist:
-            return None
+        return _article_title(obj)
 
 
 class AdminFavoriteWordSerializer(serializers.Serializer):
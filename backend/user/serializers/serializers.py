@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from news.models import NewsArticle, Category, NewsArticleCategory
+from news.models import NewsArticle, Category
+from news.utils.lookup_cache import lookup_cache
 from user.models import UserPreference, User, UserSavedArticle, SearchHistory
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.password_validation import validate_password
@@ -120,11 +121,11 @@ class BookmarkedArticleSerializer(serializers.ModelSerializer):
             'categories']
 
     def get_categories(self, obj):
-        category_ids = NewsArticleCategory.objects.filter(
-            article_id=obj.id).values_list(
-            'category_id', flat=True)
-        categories = Category.objects.filter(id__in=category_ids)
-
+        article_categories = self.context.get('article_categories')
+        if article_categories is None:
+            article_categories = lookup_cache.categories_for_articles(
+                [obj.id])
+        categories = article_categories.get(str(obj.id), [])
         return CategorySerializer(categories, many=True).data
 
 
@@ -136,11 +137,15 @@ class UserBookmarkSerializer(serializers.ModelSerializer):
         fields = ['article']
 
     def get_article(self, obj):
-        try:
-            article = NewsArticle.objects.get(id=obj.article_id)
-            return BookmarkedArticleSerializer(article).data
-        except NewsArticle.DoesNotExist:
+        # Danh sách bookmark truyền sẵn 'articles' trong context
+        articles = self.context.get('articles')
+        if articles is not None:
+            article = articles.get(str(obj.article_id))
+        else:
+            article = NewsArticle.objects.filter(id=obj.article_id).first()
+        if article is None:
             return None
+        return BookmarkedArticleSerializer(article, context=self.context).data
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
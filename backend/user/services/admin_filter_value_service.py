@@ -0,0 +1,136 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Subquery
+from news.models import ArticleStats, Comment, NewsArticle
+from news.utils.lookup_cache import lookup_cache
+from summarizer.models import NewsSummary
+from user.models import User
+
+TOP_VALUES_CACHE_PREFIX = 'admin_filter_top:'
+
+
+class InvalidFilterFieldError(ValueError):
+    pass
+
+
+def _unique(values) -> list:
+    return list(dict.fromkeys(value for value in values if value))
+
+
+def _article_titles(article_ids) -> list:
+    return _unique(NewsArticle.objects.filter(
+        id__in=Subquery(article_ids)).values_list('title', flat=True))
+
+
+def _search_scope(resource: str, field: str):
+    # Chỉ gợi ý giá trị thực sự xuất hiện trong resource đang lọc
+    if field == 'article_title':
+        related = NewsSummary if resource == 'summaries' else Comment
+        return Exists(related.objects.filter(article_id=OuterRef('pk')))
+    if resource == 'comments' and field == 'username':
+        return Exists(Comment.objects.filter(user_id=OuterRef('pk')))
+    return None
+
+
+class AdminFilterValueService:
+    # Giá trị cho dropdown filter ở trang admin:
+    #   - không có tham số: top-K giá trị cho mỗi trường (cache ngắn hạn)
+    #   - ?field=&q=&cursor=: tìm theo tiền tố (index trigram trên UPPER(cột))
+    #     và phân trang keyset theo chính giá trị đó
+
+    # resource -> {khoá trong response: trường tìm kiếm}
+    RESOURCE_FIELDS = {
+        'users': {'usernames': 'username', 'emails': 'email'},
+        'articles': {'titles': 'title', 'sources': 'source_name'},
+        'summaries': {'article_titles': 'article_title'},
+        'comments': {'usernames': 'username', 'article_titles': 'article_title'},
+    }
+
+    # trường tìm kiếm -> (model, cột); source_name dùng lookup_cache
+    SEARCH_COLUMNS = {
+        'username': (User, 'username'),
+        'email': (User, 'email'),
+        'title': (NewsArticle, 'title'),
+        'article_title': (NewsArticle, 'title'),
+    }
+
+    def __init__(self):
+        self.top_k = getattr(settings, 'ADMIN_FILTER_TOP_K', 100)
+
+    def _top_values(self, resource: str) -> dict:
+        k = self.top_k
+        if resource == 'users':
+            recent_users = User.objects.only(
+                'username', 'email').order_by('-created_at')[:k]
+            return {
+                'usernames': [user.username for user in recent_users],
+                'emails': [user.email for user in recent_users],
+            }
+        if resource == 'articles':
+            return {
+                'titles': _unique(
+                    NewsArticle.objects.order_by('-published_at')
+                    .values_list('title', flat=True)[:k]),
+                'sources': lookup_cache.source_names(),
+            }
+        if resource == 'summaries':
+            return {
+                'article_titles': _article_titles(
+                    NewsSummary.objects.order_by('-created_at')
+                    .values('article_id')[:k]),
+            }
+        if resource == 'comments':
+            # Người bình luận gần đây và bài viết nhiều bình luận nhất
+            return {
+                'usernames': _unique(User.objects.filter(
+                    id__in=Subquery(
+                        Comment.objects.order_by('-created_at')
+                        .values('user_id')[:k])
+                ).values_list('username', flat=True)),
+                'article_titles': _article_titles(
+                    ArticleStats.objects.filter(comment_count__gt=0)
+                    .order_by('-comment_count').values('article_id')[:k]),
+            }
+        raise InvalidFilterFieldError(f"Resource không hợp lệ: {resource}")
+
+    def get_top_values(self, resource: str) -> dict:
+        key = f"{TOP_VALUES_CACHE_PREFIX}{resource}"
+        values = cache.get(key)
+        if values is None:
+            values = self._top_values(resource)
+            cache.set(
+                key, values,
+                timeout=getattr(settings, 'ADMIN_FILTER_CACHE_TTL', 300))
+        return values
+
+    def search_values(self, resource: str, field: str, query: str = '',
+                      cursor: str | None = None, limit: int = 20) -> dict:
+        if field not in self.RESOURCE_FIELDS.get(resource, {}).values():
+            raise InvalidFilterFieldError(
+                f"Trường filter không hợp lệ: {field}")
+        query = (query or '').strip()
+
+        if field == 'source_name':
+            names = [name for name in lookup_cache.source_names()
+                     if name.upper().startswith(query.upper())
+                     and (cursor is None or name > cursor)]
+        else:
+            model, column = self.SEARCH_COLUMNS[field]
+            queryset = model.objects.all()
+            scope = _search_scope(resource, field)
+            if scope is not None:
+                queryset = queryset.filter(scope)
+            if query:
+                queryset = queryset.filter(**{f'{column}__istartswith': query})
+            if cursor is not None:
+                queryset = queryset.filter(**{f'{column}__gt': cursor})
+            names = list(
+                queryset.order_by(column).values_list(column, flat=True)
+                .distinct()[:limit + 1])
+
+        values = names[:limit]
+        return {
+            'field': field,
+            'values': values,
+            'next_cursor': values[-1] if len(names) > limit else None,
+        }
@@ -1,7 +1,9 @@
 from news.models import NewsArticle, NewsSource, ArticleStats, Comment
+from news.utils.lookup_cache import lookup_cache
 from summarizer.models import NewsSummary
+from summarizer.utils.search_result_cache import bump_version as bump_search_cache_version
 from user.models import User, UserPreference
-from django.db.models import Sum
+from django.db.models import Exists, F, OuterRef, Subquery, Sum
 from django.utils import timezone
 from datetime import timedelta
 
@@ -116,17 +118,35 @@ class AdminService:
         except User.DoesNotExist:
             return None
 
+    @staticmethod
+    def _article_title_subquery():
+        return Subquery(
+            NewsArticle.objects.filter(id=OuterRef('article_id')).values(
+                'title')[:1])
+
+    @staticmethod
+    def _order_by_annotation(queryset, ordering):
+        # Sắp xếp theo cột annotate ngay trong SQL để phân trang vẫn dùng
+        # LIMIT/OFFSET; giá trị rỗng đứng đầu khi tăng dần như cách cũ
+        field = ordering.lstrip('-')
+        if ordering.startswith('-'):
+            return queryset.order_by(
+                F(field).desc(nulls_last=True), '-created_at')
+        return queryset.order_by(F(field).asc(nulls_first=True), '-created_at')
+
     def get_all_articles(self, filters=None, ordering=None):
         """Lấy danh sách tất cả bài viết"""
-        queryset = NewsArticle.objects.all()
+        # has_summary tính bằng Exists ngay trong truy vấn danh sách
+        queryset = NewsArticle.objects.annotate(
+            has_summary=Exists(
+                NewsSummary.objects.filter(article_id=OuterRef('id'))))
 
         if filters:
             if 'title' in filters:
                 queryset = queryset.filter(title__in=filters['title'])
             if 'source_name' in filters:
-                source_ids = NewsSource.objects.filter(
-                    name__in=filters['source_name']).values_list(
-                    'id', flat=True)
+                source_ids = lookup_cache.source_ids_by_names(
+                    filters['source_name'])
                 queryset = queryset.filter(source_id__in=source_ids)
 
         # Áp dụng sắp xếp nếu có
@@ -140,13 +160,11 @@ class AdminService:
             field = ordering.lstrip('-')
             if field == 'source_name':
                 # Xử lý sắp xếp theo tên nguồn
-                source_ids = NewsSource.objects.values_list('id', 'name')
-                source_dict = dict(source_ids)
-                queryset = list(queryset)
-                reverse = ordering.startswith('-')
-                queryset.sort(
-                    key=lambda x: source_dict.get(
-                        x.source_id, ''), reverse=reverse)
+                queryset = self._order_by_annotation(
+                    queryset.annotate(source_name=Subquery(
+                        NewsSource.objects.filter(
+                            id=OuterRef('source_id')).values('name')[:1])),
+                    ordering)
             elif field in valid_fields:
                 queryset = queryset.order_by(ordering)
             else:
@@ -158,7 +176,9 @@ class AdminService:
 
     def get_all_summaries(self, filters=None, ordering=None):
         """Lấy danh sách tất cả tóm tắt"""
-        queryset = NewsSummary.objects.all()
+        queryset = NewsSummary.objects.defer(
+            'search_vector', 'generation_metrics').annotate(
+                article_title=self._article_title_subquery())
 
         if filters:
             if 'article_title' in filters:
@@ -172,14 +192,8 @@ class AdminService:
             valid_fields = ['upvotes', 'downvotes', 'created_at', 'updated_at']
             field = ordering.lstrip('-')
             if field == 'article_title':
-                # Xử lý sắp xếp theo tiêu đề bài viết
-                article_ids = NewsArticle.objects.values_list('id', 'title')
-                article_dict = dict(article_ids)
-                queryset = list(queryset)
-                reverse = ordering.startswith('-')
-                queryset.sort(
-                    key=lambda x: article_dict.get(
-                        x.article_id, ''), reverse=reverse)
+                # Xử lý sắp xếp theo tiêu đề bài viết (cột annotate)
+                queryset = self._order_by_annotation(queryset, ordering)
             elif field in valid_fields:
                 queryset = queryset.order_by(ordering)
             else:
@@ -194,6 +208,7 @@ class AdminService:
         try:
             article = NewsArticle.objects.get(id=article_id)
             article.delete()
+            bump_search_cache_version()
             return True
         except NewsArticle.DoesNotExist:
             return False
@@ -203,13 +218,18 @@ class AdminService:
         try:
             summary = NewsSummary.objects.get(id=summary_id)
             summary.delete()
+            bump_search_cache_version()
             return True
         except NewsSummary.DoesNotExist:
             return False
 
     def get_all_comments(self, filters=None, ordering=None):
         """Lấy danh sách tất cả bình luận"""
-        queryset = Comment.objects.all()
+        queryset = Comment.objects.annotate(
+            username=Subquery(
+                User.objects.filter(id=OuterRef('user_id')).values(
+                    'username')[:1]),
+            article_title=self._article_title_subquery())
 
         if filters:
             if 'username' in filters:
@@ -227,24 +247,9 @@ class AdminService:
         if ordering:
             valid_fields = ['created_at', 'updated_at']
             field = ordering.lstrip('-')
-            if field == 'username':
-                # Xử lý sắp xếp theo username
-                user_ids = User.objects.values_list('id', 'username')
-                user_dict = dict(user_ids)
-                queryset = list(queryset)
-                reverse = ordering.startswith('-')
-                queryset.sort(
-                    key=lambda x: user_dict.get(
-                        x.user_id, ''), reverse=reverse)
-            elif field == 'article_title':
-                # Xử lý sắp xếp theo tiêu đề bài viết
-                article_ids = NewsArticle.objects.values_list('id', 'title')
-                article_dict = dict(article_ids)
-                queryset = list(queryset)
-                reverse = ordering.startswith('-')
-                queryset.sort(
-                    key=lambda x: article_dict.get(
-                        x.article_id, ''), reverse=reverse)
+            if field in ('username', 'article_title'):
+                # Xử lý sắp xếp theo username / tiêu đề bài viết (cột annotate)
+                queryset = self._order_by_annotation(queryset, ordering)
             elif field in valid_fields:
                 queryset = queryset.order_by(ordering)
             else:
@@ -1,5 +1,6 @@
 from django.core.exceptions import ObjectDoesNotExist
 from news.models import NewsArticle, ArticleStats
+from news.utils.lookup_cache import lookup_cache
 from user.models import UserSavedArticle
 from rest_framework import status
 from rest_framework.exceptions import APIException
@@ -77,6 +78,29 @@ class BookmarkService:
     def get_user_bookmarks(user_id: str) -> List[UserSavedArticle]:
         return UserSavedArticle.objects.filter(user_id=user_id)
 
+    @staticmethod
+    def get_bookmarked_article_ids(user_id: str) -> list:
+        # Chỉ id bài viết (không hydrate) để client biết bài nào đã lưu mà
+        # không phải tải hết các trang bookmark
+        return list(UserSavedArticle.objects.filter(
+            user_id=user_id).values_list('article_id', flat=True))
+
+    @staticmethod
+    def get_bookmark_context(bookmarks) -> dict:
+        # Context cho UserBookmarkSerializer: bài viết của cả trang trong một
+        # truy vấn IN, danh mục qua lookup_cache (liên kết nạp bằng một truy
+        # vấn IN cho các bài chưa có trong cache)
+        article_ids = {bookmark.article_id for bookmark in bookmarks}
+        if not article_ids:
+            return {'articles': {}, 'article_categories': {}}
+        articles = NewsArticle.objects.filter(id__in=article_ids).only(
+            'id', 'title', 'url', 'published_at', 'image_url')
+        return {
+            'articles': {str(article.id): article for article in articles},
+            'article_categories': lookup_cache.categories_for_articles(
+                article_ids),
+        }
+
 
 def add_bookmark(user_id: str, article_id: str):
     if not NewsArticle.objects.filter(id=article_id).exists():
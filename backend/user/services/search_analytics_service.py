@@ -0,0 +1,149 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Sum
+from django.utils import timezone
+from summarizer.models import NewsSummary
+from summarizer.services.search_service import build_search_queries
+from summarizer.utils.search_result_cache import normalize_query
+from user.models import SearchHistory, SearchQueryDailyStat, SearchRollupState
+
+logger = logging.getLogger(__name__)
+
+
+ROLLUP_NAME = 'search_queries'
+
+
+class SearchAnalyticsService:
+    # SearchHistory chỉ giữ một dòng cho mỗi (user, query) và được
+    # update_or_create mỗi lần tìm kiếm, nên mỗi dòng có updated_at trong
+    # khoảng [watermark, mốc mới) được tính là một lượt tìm kiếm vào ngày
+    # searched_at. Mốc mới = lúc rollup trừ SEARCH_ROLLUP_LAG_SECONDS để các
+    # transaction ghi SearchHistory đang dở kịp commit trước khi bị vượt qua.
+    # unique_users cộng dồn theo từng lần rollup nên là giá trị gần đúng
+    # (một người tìm lại cùng truy vấn trong ngày ở hai lần rollup khác nhau
+    # được tính hai lần); SearchHistory không giữ đủ lịch sử để tính lại.
+
+    def _has_results(self, query: str) -> bool:
+        search_query, _ = build_search_queries(query)
+        return NewsSummary.objects.filter(search_vector=search_query).exists()
+
+    def _lock_state(self) -> SearchRollupState:
+        state, _ = SearchRollupState.objects.select_for_update().get_or_create(
+            name=ROLLUP_NAME)
+        return state
+
+    def rollup(self, chunk_size: int = 5000) -> dict:
+        upper = timezone.now() - timedelta(
+            seconds=getattr(settings, 'SEARCH_ROLLUP_LAG_SECONDS', 300))
+
+        # Khoá dòng trạng thái suốt lần rollup để hai lần chạy song song
+        # không cộng trùng
+        with transaction.atomic():
+            state = self._lock_state()
+            if state.watermark is not None and upper <= state.watermark:
+                return {'events': 0, 'rows': 0}
+            histories = SearchHistory.objects.only(
+                'user_id', 'query', 'searched_at', 'updated_at'
+            ).filter(updated_at__lt=upper).order_by('updated_at', 'id')
+            if state.watermark is not None:
+                histories = histories.filter(updated_at__gte=state.watermark)
+            else:
+                # Lần đầu sau khi có bảng trạng thái: tiếp tục từ mốc cũ
+                # (last_event_at lớn nhất đã rollup)
+                legacy_watermark = SearchQueryDailyStat.objects.aggregate(
+                    last=Max('last_event_at'))['last']
+                if legacy_watermark:
+                    histories = histories.filter(
+                        updated_at__gt=legacy_watermark)
+
+            result = self._rollup_histories(histories, chunk_size)
+            state.watermark = upper
+            state.save(update_fields=['watermark', 'updated_at'])
+        return result
+
+    def _rollup_histories(self, histories, chunk_size: int) -> dict:
+        # (ngày, truy vấn chuẩn hoá) -> [số lượt, tập user, updated_at lớn nhất]
+        buckets = {}
+        events = 0
+        for history in histories.iterator(chunk_size=chunk_size):
+            query = normalize_query(history.query)
+            if not query:
+                continue
+            day = timezone.localtime(history.searched_at).date()
+            bucket = buckets.setdefault((day, query), [0, set(), None])
+            bucket[0] += 1
+            bucket[1].add(history.user_id)
+            bucket[2] = history.updated_at
+            events += 1
+
+        if not buckets:
+            return {'events': 0, 'rows': 0}
+
+        has_results = {query: self._has_results(query)
+                       for query in {query for _, query in buckets}}
+
+        with transaction.atomic():
+            existing = {
+                (stat.day, stat.query): stat
+                for stat in SearchQueryDailyStat.objects.select_for_update().filter(
+                    day__in={day for day, _ in buckets},
+                    query__in={query for _, query in buckets})}
+
+            now = timezone.now()
+            to_create = []
+            to_update = []
+            for (day, query), (count, users, last_event_at) in buckets.items():
+                stat = existing.get((day, query))
+                if stat is None:
+                    to_create.append(SearchQueryDailyStat(
+                        day=day,
+                        query=query,
+                        search_count=count,
+                        unique_users=len(users),
+                        has_results=has_results[query],
+                        last_event_at=last_event_at))
+                else:
+                    stat.search_count += count
+                    stat.unique_users += len(users)
+                    stat.has_results = has_results[query]
+                    stat.last_event_at = max(stat.last_event_at, last_event_at)
+                    stat.updated_at = now
+                    to_update.append(stat)
+
+            SearchQueryDailyStat.objects.bulk_create(
+                to_create, batch_size=chunk_size)
+            SearchQueryDailyStat.objects.bulk_update(
+                to_update,
+                ['search_count', 'unique_users', 'has_results',
+                 'last_event_at', 'updated_at'],
+                batch_size=chunk_size)
+
+        logger.info(
+            f"SearchAnalyticsService: Rollup {events} lượt tìm kiếm vào {len(buckets)} dòng thống kê.")
+        return {'events': events, 'rows': len(buckets)}
+
+    def _recent_stats(self, days: int):
+        since = timezone.localdate() - timedelta(days=days - 1)
+        return SearchQueryDailyStat.objects.filter(day__gte=since)
+
+    def top_queries(self, days: int = 7, limit: int = 20) -> list[dict]:
+        return list(
+            self._recent_stats(days)
+            .values('query')
+            .annotate(
+                total_searches=Sum('search_count'),
+                total_users=Sum('unique_users'))
+            .order_by('-total_searches', 'query')[:limit])
+
+    def zero_result_queries(self, days: int = 7,
+                            limit: int = 20) -> list[dict]:
+        return list(
+            self._recent_stats(days)
+            .filter(has_results=False)
+            .values('query')
+            .annotate(
+                total_searches=Sum('search_count'),
+                total_users=Sum('unique_users'))
+            .order_by('-total_searches', 'query')[:limit])
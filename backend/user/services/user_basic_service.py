@@ -0,0 +1,68 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from user.models import User
+
+logger = logging.getLogger(__name__)
+
+# Thông tin cơ bản của tác giả bình luận (id, username, avatar) được cache
+# theo user id ở cache 'shared' để mọi tiến trình dùng chung và để signal
+# xoá được khi người dùng đổi hồ sơ.
+
+CACHE_ALIAS = 'shared'
+KEY_PREFIX = 'user_basic:'
+
+
+def _cache():
+    from django.core.cache import caches
+    return caches[CACHE_ALIAS]
+
+
+def _cache_key(user_id) -> str:
+    return f"{KEY_PREFIX}{user_id}"
+
+
+def get_user_basics(user_ids) -> dict:
+    # {str(user_id): {'id', 'username', 'avatar'}}; user không tồn tại thì
+    # không có khoá. Phần chưa có trong cache nạp bằng một truy vấn id__in.
+    keys = {_cache_key(user_id): str(user_id) for user_id in user_ids if user_id}
+    if not keys:
+        return {}
+
+    basics = {}
+    try:
+        for key, value in _cache().get_many(list(keys)).items():
+            basics[keys[key]] = value
+    except Exception as e:
+        logger.warning(f"Không thể đọc cache thông tin người dùng: {e}")
+
+    missing = [user_id for user_id in keys.values() if user_id not in basics]
+    if missing:
+        loaded = {
+            str(user_id): {
+                'id': str(user_id),
+                'username': username,
+                'avatar': avatar}
+            for user_id, username, avatar in User.objects.filter(
+                id__in=missing).values_list('id', 'username', 'avatar')}
+        basics.update(loaded)
+        if loaded:
+            try:
+                _cache().set_many(
+                    {_cache_key(user_id): value
+                     for user_id, value in loaded.items()},
+                    timeout=getattr(settings, 'USER_BASIC_CACHE_TTL', 3600))
+            except Exception as e:
+                logger.warning(f"Không thể ghi cache thông tin người dùng: {e}")
+    return basics
+
+
+def invalidate_user_basic(user_id):
+    def _delete():
+        try:
+            _cache().delete(_cache_key(user_id))
+        except Exception as e:
+            logger.warning(
+                f"Không thể xoá cache thông tin người dùng {user_id}: {e}")
+
+    transaction.on_commit(_delete)
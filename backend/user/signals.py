@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from user.models import User
+from user.services.user_basic_service import invalidate_user_basic
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_basic_cache(sender, instance, update_fields=None, **kwargs):
+    # Đăng nhập chỉ cập nhật last_login, không đổi username/avatar
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_user_basic(instance.id)
@@ -67,3 +67,13 @@ def send_password_reset_email(recipient_email, reset_link):
         return "Password reset email sent successfully!"
     except Exception as e:
         raise
+
+
+@shared_task
+def rollup_search_queries():
+    from user.services.search_analytics_service import SearchAnalyticsService
+    try:
+        return SearchAnalyticsService().rollup()
+    except Exception as exc:
+        logger.error(f"Task rollup_search_queries failed: {exc}", exc_info=True)
+        return {'error': str(exc)}
@@ -1,7 +1,7 @@
 from django.urls import path
 from user.views.user_preference import UserFavoriteKeywordsView
 from user.views.search_history import UserSearchHistoryView
-from user.views.bookmark import UserBookmarkView
+from user.views.bookmark import UserBookmarkIdsView, UserBookmarkView
 from .views.user_registration import UserRegistrationView
 from .views.password_reset import RequestPasswordResetView, PasswordResetConfirmView
 from .views.profile import UserProfileView
@@ -10,7 +10,7 @@ from .views.admin_views import (
     AdminDashboardView, AdminCrawlView, AdminSummarizeView,
     AdminUserManagementView, AdminArticleManagementView,
     AdminSummaryManagementView, AdminCommentManagementView,
-    AdminFavoriteWordManagementView
+    AdminFavoriteWordManagementView, AdminSearchAnalyticsView
 )
 
 
@@ -24,6 +24,8 @@ urlpatterns = [
         UserSearchHistoryView.as_view(),
         name='search-history'),
     path('bookmarks/', UserBookmarkView.as_view(), name='user-bookmarks'),
+    path('bookmarks/ids/', UserBookmarkIdsView.as_view(),
+         name='user-bookmark-ids'),
     path('register/', UserRegistrationView.as_view(), name='user-register'),
     path('request-password-reset/',
          RequestPasswordResetView.as_view(),
@@ -95,6 +97,10 @@ urlpatterns = [
         'admin/comments/<uuid:comment_id>/',
         AdminCommentManagementView.as_view(),
         name='admin-comment-detail'),
+    path(
+        'admin/search-analytics/',
+        AdminSearchAnalyticsView.as_view(),
+        name='admin-search-analytics'),
     path(
         'admin/fav-words/',
         AdminFavoriteWordManagementView.as_view(),
@@ -63,3 +63,17 @@ class BookmarkController:
             return BookmarkService.get_user_bookmarks(user_id)
         except Exception as e:
             raise BookmarkException(f"Lỗi khi lấy danh sách bookmark: {e}")
+
+    @staticmethod
+    def get_bookmarked_article_ids(user_id: str) -> list:
+        try:
+            return BookmarkService.get_bookmarked_article_ids(user_id)
+        except Exception as e:
+            raise BookmarkException(f"Lỗi khi lấy danh sách bookmark: {e}")
+
+    @staticmethod
+    def get_bookmark_context(bookmarks) -> dict:
+        try:
+            return BookmarkService.get_bookmark_context(bookmarks)
+        except Exception as e:
+            raise BookmarkException(f"Lỗi khi lấy danh sách bookmark: {e}")
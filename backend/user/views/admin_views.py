@@ -4,6 +4,10 @@ from rest_framework import status
 from rest_framework.permissions import IsAdminUser
 from rest_framework.pagination import PageNumberPagination
 from user.services.admin_service import AdminService
+from user.services.search_analytics_service import SearchAnalyticsService
+from user.services.admin_filter_value_service import (
+    AdminFilterValueService, InvalidFilterFieldError
+)
 from user.serializers.admin_serializers import (
     AdminUserSerializer, AdminArticleSerializer,
     AdminSummarySerializer,
@@ -12,8 +16,6 @@ from user.serializers.admin_serializers import (
 from crawler.crawlers.crawl_baomoi_controller.tasks import crawl_baomoi_articles
 from crawler.crawlers.crawl_vnexpress_controller.tasks import crawl_vnexpress_articles
 from summarizer.summarizers.llama.tasks import generate_article_summaries
-from news.models import NewsArticle, NewsSource
-from user.models import User
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -44,6 +46,27 @@ class AdminBaseView(APIView):
     def paginate_queryset(self, queryset):
         return self.paginator.paginate_queryset(queryset, self.request)
 
+    def filter_values_response(self, resource):
+        """Giá trị cho filter: top-K đã cache, hoặc tìm theo tiền tố có phân trang"""
+        filter_value_service = AdminFilterValueService()
+        field = self.request.query_params.get('field')
+        try:
+            if not field:
+                return Response(filter_value_service.get_top_values(resource))
+            limit = min(max(int(self.request.query_params.get('limit', 20)), 1), 100)
+            return Response(filter_value_service.search_values(
+                resource,
+                field,
+                query=self.request.query_params.get('q', ''),
+                cursor=self.request.query_params.get('cursor'),
+                limit=limit))
+        except (InvalidFilterFieldError, ValueError) as e:
+            return Response({'error': str(e)},
+                            status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({'error': str(e)},
+                            status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 
 class AdminDashboardView(AdminBaseView):
     def get(self, request):
@@ -96,19 +119,7 @@ class AdminUserManagementView(AdminBaseView):
     def get(self, request):
         """Lấy danh sách người dùng"""
         if request.path.endswith('filter-values/'):
-            try:
-                # Lấy tất cả các giá trị cho filter
-                usernames = User.objects.values_list(
-                    'username', flat=True).distinct()
-                emails = User.objects.values_list(
-                    'email', flat=True).distinct()
-                return Response({
-                    'usernames': list(usernames),
-                    'emails': list(emails)
-                })
-            except Exception as e:
-                return Response({'error': str(e)},
-                                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return self.filter_values_response('users')
 
         filters = {}
         for key in ['username', 'email']:
@@ -172,19 +183,7 @@ class AdminArticleManagementView(AdminBaseView):
     def get(self, request):
         """Lấy danh sách bài viết"""
         if request.path.endswith('filter-values/'):
-            try:
-                # Lấy tất cả các giá trị cho filter
-                titles = NewsArticle.objects.values_list(
-                    'title', flat=True).distinct()
-                sources = NewsSource.objects.values_list(
-                    'name', flat=True).distinct()
-                return Response({
-                    'titles': list(titles),
-                    'sources': list(sources)
-                })
-            except Exception as e:
-                return Response({'error': str(e)},
-                                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return self.filter_values_response('articles')
 
         filters = {}
         for key in ['title', 'source_name']:
@@ -215,16 +214,7 @@ class AdminSummaryManagementView(AdminBaseView):
     def get(self, request):
         """Lấy danh sách tóm tắt"""
         if request.path.endswith('filter-values/'):
-            try:
-                # Lấy tất cả các giá trị cho filter
-                article_titles = NewsArticle.objects.values_list(
-                    'title', flat=True).distinct()
-                return Response({
-                    'article_titles': list(article_titles)
-                })
-            except Exception as e:
-                return Response({'error': str(e)},
-                                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return self.filter_values_response('summaries')
 
         filters = {}
         if request.query_params.get('article_title'):
@@ -255,19 +245,7 @@ class AdminCommentManagementView(AdminBaseView):
     def get(self, request):
         """Lấy danh sách bình luận"""
         if request.path.endswith('filter-values/'):
-            try:
-                # Lấy tất cả các giá trị cho filter
-                usernames = User.objects.values_list(
-                    'username', flat=True).distinct()
-                article_titles = NewsArticle.objects.values_list(
-                    'title', flat=True).distinct()
-                return Response({
-                    'usernames': list(usernames),
-                    'article_titles': list(article_titles)
-                })
-            except Exception as e:
-                return Response({'error': str(e)},
-                                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return self.filter_values_response('comments')
 
         filters = {}
         for key in ['username', 'article_title']:
@@ -325,3 +303,25 @@ class AdminFavoriteWordManagementView(AdminBaseView):
         except Exception as e:
             return Response({'error': str(e)},
                             status=status.HTTP_400_BAD_REQUEST)
+
+
+class AdminSearchAnalyticsView(AdminBaseView):
+    def get(self, request):
+        """Truy vấn tìm kiếm phổ biến và truy vấn không có kết quả"""
+        try:
+            days = max(int(request.query_params.get('days', 7)), 1)
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response({'error': 'days và limit phải là số nguyên'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        analytics_service = SearchAnalyticsService()
+        return Response({
+            'days': days,
+            'top_queries': analytics_service.top_queries(days, limit),
+            'zero_result_queries': analytics_service.zero_result_queries(
+                days, limit),
+            # total_users cộng dồn unique_users của từng lần rollup nên có
+            # thể tính một người nhiều lần
+            'total_users_is_approximate': True,
+        })
@@ -7,10 +7,12 @@ from user.serializers.serializers import (
 )
 from user.user.bookmark_controller.bookmark_controller import BookmarkController
 from rest_framework.exceptions import APIException
+from news.utils.pagination import BookmarkCursorPagination
 
 
 class UserBookmarkView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = BookmarkCursorPagination
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -23,9 +25,16 @@ class UserBookmarkView(generics.GenericAPIView):
         try:
             user_id = request.user.id
             bookmarks = BookmarkController.get_bookmarks(user_id)
-            serializer = UserBookmarkSerializer(bookmarks, many=True)
+            # Phân trang theo con trỏ created_at, bài viết và danh mục của
+            # cả trang được nạp một lần
+            page = self.paginate_queryset(bookmarks)
+            serializer = UserBookmarkSerializer(
+                page, many=True,
+                context=BookmarkController.get_bookmark_context(page))
             return Response({
                 "items": serializer.data,
+                "next": self.paginator.get_next_link(),
+                "previous": self.paginator.get_previous_link(),
                 "status": "success"
             }, status=status.HTTP_200_OK)
         except APIException as e:
@@ -92,3 +101,29 @@ class UserBookmarkView(generics.GenericAPIView):
             "error": serializer.errors,
             "status": "error"
         }, status=status.HTTP_400_BAD_REQUEST)
+
+
+class UserBookmarkIdsView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        """Id các bài viết đã lưu, dùng cho trạng thái "đã lưu" ở danh sách tin"""
+        try:
+            article_ids = BookmarkController.get_bookmarked_article_ids(
+                request.user.id)
+            return Response({
+                "article_ids": article_ids,
+                "status": "success"
+            }, status=status.HTTP_200_OK)
+        except APIException as e:
+            return Response({
+                "error": e.detail,
+                "article_ids": [],
+                "status": "error"
+            }, status=e.status_code)
+        except Exception as e:
+            return Response({
+                "error": "Lỗi hệ thống khi lấy bookmark.",
+                "article_ids": [],
+                "status": "error"
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
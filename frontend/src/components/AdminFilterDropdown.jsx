@@ -0,0 +1,118 @@
+import React, { useState, useEffect, useRef } from 'react';
+import { Input, Button, Checkbox, Space, Spin, Empty } from 'antd';
+import { SearchOutlined } from '@ant-design/icons';
+import axiosInstance from '../services/axiosInstance';
+
+const SEARCH_DELAY_MS = 300;
+
+// Dropdown filter cho bảng admin: khi chưa gõ gì hiển thị top-K giá trị,
+// khi gõ thì tìm theo tiền tố trên server (?field=&q=) và tải thêm theo cursor
+const AdminFilterDropdown = ({
+  resource,
+  field,
+  topValues = [],
+  setSelectedKeys,
+  selectedKeys,
+  confirm,
+  clearFilters
+}) => {
+  const [query, setQuery] = useState('');
+  const [values, setValues] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const requestId = useRef(0);
+
+  const searchValues = async (searchQuery, cursor = null) => {
+    const currentRequest = ++requestId.current;
+    setLoading(true);
+    try {
+      const params = { field, q: searchQuery };
+      if (cursor) params.cursor = cursor;
+      const response = await axiosInstance.get(
+        `/user/admin/${resource}/filter-values/`, { params });
+      // Bỏ kết quả của request cũ nếu người dùng đã gõ tiếp
+      if (currentRequest !== requestId.current) return;
+      setValues(prev => (cursor ? [...prev, ...response.data.values] : response.data.values));
+      setNextCursor(response.data.next_cursor);
+    } catch (error) {
+      console.error('Error searching filter values:', error);
+    } finally {
+      if (currentRequest === requestId.current) setLoading(false);
+    }
+  };
+
+  useEffect(() => {
+    if (!query.trim()) {
+      requestId.current++;
+      setValues([]);
+      setNextCursor(null);
+      setLoading(false);
+      return undefined;
+    }
+    const timer = setTimeout(() => searchValues(query.trim()), SEARCH_DELAY_MS);
+    return () => clearTimeout(timer);
+  }, [query, resource, field]);
+
+  const options = query.trim() ? values : topValues;
+
+  const toggleValue = (value, checked) => {
+    setSelectedKeys(checked
+      ? [...selectedKeys, value]
+      : selectedKeys.filter(key => key !== value));
+  };
+
+  const handleReset = () => {
+    setQuery('');
+    if (clearFilters) clearFilters();
+    confirm();
+  };
+
+  return (
+    <div style={{ padding: 8, width: 280 }} onKeyDown={(e) => e.stopPropagation()}>
+      <Input
+        placeholder="Tìm kiếm..."
+        prefix={<SearchOutlined />}
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+        allowClear
+        style={{ marginBottom: 8 }}
+      />
+      <div style={{ maxHeight: 240, overflowY: 'auto', marginBottom: 8 }}>
+        {options.length === 0 && !loading ? (
+          <Empty image={Empty.PRESENTED_IMAGE_SIMPLE} description="Không có giá trị" />
+        ) : (
+          options.map(value => (
+            <div key={value} style={{ padding: '2px 0' }}>
+              <Checkbox
+                checked={selectedKeys.includes(value)}
+                onChange={(e) => toggleValue(value, e.target.checked)}
+              >
+                {value}
+              </Checkbox>
+            </div>
+          ))
+        )}
+        {loading && (
+          <div style={{ textAlign: 'center', padding: 8 }}>
+            <Spin size="small" />
+          </div>
+        )}
+        {nextCursor && !loading && (
+          <Button type="link" size="small" block onClick={() => searchValues(query.trim(), nextCursor)}>
+            Tải thêm
+          </Button>
+        )}
+      </div>
+      <Space style={{ display: 'flex', justifyContent: 'space-between' }}>
+        <Button size="small" onClick={handleReset}>
+          Đặt lại
+        </Button>
+        <Button type="primary" size="small" onClick={() => confirm()}>
+          Lọc
+        </Button>
+      </Space>
+    </div>
+  );
+};
+
+export default AdminFilterDropdown;
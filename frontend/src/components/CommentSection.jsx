@@ -13,7 +13,11 @@ const CommentSection = ({
   onNewCommentChange, 
   onSubmitComment, 
   isSubmitting, 
-  fetchComments
+  fetchComments,
+  totalCount,
+  hasMore = false,
+  onLoadMore,
+  isLoadingMore = false
 }) => {
   const { message: messageApi, modal: modalApi } = App.useApp();
   const { isAuthenticated } = useAuth();
@@ -88,7 +92,7 @@ const CommentSection = ({
   return (
     <div>
         <List
-        header={<Text strong>{`${comments.length} bình luận`}</Text>}
+        header={<Text strong>{`${Math.max(totalCount || 0, comments.length)} bình luận`}</Text>}
         itemLayout="horizontal"
         dataSource={comments}
         locale={{ emptyText: 'Chưa có bình luận nào' }}
@@ -139,6 +143,13 @@ const CommentSection = ({
                 </List.Item>
             );
         }}
+        loadMore={hasMore && (
+          <div style={{ textAlign: 'center', margin: '12px 0' }}>
+            <Button onClick={onLoadMore} loading={isLoadingMore}>
+              Xem thêm bình luận
+            </Button>
+          </div>
+        )}
         />
       <TextArea
         rows={3}
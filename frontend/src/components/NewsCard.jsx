@@ -11,6 +11,13 @@ import { addDownvote, removeDownvote, confirmDownvote } from '../store/slices/us
 const { Meta } = Card;
 const { Text } = Typography;
 
+const mapComment = (comment) => ({
+  id: comment.id,
+  content: comment.content,
+  created_at: comment.created_at,
+  user: comment.user
+});
+
 const formatDate = (dateString) => {
   if (!dateString) return null;
   try {
@@ -59,6 +66,9 @@ const NewsCard = ({
   const [comments, setComments] = useState([]);
   const [newComment, setNewComment] = useState('');
   const [isCommentsLoading, setIsCommentsLoading] = useState(false);
+  // Bình luận được phân trang theo con trỏ: URL trang tiếp theo (null = hết)
+  const [commentsNextUrl, setCommentsNextUrl] = useState(null);
+  const [isLoadingMoreComments, setIsLoadingMoreComments] = useState(false);
   const [isSubmittingComment, setIsSubmittingComment] = useState(false);
   
   const [displayCommentCount, setDisplayCommentCount] = useState(initialCommentCount || 0);
@@ -78,23 +88,41 @@ const NewsCard = ({
     setIsCommentsLoading(true);
     try {
       const response = await axiosInstance.get(`/news/summaries/${id}/comments/`);
-      const fetchedComments = response.data.map(comment => ({
-        id: comment.id,
-        content: comment.content,
-        created_at: comment.created_at,
-        user: comment.user
-      }));
-      setComments(fetchedComments.sort((a, b) => new Date(b.created_at) - new Date(a.created_at)));
-      setDisplayCommentCount(fetchedComments.length);
+      const fetchedComments = response.data.results.map(mapComment);
+      setComments(fetchedComments);
+      setCommentsNextUrl(response.data.next);
+      if (!response.data.next) {
+        setDisplayCommentCount(fetchedComments.length);
+      }
     } catch (error) {
       console.error("Error fetching comments:", error);
       messageApi.error("Không thể tải bình luận. Vui lòng thử lại.");
       setComments([]);
+      setCommentsNextUrl(null);
     } finally {
       setIsCommentsLoading(false);
     }
   }, [id, messageApi]);
 
+  const loadMoreComments = useCallback(async () => {
+    if (!commentsNextUrl) return;
+    setIsLoadingMoreComments(true);
+    try {
+      const response = await axiosInstance.get(commentsNextUrl);
+      const fetchedComments = response.data.results.map(mapComment);
+      setComments(prev => [...prev, ...fetchedComments]);
+      setCommentsNextUrl(response.data.next);
+      if (!response.data.next) {
+        setDisplayCommentCount(comments.length + fetchedComments.length);
+      }
+    } catch (error) {
+      console.error("Error loading more comments:", error);
+      messageApi.error("Không thể tải thêm bình luận. Vui lòng thử lại.");
+    } finally {
+      setIsLoadingMoreComments(false);
+    }
+  }, [commentsNextUrl, comments.length, messageApi]);
+
   const showCommentDrawer = () => {
     fetchComments();
     setIsCommentDrawerVisible(true);
@@ -118,6 +146,8 @@ const NewsCard = ({
       const response = await axiosInstance.post(`/news/summaries/${id}/comments/`, payload);
       
       if (response.status === 201 && response.data) {
+        // Còn trang chưa tải thì fetchComments không biết tổng số, tự tăng trước
+        setDisplayCommentCount(count => count + 1);
         fetchComments();
         setNewComment('');
         messageApi.success("Bình luận đã được gửi!");
@@ -427,6 +457,10 @@ const NewsCard = ({
             isSubmitting={isSubmittingComment}
             articleIdForComment={articleId}
             fetchComments={fetchComments}
+            totalCount={displayCommentCount}
+            hasMore={Boolean(commentsNextUrl)}
+            onLoadMore={loadMoreComments}
+            isLoadingMore={isLoadingMoreComments}
           />
         )}
       </Drawer>
@@ -5,7 +5,7 @@ import NewsCard from "./NewsCard";
 import { useSelector, useDispatch } from 'react-redux';
 import { createSelector } from '@reduxjs/toolkit';
 import { fetchNews, submitFeedback } from '../store/slices/newsSlice';
-import { addBookmark, removeBookmark, fetchBookmarks } from '../store/slices/userSlice';
+import { addBookmark, removeBookmark, fetchBookmarkedIds } from '../store/slices/userSlice';
 import { useAuth } from '../context/AuthContext.jsx';
 import axiosInstance from '../services/axiosInstance';
 
@@ -56,15 +56,15 @@ const selectHasMore = createSelector(
   }
 );
 
-const selectBookmarks = createSelector(
-  [(state) => state.user?.bookmarks?.items],
+const selectBookmarkedIds = createSelector(
+  [(state) => state.user?.bookmarkedIds?.items],
   (items) => {
     return Array.isArray(items) ? items : [];
   }
 );
 
-const selectBookmarksStatus = createSelector(
-  [(state) => state.user?.bookmarks?.status],
+const selectBookmarkedIdsStatus = createSelector(
+  [(state) => state.user?.bookmarkedIds?.status],
   (status) => {
     return typeof status === 'string' ? status : 'idle';
   }
@@ -119,13 +119,10 @@ const NewsContent = ({ fetchMode = 'recommendations', searchQuery = null }) => {
   const newsError = useSelector(state => selectNewsError(state, requestKey));
   const currentPage = useSelector(state => selectCurrentPage(state, requestKey));
   const hasMore = useSelector(state => selectHasMore(state, requestKey));
-  const bookmarks = useSelector(selectBookmarks);
-  const bookmarksStatus = useSelector(selectBookmarksStatus);
+  const bookmarkedIds = useSelector(selectBookmarkedIds);
+  const bookmarkedIdsStatus = useSelector(selectBookmarkedIdsStatus);
 
-  const bookmarkedArticleIds = useMemo(() => {
-    const ids = new Set(bookmarks.map(b => b.article?.id).filter(id => id != null));
-    return ids;
-  }, [bookmarks]);
+  const bookmarkedArticleIds = useMemo(() => new Set(bookmarkedIds), [bookmarkedIds]);
 
   const isInitialLoading = newsStatus === 'loading' && newsItems.length === 0;
 
@@ -134,10 +131,10 @@ const NewsContent = ({ fetchMode = 'recommendations', searchQuery = null }) => {
   }, [newsStatus]);
 
   useEffect(() => {
-    if (isAuthenticated && bookmarksStatus === 'idle') {
-      dispatch(fetchBookmarks());
+    if (isAuthenticated && bookmarkedIdsStatus === 'idle') {
+      dispatch(fetchBookmarkedIds());
     }
-  }, [dispatch, isAuthenticated, bookmarksStatus]);
+  }, [dispatch, isAuthenticated, bookmarkedIdsStatus]);
 
   useEffect(() => {
     if (newsStatus === 'idle') {
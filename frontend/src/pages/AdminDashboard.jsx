@@ -35,6 +35,7 @@ import {
 import logo from '../assets/images/logo.png';
 import ChangePasswordModal from '../components/ChangePasswordModal';
 import NewsCard from '../components/NewsCard';
+import AdminFilterDropdown from '../components/AdminFilterDropdown';
 
 const { Header, Sider, Content } = Layout;
 const { Title, Text } = Typography;
@@ -452,13 +453,25 @@ const AdminDashboard = () => {
     }));
   };
 
+  // Filter cột tìm trên server thay vì chỉ chọn trong top-K giá trị
+  const searchableFilter = (resource, field, topValues) => ({
+    filterDropdown: (props) => (
+      <AdminFilterDropdown
+        {...props}
+        resource={resource}
+        field={field}
+        topValues={topValues}
+      />
+    ),
+  });
+
   const userColumns = [
     {
       title: 'Username',
       dataIndex: 'username',
       key: 'username',
       sorter: true,
-      filters: [],
+      ...searchableFilter('users', 'username', allFilterValues.users.usernames),
       onFilter: (value, record) => record.username === value,
     },
     {
@@ -466,7 +479,7 @@ const AdminDashboard = () => {
       dataIndex: 'email',
       key: 'email',
       sorter: true,
-      filters: [],
+      ...searchableFilter('users', 'email', allFilterValues.users.emails),
       onFilter: (value, record) => record.email === value,
     },
     {
@@ -522,7 +535,7 @@ const AdminDashboard = () => {
       dataIndex: 'title',
       key: 'title',
       sorter: (a, b) => a.title.localeCompare(b.title),
-      filters: [],
+      ...searchableFilter('articles', 'title', allFilterValues.articles.titles),
       onFilter: (value, record) => record.title === value,
       render: (text, record) => (
         <a 
@@ -543,7 +556,7 @@ const AdminDashboard = () => {
       dataIndex: 'source_name',
       key: 'source_name',
       sorter: true,
-      filters: [],
+      ...searchableFilter('articles', 'source_name', allFilterValues.articles.sources),
       onFilter: (value, record) => record.source_name === value,
     },
     {
@@ -593,7 +606,7 @@ const AdminDashboard = () => {
       dataIndex: 'article_title',
       key: 'article_title',
       sorter: (a, b) => a.article_title.localeCompare(b.article_title),
-      filters: [],
+      ...searchableFilter('summaries', 'article_title', allFilterValues.summaries.articleTitles),
       onFilter: (value, record) => record.article_title === value,
       render: (text, record) => (
         <a onClick={() => handleSummaryClick(record)}>{text}</a>
@@ -661,7 +674,7 @@ const AdminDashboard = () => {
       dataIndex: 'username',
       key: 'username',
       sorter: (a, b) => a.username.localeCompare(b.username),
-      filters: [],
+      ...searchableFilter('comments', 'username', allFilterValues.comments.usernames),
       onFilter: (value, record) => record.username === value,
     },
     {
@@ -673,7 +686,7 @@ const AdminDashboard = () => {
           <Text ellipsis={{ tooltip: text }}>{text}</Text>
         </div>
       ),
-      filters: [],
+      ...searchableFilter('comments', 'article_title', allFilterValues.comments.articleTitles),
       onFilter: (value, record) => record.article_title === value,
     },
     {
@@ -797,18 +810,6 @@ const AdminDashboard = () => {
         }
       });
 
-      // Cập nhật filters cho các cột
-      userColumns[0].filters = usersRes.data.usernames.map(username => ({ text: username, value: username }));
-      userColumns[1].filters = usersRes.data.emails.map(email => ({ text: email, value: email }));
-      
-      articleColumns[0].filters = articlesRes.data.titles.map(title => ({ text: title, value: title }));
-      articleColumns[1].filters = articlesRes.data.sources.map(source => ({ text: source, value: source }));
-      
-      summaryColumns[0].filters = summariesRes.data.article_titles.map(title => ({ text: title, value: title }));
-      
-      commentColumns[1].filters = commentsRes.data.usernames.map(username => ({ text: username, value: username }));
-      commentColumns[2].filters = commentsRes.data.article_titles.map(title => ({ text: title, value: title }));
-
     } catch (error) {
       console.error('Error fetching filter values:', error);
       message.error('Lỗi khi tải dữ liệu filter');
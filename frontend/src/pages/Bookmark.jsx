@@ -2,7 +2,7 @@ import React, { useEffect, useState, useCallback, useMemo } from 'react';
 import { List, Spin, Typography, Alert, Row, Col, Empty, App, Input, Button, Modal, Space, Select, DatePicker, Card } from 'antd';
 import { DeleteOutlined, ArrowLeftOutlined } from '@ant-design/icons';
 import { useSelector, useDispatch } from 'react-redux';
-import { fetchBookmarks, removeBookmark } from '../store/slices/userSlice';
+import { fetchBookmarks, fetchMoreBookmarks, removeBookmark } from '../store/slices/userSlice';
 import NewsCard from '../components/NewsCard';
 import { useAuth } from '../context/AuthContext.jsx';
 import axiosInstance from '../services/axiosInstance';
@@ -28,6 +28,8 @@ function Bookmark() {
 
   const { 
     items: bookmarks, 
+    next: bookmarksNext,
+    isLoadingMore: isLoadingMoreBookmarks,
     status: bookmarksStatus, 
     error: bookmarksError 
   } = useSelector((state) => state.user.bookmarks);
@@ -171,6 +173,15 @@ function Bookmark() {
       return items;
   }, [bookmarks, searchTerm, filterCategory, filterDateRange, downvotedArticles, pendingDownvotes]);
   
+  const handleLoadMore = () => {
+    dispatch(fetchMoreBookmarks())
+      .unwrap()
+      .catch((error) => {
+        console.error('Error fetching more bookmarks:', error);
+        message.error('Không thể tải thêm bookmark.');
+      });
+  };
+
   const handleTitleClick = (article) => {
     setSelectedArticle(article);
     fetchSummaryForArticle(article.id);
@@ -342,7 +353,7 @@ function Bookmark() {
                 }}
             />
           )}
-          {!isLoading && !displayError && filteredBookmarks.length === 0 && (
+          {!isLoading && !displayError && filteredBookmarks.length === 0 && !bookmarksNext && (
             searchTerm || filterCategory || filterDateRange[0] ? ( 
                 <Empty description={<Text>Không tìm thấy bookmark nào phù hợp.</Text>} />
             ) : (
@@ -379,6 +390,14 @@ function Bookmark() {
               }
             />
           )}
+          {!isLoading && !displayError && bookmarksNext && (
+            // Tìm kiếm/lọc chỉ áp dụng trên các trang đã tải
+            <div style={{ textAlign: 'center', marginTop: '16px' }}>
+              <Button onClick={handleLoadMore} loading={isLoadingMoreBookmarks}>
+                Tải thêm bài viết đã lưu
+              </Button>
+            </div>
+          )}
         </Spin>
       </Card>
     </div>
@@ -85,8 +85,10 @@ export const fetchBookmarks = createAsyncThunk(
   'user/fetchBookmarks',
   async (_, { rejectWithValue }) => {
     try {
+      // API phân trang theo con trỏ: chỉ tải trang đầu, các trang sau tải
+      // khi cần qua fetchMoreBookmarks
       const response = await axiosInstance.get('/user/bookmarks/');
-      return response.data.items || []; 
+      return { items: response.data.items || [], next: response.data.next || null };
     } catch (error) {
       console.error("Error fetching bookmarks:", error.response || error);
       return rejectWithValue(error.response?.data || 'Failed to fetch bookmarks');
@@ -94,6 +96,36 @@ export const fetchBookmarks = createAsyncThunk(
   }
 );
 
+export const fetchMoreBookmarks = createAsyncThunk(
+  'user/fetchMoreBookmarks',
+  async (_, { getState, rejectWithValue }) => {
+    const next = getState().user.bookmarks.next;
+    if (!next) return { items: [], next: null };
+    try {
+      const response = await axiosInstance.get(next);
+      return { items: response.data.items || [], next: response.data.next || null };
+    } catch (error) {
+      console.error("Error fetching more bookmarks:", error.response || error);
+      return rejectWithValue(error.response?.data || 'Failed to fetch bookmarks');
+    }
+  }
+);
+
+// Id các bài đã lưu (một request nhẹ) cho trạng thái "đã lưu" ở danh sách tin,
+// không phụ thuộc vào số trang bookmark đã tải
+export const fetchBookmarkedIds = createAsyncThunk(
+  'user/fetchBookmarkedIds',
+  async (_, { rejectWithValue }) => {
+    try {
+      const response = await axiosInstance.get('/user/bookmarks/ids/');
+      return response.data.article_ids || [];
+    } catch (error) {
+      console.error("Error fetching bookmarked ids:", error.response || error);
+      return rejectWithValue(error.response?.data || 'Failed to fetch bookmarked ids');
+    }
+  }
+);
+
 export const removeBookmark = createAsyncThunk(
   'user/removeBookmark',
   async (articleId, { dispatch, rejectWithValue }) => {
@@ -136,9 +168,16 @@ const initialState = {
   },
   bookmarks: {
     items: [], 
+    next: null, // URL trang tiếp theo (cursor), null khi đã hết
+    isLoadingMore: false,
     status: 'idle', // idle | loading | succeeded | failed
     error: null,
   },
+  bookmarkedIds: {
+    items: [],
+    status: 'idle',
+    error: null,
+  },
   downvotes: {
     items: [],
     pending: [],
@@ -259,7 +298,8 @@ const userSlice = createSlice({
       })
       .addCase(fetchBookmarks.fulfilled, (state, action) => {
         state.bookmarks.status = 'succeeded';
-        state.bookmarks.items = action.payload;
+        state.bookmarks.items = action.payload.items;
+        state.bookmarks.next = action.payload.next;
         state.bookmarks.error = null;
         
         state.downvotes.items = [];
@@ -269,6 +309,38 @@ const userSlice = createSlice({
         state.bookmarks.status = 'failed';
         state.bookmarks.error = action.payload || action.error.message;
       })
+      .addCase(fetchMoreBookmarks.pending, (state) => {
+        state.bookmarks.isLoadingMore = true;
+      })
+      .addCase(fetchMoreBookmarks.fulfilled, (state, action) => {
+        state.bookmarks.isLoadingMore = false;
+        // Bỏ bài đã có (vd. vừa lưu thêm khi đang xem danh sách)
+        const loadedIds = new Set(state.bookmarks.items.map(item => item.article?.id));
+        state.bookmarks.items.push(
+          ...action.payload.items.filter(item => !loadedIds.has(item.article?.id)));
+        state.bookmarks.next = action.payload.next;
+      })
+      .addCase(fetchMoreBookmarks.rejected, (state, action) => {
+        state.bookmarks.isLoadingMore = false;
+        state.bookmarks.error = action.payload || action.error.message;
+      })
+      .addCase(fetchBookmarkedIds.pending, (state) => {
+        state.bookmarkedIds.status = 'loading';
+      })
+      .addCase(fetchBookmarkedIds.fulfilled, (state, action) => {
+        state.bookmarkedIds.status = 'succeeded';
+        state.bookmarkedIds.items = action.payload;
+        state.bookmarkedIds.error = null;
+      })
+      .addCase(fetchBookmarkedIds.rejected, (state, action) => {
+        state.bookmarkedIds.status = 'failed';
+        state.bookmarkedIds.error = action.payload || action.error.message;
+      })
+       .addCase(addBookmark.fulfilled, (state, action) => {
+           if (!state.bookmarkedIds.items.includes(action.payload)) {
+             state.bookmarkedIds.items.push(action.payload);
+           }
+       })
 
        .addCase(addBookmark.rejected, (state, action) => {
            console.error("Add bookmark rejected:", action.payload);
@@ -279,6 +351,7 @@ const userSlice = createSlice({
        })
        .addCase(removeBookmark.fulfilled, (state, action) => {
          state.bookmarks.items = state.bookmarks.items.filter(item => item.article.id !== action.payload);
+         state.bookmarkedIds.items = state.bookmarkedIds.items.filter(id => id !== action.payload);
          state.bookmarks.status = 'succeeded';
          state.bookmarks.error = null;
        })